@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Signatures and verifications per second of the :mod:`tuscbase.ecdsa`
+backends (and of the implementation of graphenebase for comparison).
+
+    python benchmarks/backends.py [messages]
+"""
+import sys
+import time
+
+from graphenebase import ecdsa as graphene_ecdsa
+from tuscbase import ecdsa
+from tuscbase.account import PrivateKey
+
+wif = str(PrivateKey())
+
+
+def rate(function, messages):
+    start = time.time()
+    results = [function(message) for message in messages]
+    return len(messages) / (time.time() - start), results
+
+
+def report(name, sign, verify, messages):
+    signing, signatures = rate(sign, messages)
+    verifying, _ = rate(lambda args: verify(*args), list(zip(messages, signatures)))
+    print(
+        "%-12s %10.1f signatures/s %10.1f verifications/s"
+        % (name, signing, verifying)
+    )
+
+
+def main(count=100):
+    messages = [b"message %d" % i for i in range(count)]
+    for name in ecdsa.available_backends():
+        ecdsa.set_backend(name)
+        report(
+            name,
+            lambda message: ecdsa.sign_message(message, wif),
+            ecdsa.verify_message,
+            messages,
+        )
+    report(
+        "graphenebase",
+        lambda message: graphene_ecdsa.sign_message(message, wif),
+        graphene_ecdsa.verify_message,
+        messages,
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Memos per second of :class:`tusc.memo.MemoDecryptionPool` by number of
+processes, compared to :func:`tusc.memo.Memo.decrypt_many`.
+
+Every memo is sent by a different account, as for the deposits of an
+exchange, so a shared secret has to be derived for each of them.
+
+    python benchmarks/memos.py [memos]
+"""
+import os
+import sys
+import time
+
+from tuscbase.account import PrivateKey
+from tuscbase.memo import encode_memo_with_shared_secret, get_shared_secret
+from tusc import TUSC
+from tusc.memo import Memo, MemoDecryptionPool
+
+receiver = PrivateKey()
+
+
+class Node:
+    chain_params = {"chain_id": "00" * 32, "prefix": "TUSC"}
+
+
+def operations(count):
+    ops = []
+    for i in range(count):
+        sender = PrivateKey()
+        nonce = str(i)
+        shared_secret = get_shared_secret(sender, receiver.pubkey)
+        memo = {
+            "from": str(sender.pubkey),
+            "to": str(receiver.pubkey),
+            "nonce": nonce,
+            "message": encode_memo_with_shared_secret(
+                shared_secret, nonce, "deposit %d" % i
+            ),
+        }
+        ops.append(["transfer", {"memo": memo}])
+    return ops
+
+
+def main(count=500):
+    print("cores: %d, memos: %d" % (os.cpu_count(), count))
+    tusc = TUSC(offline=True, keys=[str(receiver)])
+    tusc.rpc = Node()
+    memo = Memo(blockchain_instance=tusc)
+    ops = operations(count)
+
+    Memo.shared_secrets.clear()
+    start = time.time()
+    memo.decrypt_many([op[1]["memo"] for op in ops])
+    elapsed = time.time() - start
+    print("decrypt_many   %8.1f memos/s" % (count / elapsed))
+
+    for processes in range(1, (os.cpu_count() or 1) + 1):
+        Memo.shared_secrets.clear()
+        with MemoDecryptionPool(processes=processes) as pool:
+            start = time.time()
+            list(pool.decrypt(memo, ops))
+            elapsed = time.time() - start
+        print("processes: %2d %8.1f memos/s" % (processes, count / elapsed))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Operations per second serialized by the operation classes and by
+:mod:`tuscbase.serializer`, and decoded by the latter.
+
+    python benchmarks/serializer.py [operations]
+"""
+import sys
+import time
+
+from tuscbase.objects import Operation
+from tuscbase.serializer import iter_transactions, serialize_operation
+
+pub = "TUSC6MRyAjQq8ud7hVNYcfnVPJqcVpscN5So8BhtHuGYqET5GDW5CV"
+
+
+def transfers(count):
+    return [
+        [
+            0,
+            {
+                "fee": {"amount": 0, "asset_id": "1.3.0"},
+                "from": "1.2.100",
+                "to": "1.2.%d" % (200 + i),
+                "amount": {"amount": i + 1, "asset_id": "1.3.0"},
+                "memo": {"from": pub, "to": pub, "nonce": i, "message": "00" * 32},
+            },
+        ]
+        for i in range(count)
+    ]
+
+
+def main(count=10000):
+    for name, serialize in [
+        ("classes", lambda op: bytes(Operation(op))),
+        ("compiled", serialize_operation),
+    ]:
+        ops = transfers(count)
+        start = time.time()
+        for op in ops:
+            serialize(op)
+        print("%-10s %10.1f operations/s" % (name, count / (time.time() - start)))
+
+    # One transaction per operation, without signatures
+    data = b"".join(
+        [
+            b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01"
+            + serialize_operation(op)
+            + b"\x00\x00"
+            for op in transfers(count)
+        ]
+    )
+    start = time.time()
+    for _ in iter_transactions(memoryview(data)):
+        pass
+    print("%-10s %10.1f operations/s" % ("decoded", count / (time.time() - start)))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Signatures per second of :class:`tusc.signing.SigningPool` by number of
+processes.
+
+    python benchmarks/signing.py [transactions]
+"""
+import os
+import sys
+import time
+
+from tuscbase import operations
+from tuscbase.account import PrivateKey
+from tuscbase.signedtransactions import Signed_Transaction
+from tusc.signing import SigningPool
+
+wif = str(PrivateKey())
+
+
+def transactions(count):
+    return [
+        Signed_Transaction(
+            ref_block_num=1,
+            ref_block_prefix=2,
+            expiration="2030-01-01T00:00:00",
+            operations=[
+                operations.Transfer(
+                    fee={"amount": 0, "asset_id": "1.3.0"},
+                    amount={"amount": i + 1, "asset_id": "1.3.0"},
+                    prefix="TUSC",
+                    **{"from": "1.2.0", "to": "1.2.1"}
+                )
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def main(count=200):
+    print("cores: %d, transactions: %d" % (os.cpu_count(), count))
+    for processes in range(1, (os.cpu_count() or 1) + 1):
+        txs = transactions(count)
+        with SigningPool(processes=processes) as pool:
+            start = time.time()
+            pool.sign(txs, [wif], chain="TUSC")
+            elapsed = time.time() - start
+        print("processes: %2d %8.1f signatures/s" % (processes, count / elapsed))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import unittest
+
+from tusc import TUSC
+from tusc.aio import TUSC as AsyncTUSC
+from tusc.aio.asset import Asset as AsyncAsset
+from tusc.asset import Asset
+from tusc.exceptions import PagingNotSupported
+
+
+def raw_asset(id, symbol):
+    asset = {
+        "id": id,
+        "symbol": symbol,
+        "precision": 4,
+        "issuer": "1.2.0",
+        "options": {"flags": 0, "issuer_permissions": 0, "description": ""},
+        "dynamic_asset_data_id": "2.3.{}".format(id.split(".")[2]),
+    }
+    if symbol == "ORDERUSD":
+        asset["bitasset_data_id"] = "2.4.0"
+    return asset
+
+
+# Live orders far apart in the object space, most ids in between have
+# been removed when the orders closed
+call_ids = [7, 2500, 2501, 9000] + list(range(20000, 20250))
+
+
+def call_order(i):
+    return {"id": "1.8.%d" % i, "borrower": "1.2.100", "collateral": i, "debt": 1}
+
+
+def settle_order(i):
+    return {
+        "id": "1.4.%d" % i,
+        "owner": "1.2.100",
+        "balance": {"amount": i, "asset_id": "1.3.1"},
+        "settlement_date": "2020-01-01T00:00:%02d" % (i % 60),
+    }
+
+
+class Node:
+    assets = {"1.3.1": raw_asset("1.3.1", "ORDERUSD")}
+    assets["ORDERUSD"] = assets["1.3.1"]
+    calls = [call_order(i) for i in call_ids]
+    settles = [settle_order(i) for i in (3, 1500, 4000)]
+
+    def __init__(self):
+        self.requests = []
+
+    def get_asset(self, id):
+        return self.assets[id]
+
+    def get_object(self, id):
+        return {"id": "2.4.0", "options": {"short_backing_asset": "1.3.0"}}
+
+    def get_objects(self, ids):
+        raise AssertionError("the object space must not be walked")
+
+    def _page(self, orders, limit, start):
+        self.requests.append(start)
+        ids = [order["id"] for order in orders]
+        first = ids.index(start) if start else 0
+        return orders[first : first + limit]
+
+    def get_call_orders(self, asset, limit, start=None):
+        return self._page(self.calls, limit, start)
+
+    def get_settle_orders(self, asset, limit, start=None):
+        return self._page(self.settles, limit, start)
+
+
+class LegacyNode(Node):
+    """Ignores the start id and answers with the first page again."""
+
+    def _page(self, orders, limit, start):
+        return Node._page(self, orders, limit, None)
+
+
+class AsyncLegacyNode(LegacyNode):
+    async def get_asset(self, id):
+        return Node.get_asset(self, id)
+
+    async def get_settle_orders(self, asset, limit, start=None):
+        return LegacyNode.get_settle_orders(self, asset, limit, start)
+
+
+class AsyncNode(Node):
+    async def get_asset(self, id):
+        return Node.get_asset(self, id)
+
+    async def get_object(self, id):
+        return Node.get_object(self, id)
+
+    async def get_call_orders(self, asset, limit, start=None):
+        return Node.get_call_orders(self, asset, limit, start)
+
+    async def get_settle_orders(self, asset, limit, start=None):
+        return Node.get_settle_orders(self, asset, limit, start)
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        self.tusc = TUSC(offline=True)
+        self.tusc.rpc = Node()
+
+    def test_call_orders(self):
+        asset = Asset("ORDERUSD", blockchain_instance=self.tusc)
+        calls = list(asset.iter_call_orders(page_size=100, raw=True))
+        self.assertEqual([call["id"] for call in calls], [c["id"] for c in Node.calls])
+        self.assertEqual(
+            self.tusc.rpc.requests, [None, "1.8.20095", "1.8.20194"]
+        )
+
+        self.tusc.rpc.requests = []
+        calls = list(asset.iter_call_orders(page_size=2, raw=True))
+        self.assertEqual(len(calls), len(call_ids))
+        self.assertEqual(self.tusc.rpc.requests[:3], [None, "1.8.2500", "1.8.2501"])
+
+    def test_start_ignored(self):
+        self.tusc.rpc = LegacyNode()
+        asset = Asset("ORDERUSD", blockchain_instance=self.tusc)
+        with self.assertRaises(PagingNotSupported):
+            list(asset.iter_call_orders(page_size=100, raw=True))
+        self.assertEqual(self.tusc.rpc.requests, [None, None])
+        # A single page does not need the start id
+        calls = list(asset.iter_call_orders(page_size=1000, raw=True))
+        self.assertEqual(len(calls), len(call_ids))
+
+    def test_settle_orders(self):
+        asset = Asset("ORDERUSD", blockchain_instance=self.tusc)
+        settles = list(asset.iter_settle_orders(page_size=2, raw=True))
+        self.assertEqual([s["id"] for s in settles], ["1.4.3", "1.4.1500", "1.4.4000"])
+        self.assertEqual(self.tusc.rpc.requests, [None, "1.4.1500", "1.4.4000"])
+        settles = list(asset.iter_settle_orders(page_size=2))
+        self.assertEqual(settles[2]["date"].second, 40)
+        self.assertEqual(float(settles[2]["amount"]), 0.4)
+
+    def test_orders_async(self):
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = AsyncNode()
+            asset = await AsyncAsset("ORDERUSD", blockchain_instance=tusc)
+            calls = [c async for c in asset.iter_call_orders(page_size=3, raw=True)]
+            settles = [s async for s in asset.iter_settle_orders(raw=True)]
+            return calls, settles
+
+        calls, settles = asyncio.run(run())
+        self.assertEqual(len(calls), len(call_ids))
+        self.assertEqual(len(settles), 3)
+
+    def test_settle_start_ignored(self):
+        self.tusc.rpc = LegacyNode()
+        asset = Asset("ORDERUSD", blockchain_instance=self.tusc)
+        with self.assertRaises(PagingNotSupported):
+            list(asset.iter_settle_orders(page_size=2, raw=True))
+
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = AsyncLegacyNode()
+            asset = await AsyncAsset("ORDERUSD", blockchain_instance=tusc)
+            with self.assertRaises(PagingNotSupported):
+                [s async for s in asset.iter_settle_orders(page_size=2, raw=True)]
+
+        asyncio.run(run())
+
+    def test_close_async(self):
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = AsyncNode()
+            asset = await AsyncAsset("ORDERUSD", blockchain_instance=tusc)
+            pages = asset._pages("get_call_orders", 2)
+            calls = asset._flatten(pages)
+            await calls.__anext__()
+            await calls.aclose()
+            # Closing early closes the generator of pages too
+            self.assertIsNone(pages.ag_frame)
+
+        asyncio.run(run())
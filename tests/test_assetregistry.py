@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+from tusc import TUSC
+from tusc.aio import TUSC as AsyncTUSC
+from tusc.aio.asset import Asset as AsyncAsset
+from tusc.asset import Asset
+from tusc.assetregistry import AssetRegistry, AssetEntry
+
+
+def raw_asset(id, symbol, precision=5, flags=0):
+    return {
+        "id": id,
+        "symbol": symbol,
+        "precision": precision,
+        "issuer": "1.2.0",
+        "options": {"flags": flags, "issuer_permissions": 0, "description": ""},
+        "dynamic_asset_data_id": "2.3.{}".format(id.split(".")[2]),
+    }
+
+
+class Node:
+    chain_params = {"chain_id": "f" * 64, "prefix": "TUSC"}
+
+    def __init__(self, count):
+        self.head_block_number = 1000
+        self.assets = {
+            "1.3.%d" % i: raw_asset("1.3.%d" % i, "REG%03d" % i) for i in range(count)
+        }
+        self.requests = []
+
+    def get_dynamic_global_properties(self):
+        return {"head_block_number": self.head_block_number}
+
+    def list_assets(self, lower_bound, limit):
+        self.requests.append(("list_assets", lower_bound))
+        assets = sorted(self.assets.values(), key=lambda a: a["symbol"])
+        return [a for a in assets if a["symbol"] >= lower_bound][:limit]
+
+    def get_objects(self, ids):
+        self.requests.append(("get_objects", ids[0], len(ids)))
+        return [self.assets.get(i) for i in ids]
+
+    def get_asset(self, identifier):
+        self.requests.append(("get_asset", identifier))
+        return self.assets[identifier]
+
+
+class AsyncNode(Node):
+    async def get_asset(self, identifier):
+        return Node.get_asset(self, identifier)
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        self.tusc = TUSC(offline=True)
+        self.registry = AssetRegistry(blockchain_instance=self.tusc)
+        self.registry.chain_id = "f" * 64
+        self.registry.head_block_number = 1000
+        self.registry.update(
+            [raw_asset("1.3.0", "REGTUSC"), raw_asset("1.3.1", "REGUSD", 4, 128)]
+        )
+
+    def test_lookups(self):
+        self.assertEqual(len(self.registry), 2)
+        self.assertIn("REGUSD", self.registry)
+        self.assertIn("1.3.1", self.registry)
+        self.assertNotIn("1.3.2", self.registry)
+        self.assertEqual(self.registry.id("REGUSD"), "1.3.1")
+        self.assertEqual(self.registry.symbol("1.3.1"), "REGUSD")
+        self.assertEqual(self.registry.precision("REGUSD"), 4)
+        self.assertEqual(self.registry.flags("1.3.1"), 128)
+        self.assertEqual(
+            self.registry.entry("REGUSD"), AssetEntry("1.3.1", "REGUSD", 4, 128)
+        )
+        self.assertIsNone(self.registry.get("FOOBAR"))
+
+    def test_snapshot(self):
+        path = os.path.join(tempfile.mkdtemp(), "assets.json")
+        self.registry.save(path)
+        snapshot = AssetRegistry.read(path)
+        self.assertEqual(snapshot["chain_id"], "f" * 64)
+        self.assertEqual(snapshot["head_block_number"], 1000)
+        # Only the compact entries are stored
+        self.assertEqual(snapshot["assets"][1], ["1.3.1", "REGUSD", 4, 128])
+
+        registry = AssetRegistry(blockchain_instance=self.tusc)
+        registry.update([AssetEntry(*entry) for entry in snapshot["assets"]])
+        self.assertEqual(registry.entry("REGTUSC"), self.registry.entry("REGTUSC"))
+        self.assertIsNone(AssetRegistry.read(path + ".missing"))
+
+    def test_refresh(self):
+        self.tusc.rpc = node = Node(250)
+        registry = AssetRegistry(blockchain_instance=self.tusc)
+        registry.refresh()
+        self.assertEqual(len(registry), 250)
+        self.assertEqual(registry.id("REG249"), "1.3.249")
+        self.assertEqual(registry.checked_block_number, 1000)
+        self.assertEqual(
+            node.requests,
+            [("list_assets", ""), ("list_assets", "REG099"), ("list_assets", "REG198")],
+        )
+
+    def test_sync(self):
+        self.tusc.rpc = node = Node(250)
+        self.registry.update([node.assets["1.3.0"], node.assets["1.3.1"]])
+        self.assertEqual(self.registry.sync(), 248)
+        self.assertEqual(len(self.registry), 250)
+        self.assertEqual(
+            node.requests,
+            [("get_objects", "1.3.2", 100), ("get_objects", "1.3.102", 100)]
+            + [("get_objects", "1.3.202", 100)],
+        )
+        node.assets["1.3.5"]["options"]["flags"] = 128
+        node.requests = []
+        self.assertEqual(self.registry.sync(), 0)
+        self.assertEqual(self.registry.flags("1.3.5"), 0)
+        self.assertEqual(self.registry.sync(changed=True), 1)
+        self.assertEqual(self.registry.flags("1.3.5"), 128)
+
+    def test_load(self):
+        path = os.path.join(tempfile.mkdtemp(), "assets.json")
+        self.tusc.rpc = node = Node(150)
+        registry = AssetRegistry(path=path, blockchain_instance=self.tusc).load()
+        self.assertEqual(len(registry), 150)
+        self.assertEqual(node.requests[0], ("list_assets", ""))
+
+        # A young snapshot only asks for new assets
+        node.assets["1.3.150"] = raw_asset("1.3.150", "NEW")
+        node.assets["1.3.5"]["options"]["flags"] = 128
+        node.head_block_number = 1100
+        node.requests = []
+        registry = AssetRegistry(path=path, blockchain_instance=self.tusc).load()
+        self.assertEqual(node.requests, [("get_objects", "1.3.150", 100)])
+        self.assertEqual(registry.id("NEW"), "1.3.150")
+        self.assertEqual(registry.flags("1.3.5"), 0)
+        self.assertEqual(AssetRegistry.read(path)["head_block_number"], 1100)
+
+        # Flags are fetched again once they are older than max_age
+        node.head_block_number = 1000 + AssetRegistry.max_age + 1
+        node.requests = []
+        registry = AssetRegistry(path=path, blockchain_instance=self.tusc).load()
+        self.assertEqual(
+            node.requests,
+            [("get_objects", "1.3.0", 100), ("get_objects", "1.3.100", 51)]
+            + [("get_objects", "1.3.151", 100)],
+        )
+        self.assertEqual(registry.flags("1.3.5"), 128)
+        self.assertEqual(registry.checked_block_number, node.head_block_number)
+
+        # Snapshots of other chains are not used
+        node.chain_params = {"chain_id": "e" * 64}
+        node.requests = []
+        AssetRegistry(path=path, blockchain_instance=self.tusc).load()
+        self.assertEqual(node.requests[0], ("list_assets", ""))
+
+    def test_asset_from_registry(self):
+        self.tusc.rpc = node = Node(2)
+        self.tusc.asset_registry = self.registry
+        asset = Asset("REGUSD", blockchain_instance=self.tusc)
+        self.assertEqual(asset["id"], "1.3.1")
+        self.assertIsInstance(asset.flags, dict)
+        # The symbol is resolved locally, the asset is fetched by id
+        self.assertEqual(node.requests, [("get_asset", "1.3.1")])
+
+    def test_asset_from_registry_async(self):
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = node = AsyncNode(2)
+            tusc.asset_registry = self.registry
+            asset = await AsyncAsset("REGUSD", blockchain_instance=tusc)
+            return asset, node
+
+        asset, node = asyncio.run(run())
+        self.assertEqual(asset["id"], "1.3.1")
+        self.assertEqual(node.requests, [("get_asset", "1.3.1")])
+
+    def test_concurrent_save(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "assets.json")
+        errors = []
+
+        def save():
+            try:
+                for i in range(20):
+                    self.registry.save(path)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(os.listdir(directory), ["assets.json"])
+        self.assertEqual(len(AssetRegistry.read(path)["assets"]), 2)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import random
+import threading
+import time
+import unittest
+
+from tusc import TUSC
+from tusc.aio import TUSC as AsyncTUSC
+from tusc.aio.blockchain import Blockchain as AsyncBlockchain
+from tusc.blockchain import Blockchain
+from tusc.exceptions import BlockDoesNotExistsException
+
+
+class Node:
+    head = 40
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def enter(self):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def block(self, block_num):
+        if block_num > self.head:
+            return None
+        return {
+            "timestamp": "2020-01-01T00:00:00",
+            "witness": "1.6.%d" % block_num,
+            "transactions": [
+                {"operations": [[0, {"from": "1.2.1", "to": "1.2.2"}], [63, {}]]},
+                {"operations": [[1, {"seller": "1.2.%d" % block_num}]]},
+            ],
+        }
+
+    def get_object(self, id):
+        return {"parameters": {"block_interval": 0}}
+
+    def get_dynamic_global_properties(self):
+        return {"head_block_number": self.head, "last_irreversible_block_num": 35}
+
+    def get_block(self, block_num):
+        self.enter()
+        time.sleep(random.random() / 100)
+        self.leave()
+        return self.block(block_num)
+
+
+class AsyncNode(Node):
+    async def get_object(self, id):
+        return Node.get_object(self, id)
+
+    async def get_dynamic_global_properties(self):
+        return Node.get_dynamic_global_properties(self)
+
+    async def get_block(self, block_num):
+        self.enter()
+        await asyncio.sleep(random.random() / 100)
+        self.leave()
+        return self.block(block_num)
+
+
+class Testcases(unittest.TestCase):
+    def test_fetch_range(self):
+        tusc = TUSC(offline=True)
+        tusc.rpc = Node()
+        chain = Blockchain(blockchain_instance=tusc)
+        blocks = list(chain.fetch_range(3, 30, concurrency=4))
+        self.assertEqual([b["block_num"] for b in blocks], list(range(3, 31)))
+        self.assertEqual(blocks[0]["witness"], "1.6.3")
+        self.assertEqual(tusc.rpc.max_in_flight, 4)
+
+        with self.assertRaises(BlockDoesNotExistsException):
+            list(chain.fetch_range(35, 45, concurrency=4))
+
+        # Stopping early leaves nothing running
+        for block in chain.fetch_range(1, 1000, concurrency=4):
+            break
+        self.assertEqual(tusc.rpc.in_flight, 0)
+
+    def test_fetch_range_async(self):
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = AsyncNode()
+            chain = await AsyncBlockchain(blockchain_instance=tusc)
+            blocks = [b async for b in chain.fetch_range(3, 30, concurrency=4)]
+            return blocks, tusc.rpc.max_in_flight
+
+        blocks, max_in_flight = asyncio.run(run())
+        self.assertEqual([b["block_num"] for b in blocks], list(range(3, 31)))
+        self.assertEqual(max_in_flight, 4)
+
+    def test_stream(self):
+        tusc = TUSC(offline=True)
+        tusc.rpc = Node()
+        chain = Blockchain(blockchain_instance=tusc)
+        ops = list(chain.stream(["transfer", 1], start=5, stop=6))
+        self.assertEqual(
+            [(op["type"], op["block_num"]) for op in ops],
+            [
+                ("transfer", 5),
+                ("limit_order_create", 5),
+                ("transfer", 6),
+                ("limit_order_create", 6),
+            ],
+        )
+        self.assertEqual(ops[0]["to"], "1.2.2")
+        self.assertEqual(ops[3]["seller"], "1.2.6")
+
+        ops = list(chain.stream(["transfer"], start=5, stop=5, fields=["to"]))
+        self.assertEqual(
+            ops,
+            [
+                {
+                    "type": "transfer",
+                    "timestamp": "2020-01-01T00:00:00",
+                    "block_num": 5,
+                    "to": "1.2.2",
+                }
+            ],
+        )
+        self.assertEqual(len(list(chain.stream(start=5, stop=5))), 3)
+        with self.assertRaises(ValueError):
+            list(chain.stream(["transfers"], start=5, stop=5))
+
+    def test_stream_async(self):
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = AsyncNode()
+            chain = await AsyncBlockchain(blockchain_instance=tusc)
+            ops = chain.stream(["liquidity_pool_exchange"], start=5, stop=7)
+            return [op async for op in ops]
+
+        self.assertEqual(
+            [(op["type"], op["block_num"]) for op in asyncio.run(run())],
+            [("liquidity_pool_exchange", n) for n in (5, 6, 7)],
+        )
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import shutil
+import tempfile
+import unittest
+
+from tusc import TUSC
+from tusc.aio import TUSC as AsyncTUSC
+from tusc.aio.blockchain import Blockchain as AsyncBlockchain
+from tusc.block import Block
+from tusc.blockchain import Blockchain
+from tusc.blockstore import BlockStore
+
+
+class Node:
+    chain_params = {"chain_id": "00" * 32, "prefix": "TUSC"}
+
+    def __init__(self):
+        self.requested = []
+
+    def get_object(self, id):
+        return {"parameters": {"block_interval": 0}}
+
+    def get_dynamic_global_properties(self):
+        return {"head_block_number": 30, "last_irreversible_block_num": 20}
+
+    def get_block(self, block_num):
+        self.requested.append(block_num)
+        if block_num > 30:
+            return None
+        return {"timestamp": "2020-01-01T00:00:00", "witness": "1.6.%d" % block_num}
+
+
+class AsyncNode(Node):
+    async def get_object(self, id):
+        return Node.get_object(self, id)
+
+    async def get_dynamic_global_properties(self):
+        return Node.get_dynamic_global_properties(self)
+
+    async def get_block(self, block_num):
+        return Node.get_block(self, block_num)
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_store(self):
+        with BlockStore(self.path) as store:
+            store.segment_size = 10
+            self.assertIsNone(store.get(5))
+            for block_num in (5, 3, 12, 4):
+                self.assertTrue(store.put(block_num, {"n": block_num}))
+            self.assertFalse(store.put(5, {"n": 0}))
+            self.assertEqual(store.get(5), {"n": 5})
+            self.assertIn(12, store)
+            self.assertNotIn(6, store)
+            self.assertNotIn(25, store)
+
+        with BlockStore(self.path) as store:
+            store.segment_size = 10
+            self.assertEqual(
+                [store.get(n) for n in (3, 4, 12)], [{"n": n} for n in (3, 4, 12)]
+            )
+            store.put(6, {"n": 6})
+            self.assertEqual(store.get(6), {"n": 6})
+
+    def test_blocks(self):
+        tusc = TUSC(offline=True)
+        tusc.rpc = Node()
+        tusc.open_block_store(self.path)
+        chain = Blockchain(blockchain_instance=tusc, mode="head")
+
+        blocks = list(chain.blocks(start=15, stop=25))
+        self.assertEqual(tusc.rpc.requested, list(range(15, 26)))
+        self.assertEqual(blocks[0], dict(Node().get_block(15), block_num=15))
+
+        # Irreversible blocks are stored, the others are requested again
+        tusc.rpc.requested = []
+        self.assertEqual(list(chain.blocks(start=15, stop=25)), blocks)
+        self.assertEqual(tusc.rpc.requested, list(range(21, 26)))
+
+        tusc.rpc.requested = []
+        self.assertEqual(Block(18, blockchain_instance=tusc)["witness"], "1.6.18")
+        self.assertEqual(Block(19, blockchain_instance=tusc).time().year, 2020)
+        self.assertEqual(
+            [b["block_num"] for b in chain.fetch_range(10, 20, concurrency=3)],
+            list(range(10, 21)),
+        )
+        self.assertEqual(tusc.rpc.requested, list(range(10, 15)))
+        tusc.block_store.close()
+
+    def test_blocks_async(self):
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = AsyncNode()
+            tusc.open_block_store(self.path)
+            chain = await AsyncBlockchain(blockchain_instance=tusc, mode="head")
+            for _ in range(2):
+                blocks = [b async for b in chain.fetch_range(18, 22)]
+            tusc.block_store.close()
+            return tusc.rpc.requested, blocks
+
+        requested, blocks = asyncio.run(run())
+        self.assertEqual(len(blocks), 5)
+        self.assertEqual(requested, [18, 19, 20, 21, 22, 21, 22])
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import unittest
+
+from tusc import TUSC
+from tusc.aio import TUSC as AsyncTUSC
+from tusc.confirmations import ConfirmationTracker, transaction_id
+from tusc.exceptions import TransactionExpired
+from tusc.utils import formatTimeFromNow
+from tuscbase.objects import Operation
+from tuscbase.signedtransactions import Signed_Transaction
+
+
+def block(num, ids):
+    return {
+        "timestamp": "2020-01-01T00:00:%02d" % (3 * num),
+        "transaction_ids": ids,
+        "transactions": [
+            {"operation_results": [[1, "1.7.%d" % i]]} for i in range(len(ids))
+        ],
+    }
+
+
+class Node:
+    chain_params = {"chain_id": "00" * 32, "prefix": "TUSC"}
+    blocks = {
+        3: block(3, []),
+        4: block(4, ["aa"]),
+        5: block(5, ["bb", "cc"]),
+    }
+
+    def get_object(self, id):
+        return {"parameters": {"block_interval": 0}}
+
+    def get_dynamic_global_properties(self):
+        return {"head_block_number": 5, "last_irreversible_block_num": 5}
+
+    def get_block(self, block_num):
+        return dict(self.blocks[block_num])
+
+
+class LateNode(Node):
+    """Transaction ``ee`` is in a block before the scanned ones."""
+
+    blocks = {n: block(n, ["ee"] if n == 4 else []) for n in range(1, 13)}
+
+    def __init__(self):
+        self.requests = []
+
+    def get_dynamic_global_properties(self):
+        return {"head_block_number": 10, "last_irreversible_block_num": 10}
+
+    def get_block(self, block_num):
+        self.requests.append(block_num)
+        return Node.get_block(self, block_num)
+
+
+class AsyncNode(Node):
+    async def get_object(self, id):
+        return Node.get_object(self, id)
+
+    async def get_dynamic_global_properties(self):
+        return Node.get_dynamic_global_properties(self)
+
+    async def get_block(self, block_num):
+        await asyncio.sleep(0)
+        return Node.get_block(self, block_num)
+
+
+class Testcases(unittest.TestCase):
+    def test_transaction_id(self):
+        tx = Signed_Transaction(
+            ref_block_num=34294,
+            ref_block_prefix=3707022213,
+            expiration="2016-04-06T08:29:27",
+            operations=[
+                Operation(
+                    [
+                        "transfer",
+                        {
+                            "fee": {"amount": 0, "asset_id": "1.3.0"},
+                            "from": "1.2.3",
+                            "to": "1.2.4",
+                            "amount": {"amount": 5, "asset_id": "1.3.1"},
+                        },
+                    ]
+                )
+            ],
+        )
+        self.assertEqual(transaction_id(tx.json()), tx.id)
+
+    def test_track(self):
+        tusc = TUSC(offline=True)
+        tusc.rpc = Node()
+        tracker = tusc.confirmations("head")
+        self.assertIs(tracker, tusc.confirmations("head"))
+        self.assertIsInstance(tracker, ConfirmationTracker)
+
+        futures = [tracker.track(tx_id) for tx_id in ["cc", "aa", "cc"]]
+        results = [future.result(10) for future in futures]
+        self.assertEqual(
+            [(r["block_num"], r["trx_num"]) for r in results], [(5, 1), (4, 0), (5, 1)]
+        )
+        self.assertEqual(results[1]["operation_results"], [[1, "1.7.0"]])
+
+        # Seen in the recent blocks already
+        self.assertEqual(tracker.wait({"id": "bb"}, 10)["trx_num"], 0)
+
+        with self.assertRaises(TransactionExpired):
+            tracker.wait({"id": "dd", "expiration": "2020-01-01T00:00:13"}, 10)
+        self.assertEqual(len(tracker), 0)
+
+    def test_track_late(self):
+        tusc = TUSC(offline=True)
+        tusc.rpc = node = LateNode()
+        tracker = tusc.confirmations("head")
+        expiration = "2020-01-01T00:00:28"
+        found, missing = [
+            tracker.track({"id": i, "expiration": expiration, "ref_block_num": 3})
+            for i in ["ee", "ff"]
+        ]
+        self.assertEqual(found.result(10)["block_num"], 4)
+        with self.assertRaises(TransactionExpired):
+            missing.result(10)
+        # Scanned from block 8, blocks 7 down to 4 are searched on expiration
+        self.assertEqual(node.requests, [8, 9, 10, 7, 6, 5, 4, 7, 6, 5, 4])
+
+    def test_track_broadcast(self):
+        tusc = TUSC(offline=True, expiration=10)
+        tusc.rpc = node = LateNode()
+        tracker = tusc.confirmations("head")
+        tracker.clock_skew = 0
+        tx = {"id": "ee", "expiration": "2020-01-01T00:00:28", "ref_block_num": 3}
+        # Broadcast at :18 (block 6), so block 4 is not searched
+        with self.assertRaises(TransactionExpired):
+            tracker.wait(tx, 10)
+        self.assertEqual(node.requests, [8, 9, 10, 7, 6, 5])
+
+        tusc = TUSC(offline=True)
+        tusc.rpc = node = LateNode()
+        tracker = tusc.confirmations("head")
+        result = tracker.wait(
+            "ee", 10, expiration=tx["expiration"], broadcast="2020-01-01T00:00:12"
+        )
+        self.assertEqual(result["block_num"], 4)
+        self.assertEqual(node.requests, [8, 9, 10, 7, 6, 5, 4])
+
+    def test_track_max_lifetime(self):
+        tusc = TUSC(offline=True)
+        tusc.rpc = Node()
+        tracker = tusc.confirmations("head")
+        tracker.max_lifetime = 3
+        # First scanned block 3 at :09, expires at :12
+        with self.assertRaises(TransactionExpired):
+            tracker.wait("dd", 10)
+
+    def test_timeout(self):
+        tracker = ConfirmationTracker(blockchain_instance=TUSC(offline=True))
+        self.assertEqual(
+            tracker.timeout("dd"), tracker.max_lifetime + tracker.expiration_margin
+        )
+        tx = {"expiration": formatTimeFromNow(30)}
+        self.assertAlmostEqual(tracker.timeout(tx), 30 + 60, delta=2)
+        tx = {"expiration": "2020-01-01T00:00:28"}
+        self.assertEqual(tracker.timeout(tx), tracker.expiration_margin)
+
+    def test_track_late_async(self):
+        class AsyncLateNode(AsyncNode):
+            blocks = LateNode.blocks
+
+            async def get_dynamic_global_properties(self):
+                return LateNode.get_dynamic_global_properties(self)
+
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = AsyncLateNode()
+            tracker = tusc.confirmations("head")
+            tx = {"id": "ee", "expiration": "2020-01-01T00:00:28", "ref_block_num": 3}
+            return (await tracker.wait(tx, 10))["block_num"]
+
+        self.assertEqual(asyncio.run(run()), 4)
+
+    def test_track_async(self):
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = AsyncNode()
+            tracker = tusc.confirmations()
+            results = await asyncio.gather(
+                tracker.track("aa"), tracker.track("cc"), tracker.wait("bb", 10)
+            )
+            return [(r["block_num"], r["trx_num"]) for r in results]
+
+        self.assertEqual(asyncio.run(run()), [(4, 0), (5, 1), (5, 0)])
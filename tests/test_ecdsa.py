@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from binascii import hexlify
+
+from graphenebase import ecdsa as graphene_ecdsa
+from graphenebase.ecdsa import _is_canonical
+from tuscbase import ecdsa
+from tuscbase.account import PrivateKey
+
+wif = "5KQwrPbwdL6PhXujxW37FSSQZ1JiwsST4cqQzDeyXtP79zkvFD3"
+messages = [b"", b"foobar", bytes(range(256))] + [b"%d" % i for i in range(20)]
+
+
+class Testcases(unittest.TestCase):
+    def tearDown(self):
+        ecdsa.set_backend()
+
+    def sign(self, name):
+        ecdsa.set_backend(name)
+        self.assertEqual(ecdsa.get_backend().name, name)
+        return [ecdsa.sign_message(message, wif) for message in messages]
+
+    def test_pure(self):
+        pub = repr(PrivateKey(wif).pubkey)
+        signatures = self.sign("ecdsa")
+        self.assertEqual(signatures, self.sign("ecdsa"))
+        for message, signature in zip(messages, signatures):
+            self.assertTrue(_is_canonical(signature[1:]))
+            for verify in [ecdsa.verify_message, graphene_ecdsa.verify_message]:
+                self.assertEqual(
+                    hexlify(verify(message, signature)).decode("ascii"), pub
+                )
+
+    def test_identical(self):
+        if "secp256k1" not in ecdsa.available_backends():
+            self.skipTest("secp256k1 is not installed")
+        signatures = self.sign("ecdsa")
+        self.assertEqual(self.sign("secp256k1"), signatures)
+        keys = [ecdsa.verify_message(*args) for args in zip(messages, signatures)]
+        ecdsa.set_backend("ecdsa")
+        self.assertEqual(
+            [ecdsa.verify_message(*args) for args in zip(messages, signatures)], keys
+        )
+
+    def test_backends(self):
+        self.assertIn("ecdsa", ecdsa.available_backends())
+        with self.assertRaises(ValueError):
+            ecdsa.set_backend("unknown")
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from tusc import TUSC
+from tusc.feedanalytics import FeedAnalytics
+
+
+def feed(date, base, quote):
+    return [
+        date,
+        {
+            "settlement_price": {
+                "base": {"amount": base, "asset_id": "1.3.1"},
+                "quote": {"amount": quote, "asset_id": "1.3.0"},
+            }
+        },
+    ]
+
+
+class Node:
+    assets = [
+        {"id": "1.3.0", "symbol": "TUSC", "precision": 5},
+        {
+            "id": "1.3.1",
+            "symbol": "USD",
+            "precision": 4,
+            "bitasset_data_id": "2.4.0",
+        },
+    ]
+    objects = {
+        "2.4.0": {
+            "options": {"short_backing_asset": "1.3.0", "feed_lifetime_sec": 3600},
+            "current_feed": feed(None, 2000, 100000)[1],
+            "feeds": [
+                ["1.2.10", feed("2020-01-01T11:30:00", 1000, 100000)],
+                ["1.2.11", feed("2020-01-01T11:50:00", 2000, 100000)],
+                ["1.2.12", feed("2020-01-01T11:55:00", 4000, 100000)],
+                ["1.2.13", feed("2020-01-01T09:00:00", 8000, 100000)],
+                ["1.2.14", feed("2020-01-01T11:00:00", 0, 0)],
+            ],
+        }
+    }
+
+    def list_assets(self, lower_bound, limit):
+        return self.assets
+
+    def get_objects(self, ids):
+        return [self.objects.get(i) for i in ids]
+
+    def get_dynamic_global_properties(self):
+        return {"time": "2020-01-01T12:00:00"}
+
+
+class Testcases(unittest.TestCase):
+    def test_stats(self):
+        tusc = TUSC(offline=True)
+        tusc.rpc = Node()
+        stats = FeedAnalytics(blockchain_instance=tusc).stats()
+        self.assertEqual(list(stats), ["USD"])
+        usd = stats["USD"]
+        self.assertEqual(usd.asset_id, "1.3.1")
+        self.assertEqual(usd.backing_asset_id, "1.3.0")
+        self.assertEqual(usd.producers, 5)
+        self.assertEqual(usd.feeds, 3)
+        self.assertEqual(usd.stale, 1)
+        self.assertAlmostEqual(usd.current, 0.2)
+        self.assertAlmostEqual(usd.median, 0.2)
+        self.assertAlmostEqual(usd.min, 0.1)
+        self.assertAlmostEqual(usd.max, 0.4)
+        self.assertAlmostEqual(usd.spread, 3.0)
+        self.assertEqual(usd.oldest, 3 * 3600)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from tusc import TUSC
+from tusc.fees import FeeSchedule
+
+
+def global_properties(scale):
+    return {
+        "id": "2.0.0",
+        "parameters": {
+            "current_fees": {
+                "scale": scale,
+                "parameters": [
+                    [0, {"fee": 20000, "price_per_kbyte": 10000}],
+                    [5, {"basic_fee": 500000, "premium_fee": 2000000}],
+                ],
+            }
+        },
+    }
+
+
+class Node:
+    calls = 0
+    maintenance = "2020-01-01T00:00:00"
+
+    def get_objects(self, ids):
+        self.calls += 1
+        return [global_properties(10000), {"id": "1.3.0", "precision": 5}]
+
+    def get_dynamic_global_properties(self):
+        return {"next_maintenance_time": self.maintenance}
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        self.tusc = TUSC(offline=True)
+        self.tusc.rpc = Node()
+
+    def test_lookups(self):
+        fees = self.tusc.fee_schedule
+        self.assertIs(fees, self.tusc.fee_schedule)
+        self.assertEqual(fees.fee("transfer"), 20000)
+        self.assertEqual(fees.fee(0, "price_per_kbyte"), 10000)
+        self.assertEqual(fees["account_create"]["premium_fee"], 2000000)
+        self.assertIn("transfer", fees)
+        self.assertNotIn("limit_order_create", fees)
+        self.assertIsNone(fees.get(1))
+        self.assertEqual(
+            fees.as_dict()["transfer"], {"fee": 0.2, "price_per_kbyte": 0.1}
+        )
+        self.assertEqual(self.tusc.rpc.calls, 1)
+
+    def test_refresh(self):
+        fees = FeeSchedule(blockchain_instance=self.tusc)
+        fees.fee("transfer")
+        fees.on_object(global_properties(20000))
+        self.assertEqual(fees.fee("transfer"), 40000)
+
+        # A new maintenance interval triggers a reload
+        fees.check_interval = 0
+        self.tusc.rpc.maintenance = "2020-01-01T01:00:00"
+        self.assertEqual(fees.fee("transfer"), 20000)
+        self.assertEqual(self.tusc.rpc.calls, 2)
+
+    def test_calculate(self):
+        from tuscbase import operations
+        from tuscbase.objects import Operation
+
+        fees = FeeSchedule(blockchain_instance=self.tusc)
+        parameters = global_properties(20000)
+        parameters["parameters"]["current_fees"]["parameters"].extend(
+            [
+                [1, {"fee": 500}],
+                [
+                    5,
+                    {
+                        "basic_fee": 500000,
+                        "premium_fee": 2000000,
+                        "price_per_kbyte": 1024,
+                    },
+                ],
+            ]
+        )
+        fees.set(parameters, 5)
+        pub = "TUSC6MRyAjQq8ud7hVNYcfnVPJqcVpscN5So8BhtHuGYqET5GDW5CV"
+        transfer = {
+            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            "from": "1.2.0",
+            "to": "1.2.1",
+            "amount": {"amount": 1, "asset_id": "1.3.0"},
+        }
+        op = Operation(operations.Transfer(**transfer))
+        self.assertEqual(fees.calculate(op), 40000)
+
+        # 33 + 33 + 8 + 2 + 1024 bytes of memo
+        memo = {"from": pub, "to": pub, "nonce": 1, "message": "00" * 1024}
+        op = Operation(operations.Transfer(memo=memo, prefix="TUSC", **transfer))
+        self.assertEqual(fees.calculate(op), 2 * (20000 + 1100 * 10000 // 1024))
+
+        op = Operation(
+            operations.Limit_order_cancel(
+                fee={"amount": 0, "asset_id": "1.3.0"},
+                fee_paying_account="1.2.0",
+                order="1.7.0",
+            )
+        )
+        self.assertIsNone(fees.calculate(op))
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import unittest
+
+from datetime import datetime
+
+from tusc import TUSC
+from tusc.historyindex import AccountHistoryIndex
+
+
+class Node:
+    chain_params = {"chain_id": "00" * 32, "prefix": "TUSC"}
+
+    def __init__(self, size):
+        self.requests = []
+        self.headers = []
+        #: Number of requests after which the node fails
+        self.fail_after = None
+        self.history = []
+        for i in range(1, size + 1):
+            if i % 3:
+                op = [
+                    0,
+                    {
+                        "from": "1.2.%d" % (10 + i % 2),
+                        "to": "1.2.%d" % (11 - i % 2),
+                        "amount": {"amount": i, "asset_id": "1.3.%d" % (i % 2)},
+                    },
+                ]
+            else:
+                op = [
+                    1,
+                    {
+                        "seller": "1.2.10",
+                        "amount_to_sell": {"amount": i, "asset_id": "1.3.0"},
+                    },
+                ]
+            self.history.append({"id": "1.11.%d" % (i * 2), "block_num": i, "op": op})
+
+    def get_block_header_batch(self, block_nums):
+        self.headers.append(block_nums)
+        return [
+            [block_num, {"timestamp": "2020-01-%02dT00:00:00" % block_num}]
+            for block_num in block_nums
+        ]
+
+    def get_account_history(self, account, stop, limit, start, api=None):
+        if self.fail_after is not None and len(self.requests) >= self.fail_after:
+            raise ConnectionError
+        self.requests.append((stop, start))
+        stop = int(stop.split(".")[2])
+        start = int(start.split(".")[2]) or 10**9
+        # Stopping at 1.11.0 includes it
+        entries = [
+            e
+            for e in reversed(self.history)
+            if (stop == 0 or stop < int(e["id"].split(".")[2]))
+            and int(e["id"].split(".")[2]) <= start
+        ]
+        return entries[:limit]
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.tusc = TUSC(offline=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def index(self):
+        return AccountHistoryIndex(
+            os.path.join(self.path, "history.sqlite"), blockchain_instance=self.tusc
+        )
+
+    def test_sync(self):
+        self.tusc.rpc = Node(25)
+        with self.index() as index:
+            index.page_size = 10
+            self.assertEqual(index.sync(["1.2.10"]), {"1.2.10": 25})
+            self.assertEqual(index.last_id("1.2.10"), 50)
+            self.assertEqual(
+                self.tusc.rpc.requests,
+                [("1.11.0", "1.11.0"), ("1.11.0", "1.11.31"), ("1.11.0", "1.11.11")],
+            )
+            # One header request per page
+            self.assertEqual(len(self.tusc.rpc.headers), 3)
+            self.assertEqual(self.tusc.rpc.headers[2], [1, 2, 3, 4, 5])
+
+        # Resumes from the newest stored entry
+        self.tusc.rpc.history.extend(Node(28).history[25:])
+        self.tusc.rpc.requests = []
+        with self.index() as index:
+            index.page_size = 10
+            self.assertEqual(index.sync(["1.2.10"]), {"1.2.10": 3})
+            self.assertEqual(self.tusc.rpc.requests, [("1.11.50", "1.11.0")])
+            self.assertEqual(index.sync(["1.2.10"]), {"1.2.10": 0})
+            self.assertEqual(len(index.query("1.2.10")), 28)
+
+    def test_first_entry(self):
+        self.tusc.rpc = node = Node(9)
+        node.history.insert(0, dict(node.history[0], id="1.11.0"))
+        node.history.insert(1, dict(node.history[0], id="1.11.1"))
+        with self.index() as index:
+            index.page_size = 5
+            self.assertIsNone(index.last_id("1.2.10"))
+            self.assertEqual(index.sync_account("1.2.10"), 11)
+            self.assertEqual(index.last_id("1.2.10"), 18)
+            self.assertEqual(
+                node.requests,
+                [("1.11.0", "1.11.0"), ("1.11.0", "1.11.9"), ("1.11.0", "1.11.1")],
+            )
+            ids = [e["id"] for e in index.query("1.2.10")]
+            self.assertEqual(ids[-2:], ["1.11.1", "1.11.0"])
+            self.assertEqual(index.sync_account("1.2.10"), 0)
+
+    def test_interrupted(self):
+        self.tusc.rpc = node = Node(25)
+        node.fail_after = 2
+        with self.index() as index:
+            index.page_size = 10
+            with self.assertRaises(ConnectionError):
+                index.sync_account("1.2.10")
+            self.assertIsNone(index.last_id("1.2.10"))
+            self.assertEqual(index.progress("1.2.10"), (50, 12))
+            self.assertEqual(len(index.query("1.2.10")), 20)
+
+        # Continues below the oldest entry reached
+        node.fail_after = None
+        node.requests = []
+        with self.index() as index:
+            index.page_size = 10
+            self.assertEqual(index.sync_account("1.2.10"), 5)
+            self.assertEqual(
+                node.requests, [("1.11.0", "1.11.11"), ("1.11.50", "1.11.0")]
+            )
+            self.assertEqual(index.last_id("1.2.10"), 50)
+            self.assertIsNone(index.progress("1.2.10"))
+            self.assertEqual(len(index.query("1.2.10")), 25)
+
+    def test_query(self):
+        self.tusc.rpc = Node(28)
+        with self.index() as index:
+            index.sync(["1.2.10"])
+            transfers = index.query(
+                "1.2.10",
+                op_type="transfer",
+                asset="1.3.1",
+                incoming=True,
+                start=datetime(2020, 1, 5),
+                stop="2020-01-20T00:00:00",
+            )
+            self.assertEqual(
+                [e["block_num"] for e in transfers], [19, 17, 13, 11, 7, 5]
+            )
+            self.assertEqual(transfers[0]["op"][1]["from"], "1.2.11")
+            self.assertEqual(transfers[0]["block_time"], "2020-01-19T00:00:00")
+
+            self.assertEqual(
+                [e["block_num"] for e in index.query("1.2.10", op_type=1, limit=2)],
+                [27, 24],
+            )
+            self.assertEqual(len(index.query("1.2.10", counterparty="1.2.11")), 19)
+            self.assertEqual(len(index.query("1.2.10", incoming=False)), 19)
+            with self.assertRaises(ValueError):
+                index.query("1.2.10", op_type="transfers")
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+
+from tusc import TUSC
+from tusc.margincalls import MarginCallScanner
+
+
+def raw_asset(id, symbol, precision):
+    asset = {
+        "id": id,
+        "symbol": symbol,
+        "precision": precision,
+        "issuer": "1.2.0",
+        "options": {"flags": 0, "issuer_permissions": 0, "description": ""},
+        "dynamic_asset_data_id": "2.3.{}".format(id.split(".")[2]),
+    }
+    if symbol == "SCANUSD":
+        asset["bitasset_data_id"] = "2.4.0"
+    return asset
+
+
+def call_order(id, collateral, debt):
+    return {
+        "id": id,
+        "borrower": "1.2.100",
+        "collateral": collateral,
+        "debt": debt,
+        "call_price": {
+            "base": {"amount": 1, "asset_id": "1.3.0"},
+            "quote": {"amount": 1, "asset_id": "1.3.1"},
+        },
+    }
+
+
+def feed(usd, tusc):
+    return {
+        "maintenance_collateral_ratio": 1750,
+        "settlement_price": {
+            "base": {"amount": usd, "asset_id": "1.3.1"},
+            "quote": {"amount": tusc, "asset_id": "1.3.0"},
+        },
+    }
+
+
+class Node:
+    # 1 SCANUSD = 10 SCANTUSC
+    assets = {"1.3.0": raw_asset("1.3.0", "SCANTUSC", 5)}
+    assets["1.3.1"] = raw_asset("1.3.1", "SCANUSD", 4)
+    assets["SCANUSD"] = assets["1.3.1"]
+    bitasset = {
+        "id": "2.4.0",
+        "options": {"short_backing_asset": "1.3.0"},
+        "current_feed": feed(10000, 1000000),
+    }
+    # collateral ratios 1.5, 2.0, 3.0 and 5.0
+    calls = [
+        call_order("1.8.1", 15000000, 100000),
+        call_order("1.8.2", 50000000, 100000),
+        call_order("1.8.3", 20000000, 100000),
+        call_order("1.8.4", 30000000, 100000),
+    ]
+
+    def get_asset(self, id):
+        return self.assets[id]
+
+    def get_object(self, id):
+        return self.bitasset if id == "2.4.0" else {}
+
+    urls = ["wss://node.example"]
+    user = password = ""
+
+    def __init__(self):
+        self.requests = []
+
+    def get_call_orders(self, asset, limit, start=None):
+        # Pages include the order at ``start`` again
+        self.requests.append(start)
+        ids = [c["id"] for c in self.calls]
+        offset = ids.index(start) if start else 0
+        return self.calls[offset : offset + limit]
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        tusc = TUSC(offline=True)
+        tusc.rpc = Node()
+        self.scanner = MarginCallScanner("SCANUSD", blockchain_instance=tusc)
+        self.scanner.load()
+
+    def test_called(self):
+        scanner = self.scanner
+        self.assertEqual(len(scanner), 4)
+        self.assertAlmostEqual(scanner.feed_price, 0.1)
+        self.assertAlmostEqual(scanner.collateral_ratio("1.8.3"), 2.0)
+        self.assertEqual(scanner.called(), ["1.8.1"])
+        self.assertEqual(scanner.called(-0.2), ["1.8.1", "1.8.3"])
+        self.assertEqual(scanner.count_called(-0.5), 3)
+        self.assertEqual(scanner.debt_called(-0.5), 300000)
+        self.assertEqual(scanner.collateral_called(-0.2), 35000000)
+        self.assertAlmostEqual(scanner.move_to_call("1.8.3"), -0.125)
+
+    def test_notices(self):
+        scanner = self.scanner
+        scanner.on_object(call_order("1.8.4", 10000000, 100000))
+        self.assertEqual(scanner.called(), ["1.8.4", "1.8.1"])
+        scanner.on_object_removed("1.8.1")
+        self.assertEqual(scanner.called(), ["1.8.4"])
+        scanner.on_object(call_order("1.8.5", 12000000, 50000))
+        self.assertEqual(len(scanner), 4)
+        self.assertEqual(scanner.count_called(), 1)
+
+        # Feed doubles (in SCANUSD per SCANTUSC)
+        scanner.on_object(dict(Node.bitasset, current_feed=feed(20000, 1000000)))
+        self.assertAlmostEqual(scanner.feed_price, 0.2)
+        self.assertEqual(scanner.called(), [])
+
+    def test_load_pages(self):
+        tusc = TUSC(offline=True)
+        tusc.rpc = node = Node()
+        # Sparse ids, collateral ratios from 1.1 up
+        node.calls = [
+            call_order("1.8.%d" % (7 * i + 3), 11000000 + i * 100000, 100000)
+            for i in range(250)
+        ]
+        scanner = MarginCallScanner("SCANUSD", blockchain_instance=tusc).load()
+        self.assertEqual(len(scanner), 250)
+        self.assertEqual(node.requests, [None, "1.8.696", "1.8.1389"])
+        self.assertEqual(scanner.called(), ["1.8.%d" % (7 * i + 3) for i in range(65)])
+
+    def test_subscribe(self):
+        scanner = self.scanner
+        ws = scanner.subscribe()
+        self.assertEqual(ws.subscription_objects, ["1.8.x", "2.4.0"])
+
+        def notice(*objects):
+            return json.dumps(
+                {"method": "notice", "params": [1, [list(objects)]]}
+            )
+
+        objects = []
+        ws.on_object += objects.append
+        ws.on_message(notice(call_order("1.8.4", 10000000, 100000), {"id": "2.5.1"}))
+        self.assertEqual(scanner.called(), ["1.8.4", "1.8.1"])
+        # Removed objects are notified by their id, on their own event
+        ws.on_message(notice("1.8.1", "2.5.2"))
+        self.assertEqual(scanner.called(), ["1.8.4"])
+        self.assertTrue(all(isinstance(obj, dict) for obj in objects))
+        self.assertEqual([obj["id"] for obj in objects], ["1.8.4"])
+        ws.on_message(notice(dict(Node.bitasset, current_feed=feed(20000, 1000000))))
+        self.assertEqual(scanner.called(), [])
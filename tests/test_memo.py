@@ -5,6 +5,9 @@ from pprint import pprint
 from itertools import cycle
 from tuscbase.account import BrainKey, Address, PublicKey, PrivateKey
 from tuscbase.memo import get_shared_secret, _pad, _unpad, encode_memo, decode_memo
+from tusc import TUSC
+from tusc.exceptions import MissingKeyError
+from tusc.memo import Memo, MemoDecryptionPool
 
 test_cases = [
     {
@@ -134,7 +137,21 @@ not_enough_padding = [
 ]
 
 
+def tusc_memos():
+    """The memos of the test cases with TUSC keys"""
+    return [
+        {
+            key: "TUSC" + value[3:] if key in ("from", "to") else value
+            for key, value in memo.items()
+        }
+        for memo in test_cases + not_enough_padding
+    ]
+
+
 class Testcases(unittest.TestCase):
+    def setUp(self):
+        Memo.shared_secrets.clear()
+
     def test_padding(self):
         for l in range(0, 255):
             s = bytes(l * chr(l), "utf-8")
@@ -192,3 +209,96 @@ class Testcases(unittest.TestCase):
                 memo["message"],
             )
             self.assertEqual(memo["plain"], dec)
+
+    def test_memo_many(self):
+        class Node:
+            chain_params = {"chain_id": "00" * 32, "prefix": "TUSC"}
+
+            def lookup_account_names(self, names):
+                return [
+                    {"id": "1.2.%d" % i, "name": name, "options": {"memo_key": key}}
+                    for i, (name, key) in enumerate(memo_keys.items(), 101)
+                    if name in names
+                ]
+
+        memos = tusc_memos()
+        recipients = sorted({memo["to"] for memo in memos})
+        memo_keys = dict(bob=recipients[0], carol=recipients[1], dave=memos[0]["from"])
+        tusc = TUSC(offline=True, keys=list({memo["wif"] for memo in memos}))
+        tusc.rpc = Node()
+        memo = Memo(blockchain_instance=tusc)
+        self.assertEqual(memo.decrypt_many(memos), [memo["plain"] for memo in memos])
+        self.assertEqual(len(Memo.shared_secrets), 2)
+        for key in Memo.shared_secrets:
+            self.assertTrue(all(k.startswith("TUSC") for k in key))
+
+        memo.from_account = {"options": {"memo_key": memos[0]["from"]}}
+        encrypted = memo.encrypt_many(
+            [("bob", "foo"), ("carol", "bar"), ("bob", ""), ("bob", "baz")]
+        )
+        self.assertIsNone(encrypted[2])
+        self.assertEqual(
+            [encrypted[i]["to"] for i in (0, 1, 3)],
+            [recipients[0], recipients[1], recipients[0]],
+        )
+        self.assertEqual(memo.decrypt_many(encrypted), ["foo", "bar", None, "baz"])
+        self.assertEqual(len(Memo.shared_secrets), 3)
+
+        memo.shared_secrets_size = 2
+        memo.encrypt_many([("dave", "foo")])
+        self.assertEqual(len(Memo.shared_secrets), 2)
+
+    def test_missing_keys(self):
+        memos = tusc_memos()
+        tusc = TUSC(offline=True, keys=[memos[0]["wif"]])
+        tusc.rpc = type("Node", (), {"chain_params": {"prefix": "TUSC"}})()
+        memo = Memo(blockchain_instance=tusc)
+        memo.missing_key_ttl = 3600
+        with self.assertRaises(MissingKeyError):
+            memo.get_private_key(memos[-1]["from"])
+        tusc.wallet.addPrivateKey(memos[-1]["wif"])
+        with self.assertRaises(MissingKeyError):
+            memo.get_private_key(memos[-1]["from"])
+
+        # Keys added to the wallet are found once the miss has expired
+        memo.missing_key_ttl = 0
+        memo._missing_keys.clear()
+        self.assertEqual(
+            str(memo.get_private_key(memos[-1]["from"])), memos[-1]["wif"]
+        )
+        self.assertEqual(memo.decrypt(memos[-1]), memos[-1]["plain"])
+
+    def test_decrypt_operations(self):
+        memos = tusc_memos()
+        tusc = TUSC(offline=True, keys=[memos[0]["wif"]])
+        tusc.rpc = type("Node", (), {"chain_params": {"prefix": "TUSC"}})()
+        broken = dict(memos[1], nonce="1")
+        operations = (
+            [{"op": [0, {"memo": memos[0]}]}, [0, {}], {"memo": broken}]
+            + [["transfer", {"memo": memo}] for memo in memos]
+        )
+        memo = Memo(blockchain_instance=tusc)
+        for processes in (1, 2):
+            # The workers derive the shared secrets and the pool caches them
+            Memo.shared_secrets.clear()
+            pool = MemoDecryptionPool(processes)
+            pool.batch_size, pool.chunksize = 4, 2
+            with pool:
+                results = list(pool.decrypt(memo, iter(operations)))
+            priv, pub = memo.get_memo_keys(memos[0])
+            self.assertEqual(
+                memo.cached_shared_secret(priv, pub),
+                get_shared_secret(priv, PublicKey(pub, prefix="TUSC")),
+            )
+            self.assertEqual(len(results), len(operations))
+            self.assertEqual(results[:2], [(memos[0]["plain"], None), (None, None)])
+            self.assertEqual(results[2][1][0], "ValueError")
+            for (message, error), case in zip(results[3:], memos):
+                if case["wif"] == memos[0]["wif"]:
+                    self.assertEqual((message, error), (case["plain"], None))
+                else:
+                    self.assertEqual(error[0], "MissingKeyError")
+        self.assertEqual(
+            [message for message, _ in memo.decrypt_operations(operations[:2])],
+            [memos[0]["plain"], None],
+        )
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+import time
+import unittest
+
+from graphenecommon.blockchainobject import Caching
+
+from tusc import TUSC
+from tusc.account import Account
+from tusc.aio import TUSC as AsyncTUSC
+from tusc.aio.account import Account as AsyncAccount
+from tusc.asset import Asset
+
+accounts = {
+    "alice": {"id": "1.2.100", "name": "alice"},
+    "bob": {"id": "1.2.101", "name": "bob"},
+}
+for i in range(1500):
+    accounts["user%d" % i] = {"id": "1.2.%d" % (1000 + i), "name": "user%d" % i}
+assets = {
+    "TUSC": {
+        "id": "1.3.0",
+        "symbol": "TUSC",
+        "precision": 5,
+        "options": {"issuer_permissions": 0, "flags": 0, "description": ""},
+    }
+}
+
+
+class Node:
+    def __init__(self, offset=0):
+        self.calls = []
+        self.offset = offset
+
+    def lookup_account_names(self, names):
+        self.calls.append(("lookup_account_names", names))
+        time.sleep(0.05)
+        r = [dict(accounts[name]) if name in accounts else None for name in names]
+        for account in r:
+            if account and self.offset:
+                # A node of another chain
+                account["id"] = "1.2.%d" % (int(account["id"][4:]) + self.offset)
+        return r
+
+    def get_objects(self, ids):
+        self.calls.append(("get_objects", ids))
+        by_id = {a["id"]: a for a in accounts.values()}
+        return [by_id.get(id) for id in ids]
+
+    def lookup_asset_symbols(self, symbols):
+        self.calls.append(("lookup_asset_symbols", symbols))
+        return [assets.get(symbol) for symbol in symbols]
+
+
+class AsyncNode(Node):
+    async def lookup_account_names(self, names):
+        self.calls.append(("lookup_account_names", names))
+        await asyncio.sleep(0.01)
+        return [accounts.get(name) for name in names]
+
+    async def get_objects(self, ids):
+        return Node.get_objects(self, ids)
+
+    async def lookup_asset_symbols(self, symbols):
+        return Node.lookup_asset_symbols(self, symbols)
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        Caching.clear_cache()
+        self.tusc = TUSC(offline=True)
+        self.tusc.rpc = Node()
+
+    def test_prefetch(self):
+        loaded = self.tusc.prefetch(
+            accounts=["alice", "1.2.101", "nobody", "alice"], assets=["TUSC"]
+        )
+        self.assertEqual(loaded, 3)
+        self.assertEqual(len(self.tusc.rpc.calls), 3)
+        self.assertEqual(Account("bob", blockchain_instance=self.tusc)["id"], "1.2.101")
+        self.assertEqual(
+            Account("1.2.100", blockchain_instance=self.tusc).name, "alice"
+        )
+        self.assertEqual(Asset("TUSC", blockchain_instance=self.tusc).precision, 5)
+        self.assertEqual(len(self.tusc.rpc.calls), 3)
+
+        # Cached objects are not requested again
+        self.assertEqual(self.tusc.prefetch(accounts=["bob"], assets=["1.3.0"]), 0)
+        self.assertEqual(len(self.tusc.rpc.calls), 3)
+
+    def test_prefetch_many(self):
+        names = ["user%d" % i for i in range(1500)]
+        self.assertEqual(self.tusc.prefetch(accounts=names), 1500)
+        self.assertEqual(len(self.tusc.rpc.calls), 15)
+        # More objects than the shared cache holds are kept
+        self.assertEqual(
+            [Account(name, blockchain_instance=self.tusc)["id"] for name in names],
+            ["1.2.%d" % (1000 + i) for i in range(1500)],
+        )
+        self.assertEqual(len(self.tusc.rpc.calls), 15)
+
+        self.tusc.prefetch_expiration = -1
+        self.tusc.prefetch(accounts=["bob"])
+        self.assertIsNone(self.tusc.prefetched("account", "bob"))
+
+    def test_prefetch_many_async(self):
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = AsyncNode()
+            ids = ["1.2.%d" % (1000 + i) for i in range(1250, 1500)]
+            names = ["user%d" % i for i in range(250)]
+            loaded = await tusc.prefetch(accounts=names + ids, assets=["TUSC"])
+            return loaded, [(method, len(keys)) for method, keys in tusc.rpc.calls]
+
+        loaded, calls = asyncio.run(run())
+        self.assertEqual(loaded, 501)
+        self.assertEqual(
+            sorted(calls),
+            [("get_objects", 50), ("get_objects", 100), ("get_objects", 100)]
+            + [("lookup_account_names", 50)]
+            + [("lookup_account_names", 100)] * 2
+            + [("lookup_asset_symbols", 1)],
+        )
+
+    def test_single_flight_instances(self):
+        other = TUSC(offline=True)
+        other.rpc = Node(offset=1000)
+        results = {}
+
+        def lookup(tusc):
+            account = Account("alice", blockchain_instance=tusc, use_cache=False)
+            results[tusc] = account["id"]
+
+        threads = [
+            threading.Thread(target=lookup, args=(tusc,))
+            for tusc in [self.tusc, other] * 3
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Lookups of different instances are not merged
+        self.assertEqual(results, {self.tusc: "1.2.100", other: "1.2.1100"})
+        self.assertEqual(len(self.tusc.rpc.calls), 1)
+        self.assertEqual(len(other.rpc.calls), 1)
+
+    def test_single_flight(self):
+        results = []
+
+        def lookup():
+            account = Account(
+                "alice", blockchain_instance=self.tusc, use_cache=False
+            )
+            results.append(account["id"])
+
+        threads = [threading.Thread(target=lookup) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ["1.2.100"] * 5)
+        self.assertEqual(self.tusc.rpc.calls, [("lookup_account_names", ["alice"])])
+
+    def test_single_flight_async(self):
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = AsyncNode()
+            results = await asyncio.gather(
+                *[AsyncAccount("bob", blockchain_instance=tusc) for _ in range(5)]
+            )
+            return tusc.rpc.calls, [account["id"] for account in results]
+
+        calls, ids = asyncio.run(run())
+        self.assertEqual(calls, [("lookup_account_names", ["bob"])])
+        self.assertEqual(ids, ["1.2.101"] * 5)
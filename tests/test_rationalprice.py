@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import pickle
+import unittest
+
+from tusc import TUSC
+from tusc.exceptions import InvalidAssetException
+from tusc.price import Price, RationalPrice
+
+
+def raw_asset(id, symbol, precision):
+    return {
+        "id": id,
+        "symbol": symbol,
+        "precision": precision,
+        "issuer": "1.2.0",
+        "options": {"flags": 0, "issuer_permissions": 0, "description": ""},
+        "dynamic_asset_data_id": "2.3.{}".format(id.split(".")[2]),
+    }
+
+
+class Node:
+    chain_params = {"chain_id": "00" * 32, "prefix": "TUSC"}
+    assets = [raw_asset("1.3.1", "RPUSD", 4), raw_asset("1.3.2", "RPGOLD", 5)]
+
+    def get_asset(self, identifier):
+        for asset in self.assets:
+            if identifier in (asset["id"], asset["symbol"]):
+                return asset
+
+
+class Testcases(unittest.TestCase):
+    def test_rational(self):
+        # 10 USD/GOLD with precisions 4 and 5
+        p1 = RationalPrice(100000, 100000, "1.3.1", "1.3.2", 4, 5)
+        self.assertEqual(float(p1), 10.0)
+        self.assertEqual(float(p1.invert()), 0.1)
+        self.assertEqual(p1.invert().base_asset_id, "1.3.2")
+        self.assertEqual(p1, p1.invert())
+        self.assertEqual(hash(p1), hash(RationalPrice(2, 2, "1.3.1", "1.3.2", 4, 5)))
+        # Equal prices hash equal in either orientation
+        self.assertEqual(hash(p1), hash(p1.invert()))
+        self.assertIn(p1.invert(), {p1})
+        self.assertEqual({p1: 1}[p1.invert()], 1)
+        p2 = RationalPrice(-3, 6, "1.3.2", "1.3.1", 5, 4)
+        self.assertEqual(p2, p2.invert())
+        self.assertEqual(hash(p2), hash(p2.invert()))
+        self.assertNotEqual(p1, RationalPrice(1, 1, "1.3.1", "1.3.3", 4, 5))
+        with self.assertRaises(AttributeError):
+            p1.numerator = 5
+
+    def test_rational_equality(self):
+        p1 = RationalPrice(100000, 100000, "1.3.1", "1.3.2", 4, 5)
+        # Only prices are equal to prices, numbers would hash differently
+        self.assertNotEqual(p1, 10.0)
+        self.assertNotEqual(p1, 10)
+        self.assertNotIn(10.0, {p1})
+        self.assertEqual(float(p1), 10.0)
+
+    def test_rational_compare(self):
+        p1 = RationalPrice(100000, 100000, "1.3.1", "1.3.2", 4, 5)
+        p2 = RationalPrice(50000, 100000, "1.3.1", "1.3.2", 4, 5)
+        self.assertGreater(p1, p2)
+        self.assertLess(p2, p1)
+        self.assertLess(p1.invert(), p2.invert())
+        # comparisons with the inverted pair are aligned
+        self.assertGreater(p1, p2.invert())
+        self.assertTrue(p1 > 9.9)
+        with self.assertRaises(InvalidAssetException):
+            p1 < RationalPrice(1, 1, "1.3.1", "1.3.3", 4, 5)
+
+    def test_rational_multiplication(self):
+        p1 = RationalPrice(100000, 100000, "1.3.1", "1.3.2", 4, 5)
+        p2 = RationalPrice(5000, 10000, "1.3.3", "1.3.1", 3, 4)
+        # 10 USD/GOLD * 5 EUR/USD = 50 EUR/GOLD
+        p3 = p1 * p2
+        self.assertEqual(p3.base_asset_id, "1.3.3")
+        self.assertEqual(p3.quote_asset_id, "1.3.2")
+        self.assertEqual(float(p3), 50.0)
+        self.assertEqual(float(p3.as_base("1.3.2")), 0.02)
+        self.assertEqual(float(p1 * 2), 20.0)
+
+    def test_rational_div(self):
+        p1 = RationalPrice(100000, 100000, "1.3.1", "1.3.2", 4, 5)
+        p2 = RationalPrice(50000, 1000, "1.3.1", "1.3.3", 4, 3)
+        # 10 USD/GOLD / 5 USD/EUR = 2 EUR/GOLD
+        p3 = p1 / p2
+        self.assertEqual(p3.base_asset_id, "1.3.3")
+        self.assertEqual(float(p3), 2.0)
+        # 10 USD/GOLD / 20 USD/GOLD (given as GOLD/USD)
+        self.assertEqual(p1 / RationalPrice(1, 2, "1.3.2", "1.3.1", 5, 4), 0.5)
+
+    def test_rational_pickle(self):
+        p1 = RationalPrice(31500, 100000, "1.3.1", "1.3.2", 4, 5)
+        self.assertEqual(pickle.loads(pickle.dumps(p1)), p1)
+
+    def test_rational_convert(self):
+        tusc = TUSC(offline=True)
+        tusc.rpc = Node()
+        p1 = Price(10.0, "RPUSD/RPGOLD", blockchain_instance=tusc)
+        p2 = RationalPrice.from_price(p1)
+        self.assertEqual(float(p2), float(p1))
+        p3 = p2.to_price(blockchain_instance=tusc)
+        self.assertEqual(p3["base"]["symbol"], "RPUSD")
+        self.assertEqual(float(p3), float(p1))
+        p4 = RationalPrice.from_dict(p2.json(), {"1.3.1": 4, "1.3.2": 5})
+        self.assertEqual(p4, p2)
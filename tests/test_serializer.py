@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+import copy
+import unittest
+
+from tuscbase.account import PrivateKey, PublicKey, public_key
+from tuscbase.objects import Operation, Permission
+from tuscbase.serializer import (
+    deserialize_operation,
+    deserialize_transaction,
+    iter_transactions,
+    serialize_operation,
+    serialize_transaction,
+)
+from tuscbase.signedtransactions import Signed_Transaction
+
+wif = "5KQwrPbwdL6PhXujxW37FSSQZ1JiwsST4cqQzDeyXtP79zkvFD3"
+pub = "TUSC6MRyAjQq8ud7hVNYcfnVPJqcVpscN5So8BhtHuGYqET5GDW5CV"
+pub2 = "TUSC5vfCLKyXYb44znYjbrJXCyvvx3SuifhmvemnQsdbf61EtoR36z"
+fee = {"amount": 0, "asset_id": "1.3.0"}
+amount = {"amount": 5, "asset_id": "1.3.1"}
+transfer = {"fee": fee, "from": "1.2.3", "to": "1.2.4", "amount": amount}
+permission = {"weight_threshold": 1, "account_auths": [], "key_auths": [[pub, 1]]}
+account_create = {
+    "fee": fee,
+    "registrar": "1.2.1",
+    "referrer": "1.2.1",
+    "referrer_percent": 50,
+    "name": "foo\x01bar",
+    "owner": {
+        "weight_threshold": 1,
+        "account_auths": [["1.2.9", 1], ["1.2.2", 1]],
+        "key_auths": [[pub, 1], [pub2, 1]],
+    },
+    "active": permission,
+    "options": {
+        "memo_key": pub,
+        "voting_account": "1.2.5",
+        "num_witness": 0,
+        "num_committee": 0,
+        "votes": ["1:5", "0:2", "1:5"],
+    },
+    "extensions": {},
+}
+
+operations = [
+    ["transfer", transfer],
+    [
+        "transfer",
+        dict(transfer, memo={"from": pub, "to": pub, "nonce": 7, "message": "abcd"}),
+    ],
+    ["transfer", dict(transfer, memo={"from": pub, "to": pub, "nonce": 7})],
+    ["account_create", account_create],
+    # Not covered by the schema
+    [
+        "account_create",
+        dict(
+            account_create,
+            extensions={
+                "buyback_options": {
+                    "asset_to_buy": "1.3.1",
+                    "asset_to_buy_issuer": "1.2.1",
+                    "markets": ["1.3.0"],
+                }
+            },
+        ),
+    ],
+    [
+        "proposal_create",
+        {
+            "fee": fee,
+            "fee_paying_account": "1.2.1",
+            "expiration_time": "2020-01-01T00:00:00",
+            "review_period_seconds": 0,
+            "proposed_ops": [{"op": [0, transfer]}],
+        },
+    ],
+    [
+        "worker_create",
+        {
+            "fee": fee,
+            "owner": "1.2.3",
+            "work_begin_date": "2020-01-01T00:00:00",
+            "work_end_date": "2021-01-01T00:00:00",
+            "daily_pay": 10,
+            "name": "worker",
+            "url": "",
+            "initializer": [1, {"pay_vesting_period_days": 3}],
+        },
+    ],
+    [
+        "ticket_create_operation",
+        {
+            "fee": fee,
+            "account": "1.2.3",
+            "target_type": "lock_180_days",
+            "amount": amount,
+        },
+    ],
+]
+
+
+class Testcases(unittest.TestCase):
+    def test_operations(self):
+        for op in operations:
+            self.assertEqual(
+                serialize_operation(copy.deepcopy(op)),
+                bytes(Operation(copy.deepcopy(op))),
+                op[0],
+            )
+
+    def test_object_type(self):
+        with self.assertRaises(ValueError):
+            serialize_operation(["transfer", dict(transfer, to="1.3.4")])
+
+    def test_transaction(self):
+        tx = Signed_Transaction(
+            ref_block_num=34294,
+            ref_block_prefix=3707022213,
+            expiration="2016-04-06T08:29:27",
+            operations=[Operation(copy.deepcopy(op)) for op in operations[:4]],
+        )
+        tx.sign([wif], chain="TUSC")
+        self.assertEqual(serialize_transaction(tx.json()), bytes(tx))
+        self.assertEqual(
+            serialize_transaction(tx.json(), signatures=False), bytes(tx)[:-66]
+        )
+
+    def test_deserialize_operations(self):
+        for op in operations:
+            data = serialize_operation(copy.deepcopy(op))
+            self.assertEqual(serialize_operation(deserialize_operation(data)), data)
+        self.assertEqual(
+            deserialize_operation(serialize_operation(operations[1])),
+            [0, dict(operations[1][1], extensions=[])],
+        )
+        with self.assertRaises(ValueError):
+            deserialize_operation(b"\x7f\x00")
+
+    def test_global_parameters(self):
+        parameters = {
+            "current_fees": {
+                "parameters": [
+                    [54, {"basic_fee": 3, "price_per_byte": 4}],
+                    [0, {"fee": 1, "price_per_kbyte": 2}],
+                    [31, {"fee": 5}],
+                ],
+                "scale": 10000,
+            },
+            "block_interval": 3,
+            "maintenance_interval": 3600,
+            "maintenance_skip_slots": 3,
+            "committee_proposal_review_period": 1209600,
+            "maximum_transaction_size": 98304,
+            "maximum_block_size": 2097152,
+            "maximum_time_until_expiration": 86400,
+            "maximum_proposal_lifetime": 2419200,
+            "maximum_asset_whitelist_authorities": 10,
+            "maximum_asset_feed_publishers": 10,
+            "maximum_witness_count": 1001,
+            "maximum_committee_count": 1001,
+            "maximum_authority_membership": 10,
+            "reserve_percent_of_fee": 2000,
+            "network_percent_of_fee": 2000,
+            "lifetime_referrer_percent_of_fee": 3000,
+            "cashback_vesting_period_seconds": 31536000,
+            "cashback_vesting_threshold": 10000000,
+            "count_non_member_votes": True,
+            "allow_non_member_whitelists": False,
+            "witness_pay_per_block": 1000000,
+            "witness_pay_vesting_seconds": 86400,
+            "worker_budget_per_day": 50000000000,
+            "max_predicate_opcode": 1,
+            "fee_liquidation_threshold": 10000000,
+            "accounts_per_fee_scale": 1000,
+            "account_fee_scale_bitshifts": 4,
+            "max_authority_depth": 2,
+            "extensions": {"market_fee_network_percent": 100},
+        }
+        op = [31, {"fee": fee, "new_parameters": parameters}]
+        data = serialize_operation(copy.deepcopy(op))
+        # Fee parameters are sorted by operation
+        self.assertEqual(data[10:13], b"\x03\x00\x01")
+        self.assertEqual(data[-4:], b"\x01\x02\x64\x00")
+        decoded = deserialize_operation(data)
+        self.assertEqual(
+            decoded[1]["new_parameters"]["current_fees"]["parameters"][0],
+            [0, {"fee": 1, "price_per_kbyte": 2}],
+        )
+        self.assertEqual(serialize_operation(decoded), data)
+
+    def test_custom_authorities(self):
+        restriction = {
+            "member_index": 2,
+            "restriction_type": 0,
+            "argument": [7, "1.2.9"],
+            "extensions": [],
+        }
+        nested = dict(restriction, argument=[40, [[restriction], []]])
+        create = {
+            "fee": fee,
+            "account": "1.2.3",
+            "enabled": True,
+            "valid_from": "2020-01-01T00:00:00",
+            "valid_to": "2021-01-01T00:00:00",
+            "operation_type": 0,
+            "auth": permission,
+            "restrictions": [restriction, nested],
+            "extensions": [],
+        }
+        update = {
+            "fee": fee,
+            "account": "1.2.3",
+            "authority_to_update": "1.17.4",
+            "new_enabled": False,
+            "restrictions_to_remove": [3, 1],
+            "restrictions_to_add": [dict(restriction, argument=[20, [True]])],
+            "extensions": [],
+        }
+        for op in [[54, create], [55, update]]:
+            data = serialize_operation(copy.deepcopy(op))
+            self.assertEqual(serialize_operation(deserialize_operation(data)), data)
+        self.assertEqual(
+            deserialize_operation(serialize_operation([54, create]))[1]["restrictions"],
+            [restriction, nested],
+        )
+        decoded = deserialize_operation(serialize_operation([55, update]))[1]
+        self.assertEqual(decoded["restrictions_to_remove"], [1, 3])
+        self.assertNotIn("new_auth", decoded)
+
+    def test_extensions(self):
+        op = [
+            43,
+            {
+                "fee": fee,
+                "issuer": "1.2.3",
+                "amount_to_claim": amount,
+                "extensions": {"claim_from_asset_id": "1.3.5"},
+            },
+        ]
+        data = serialize_operation(copy.deepcopy(op))
+        self.assertEqual(data[-3:], b"\x01\x00\x05")
+        self.assertEqual(deserialize_operation(data), op)
+
+    def test_deserialize_transaction(self):
+        tx = Signed_Transaction(
+            ref_block_num=34294,
+            ref_block_prefix=3707022213,
+            expiration="2016-04-06T08:29:27",
+            operations=[Operation(copy.deepcopy(op)) for op in operations[:3]],
+        )
+        tx.sign([wif], chain="TUSC")
+        data = bytes(tx)
+        self.assertEqual(deserialize_transaction(data), tx.json())
+        self.assertEqual(
+            list(iter_transactions(memoryview(data * 3))), [tx.json()] * 3
+        )
+        with self.assertRaises(ValueError):
+            deserialize_transaction(data + b"\x00")
+
+    def test_public_key_interning(self):
+        key = public_key(pub)
+        self.assertIs(public_key(pub), key)
+        self.assertIsNot(public_key("GPH" + pub[4:], prefix="GPH"), key)
+        self.assertIs(key.address, key.address)
+        self.assertIs(key.point(), key.point())
+        self.assertEqual(format(key, "TUSC"), pub)
+
+        private_key = PrivateKey(wif)
+        self.assertIs(private_key.pubkey, private_key.pubkey)
+        self.assertEqual(str(private_key.pubkey), pub)
+
+        # Keys are sorted by address in permissions
+        auths = {"weight_threshold": 1, "account_auths": []}
+        for key_auths in ([[pub, 1], [pub2, 2]], [[pub2, 2], [pub, 1]]):
+            self.assertEqual(
+                bytes(Permission(key_auths=key_auths, **auths)),
+                bytes(Permission(key_auths=key_auths[::-1], **auths)),
+            )
+        self.assertEqual(
+            [str(key) for key in sorted([public_key(pub), public_key(pub2)])],
+            [str(key) for key in sorted([PublicKey(pub2), PublicKey(pub)])],
+        )
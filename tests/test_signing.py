@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import unittest
+
+from tuscbase import operations
+from tuscbase.account import PrivateKey
+from tuscbase.signedtransactions import Signed_Transaction
+from tusc import TUSC
+from tusc.signing import SigningPool
+
+wif = "5KQwrPbwdL6PhXujxW37FSSQZ1JiwsST4cqQzDeyXtP79zkvFD3"
+
+
+def transaction(amount):
+    return Signed_Transaction(
+        ref_block_num=34294,
+        ref_block_prefix=3707022213,
+        expiration="2016-04-06T08:29:27",
+        operations=[
+            operations.Transfer(
+                fee={"amount": 0, "asset_id": "1.3.0"},
+                amount={"amount": amount, "asset_id": "1.3.0"},
+                prefix="TUSC",
+                **{"from": "1.2.0", "to": "1.2.1"}
+            )
+        ],
+    )
+
+
+class Builder(dict):
+    """A constructed transaction builder."""
+
+    operations = operations
+
+    def __init__(self, blockchain_instance, tx, chain=None):
+        dict.__init__(self, signatures=[])
+        if chain:
+            self["blockchain"] = chain
+        self.blockchain = blockchain_instance
+        self.tx = tx
+        self.wifs = {wif}
+
+    def constructTx(self):
+        pass
+
+
+class Testcases(unittest.TestCase):
+    def assertSigned(self, txs):
+        pub = PrivateKey(wif, prefix="TUSC").pubkey
+        for amount, tx in enumerate(txs, 1):
+            self.assertEqual(tx.json()["operations"][0][1]["amount"]["amount"], amount)
+            self.assertEqual(len(tx.json()["signatures"]), 1)
+            # Raises if the signature does not match the key
+            tx.verify([pub], chain="TUSC")
+
+    def test_sign(self):
+        txs = [transaction(amount) for amount in range(1, 5)]
+        with SigningPool(processes=2) as pool:
+            signed = pool.sign(txs, [wif], chain="TUSC")
+        self.assertEqual(signed, txs)
+        self.assertSigned(signed)
+
+    def test_sign_async(self):
+        txs = [transaction(amount) for amount in range(1, 5)]
+        with SigningPool(processes=2) as pool:
+            signed = asyncio.run(
+                pool.sign_each_async([(tx, [wif]) for tx in txs], chain="TUSC")
+            )
+        self.assertSigned(signed)
+
+    def test_sign_many_offline(self):
+        tusc = TUSC(offline=True)
+        chain = {"chain_id": "00" * 32, "prefix": "TUSC"}
+        with SigningPool(processes=1) as pool:
+            builders = tusc.sign_many([Builder(tusc, transaction(1))], pool=pool)
+            self.assertSigned([builders[0].tx])
+            self.assertEqual(len(builders[0]["signatures"]), 1)
+
+            # Offline builders carry the parameters of their chain
+            builders = tusc.sign_many(
+                [Builder(tusc, transaction(2), chain=chain)], pool=pool
+            )
+        pub = PrivateKey(wif, prefix="TUSC").pubkey
+        builders[0].tx.verify([pub], chain=chain)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import unittest
+
+from tusc import TUSC
+from tusc.blockchain import Blockchain
+from tusc.streamprocessor import Checkpoint, StreamProcessor
+
+
+class Node:
+    chain_params = {"chain_id": "00" * 32, "prefix": "TUSC"}
+
+    def get_object(self, id):
+        return {"parameters": {"block_interval": 0}}
+
+    def get_dynamic_global_properties(self):
+        return {"head_block_number": 40, "last_irreversible_block_num": 40}
+
+    def get_block(self, block_num):
+        return {
+            "timestamp": "2020-01-01T00:00:00",
+            "transactions": [
+                {"operations": [[0, {"to": "1.2.1"}], [1, {}], [0, {"to": "1.2.2"}]]},
+                {"operations": [[0, {"to": "1.2.3"}]]},
+            ],
+        }
+
+
+class Failure(Exception):
+    pass
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.tusc = TUSC(offline=True)
+        self.tusc.rpc = Node()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def processor(self, name="test"):
+        return StreamProcessor(
+            name,
+            ["transfer"],
+            path=os.path.join(self.path, "streams.sqlite"),
+            blockchain_instance=self.tusc,
+        )
+
+    def test_resume(self):
+        handled = []
+
+        def handler(op):
+            if len(handled) == 4:
+                raise Failure()
+            handled.append((op["block_num"], op["trx_in_block"], op["op_in_trx"]))
+
+        with self.processor() as processor:
+            self.assertIsNone(processor.checkpoint)
+            with self.assertRaises(Failure):
+                processor.run(handler, start=10, stop=12)
+            self.assertEqual(processor.checkpoint, Checkpoint(11, 0, 0))
+
+        self.assertEqual(handled, [(10, 0, 0), (10, 0, 2), (10, 1, 0), (11, 0, 0)])
+        handled = []
+        with self.processor() as processor:
+            self.assertEqual(processor.run(handled.append, start=1, stop=12), 5)
+            self.assertEqual(
+                [(op["block_num"], op["trx_in_block"], op["to"]) for op in handled],
+                [
+                    (11, 0, "1.2.2"),
+                    (11, 1, "1.2.3"),
+                    (12, 0, "1.2.1"),
+                    (12, 0, "1.2.2"),
+                    (12, 1, "1.2.3"),
+                ],
+            )
+            self.assertEqual(processor.checkpoint, Checkpoint(12, 2, 0))
+            self.assertEqual(processor.run(handled.append, stop=12), 0)
+
+        with self.processor("other") as processor:
+            self.assertEqual(processor.run(handled.append, start=12, stop=12), 3)
+
+    def test_batched_checkpoints(self):
+        processor = self.processor()
+        processor.checkpoint_interval = 4
+        processor.checkpoint_timeout = 3600
+        stream = processor.stream(start=1, stop=5)
+        for i in range(5):
+            next(stream)
+        # Four operations are acknowledged, the fifth one is not
+        self.assertEqual(processor.checkpoint, Checkpoint(2, 0, 0))
+        next(stream)
+        self.assertEqual(processor.checkpoint, Checkpoint(2, 0, 0))
+        stream.close()
+        self.assertEqual(processor.checkpoint, Checkpoint(2, 0, 2))
+        processor.reset()
+        self.assertIsNone(processor.checkpoint)
+        self.assertEqual(next(processor.stream(start=3))["block_num"], 3)
+        processor.close()
+
+    def test_events(self):
+        chain = Blockchain(blockchain_instance=self.tusc)
+        expected = list(chain.stream(["transfer"], start=10, stop=11))
+        with self.processor() as processor:
+            events = list(processor.stream(start=10, stop=11))
+        self.assertEqual([e["op_in_trx"] for e in events], [0, 2, 0, 0, 2, 0])
+        # The same events as Blockchain.stream with the positions added
+        for event in events:
+            del event["trx_in_block"], event["op_in_trx"]
+        self.assertEqual(events, expected)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import unittest
+
+from tusc import TUSC
+from tusc.aio import TUSC as AsyncTUSC
+from tusc.tapos import TaposCache, block_params
+
+block_id = "00001235a5e4a4a3a4e5bfe0a3bcd1b7a6c6b1c8"
+
+
+class Node:
+    calls = 0
+    chain_params = {"chain_id": "00" * 32}
+
+    def get_dynamic_global_properties(self):
+        self.calls += 1
+        return {
+            "head_block_number": 0x1236,
+            "head_block_id": block_id,
+            "last_irreversible_block_num": 0x1234,
+        }
+
+    def get_block_header(self, block_num):
+        return {"previous": block_id}
+
+
+class AsyncNode(Node):
+    async def get_dynamic_global_properties(self):
+        await asyncio.sleep(0)
+        return Node.get_dynamic_global_properties(self)
+
+    async def get_block_header(self, block_num):
+        return Node.get_block_header(self, block_num)
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        TaposCache._params.clear()
+        self.tusc = TUSC(offline=True)
+        self.tusc.rpc = Node()
+
+    def test_block_params(self):
+        self.assertEqual(block_params(0x11234, block_id), (0x1234, 0xA3A4E4A5))
+
+    def test_cache(self):
+        tapos = self.tusc.tapos
+        self.assertIs(tapos, self.tusc.tapos)
+        self.assertEqual(tapos.get(), (0x1234, 0xA3A4E4A5))
+        self.assertEqual(tapos.get(), (0x1234, 0xA3A4E4A5))
+        self.assertEqual(self.tusc.rpc.calls, 1)
+
+        # Shared by instances connected to the same chain
+        other = TaposCache(blockchain_instance=self.tusc)
+        other.get()
+        self.assertEqual(self.tusc.rpc.calls, 1)
+
+        tapos.invalidate()
+        tapos.get()
+        self.assertEqual(self.tusc.rpc.calls, 2)
+
+        tapos.refresh_interval = 0
+        tapos.get()
+        self.assertEqual(self.tusc.rpc.calls, 3)
+
+    def test_builder(self):
+        tx = self.tusc.new_tx()
+        self.assertEqual(tx.get_block_params(), (0x1234, 0xA3A4E4A5))
+        self.assertEqual(self.tusc.new_tx().get_block_params(), (0x1234, 0xA3A4E4A5))
+        self.assertEqual(self.tusc.rpc.calls, 1)
+
+    def test_async(self):
+        async def run():
+            tusc = AsyncTUSC()
+            tusc.rpc = AsyncNode()
+            results = await asyncio.gather(*[tusc.tapos.get() for _ in range(5)])
+            return tusc.rpc.calls, results
+
+        calls, results = asyncio.run(run())
+        self.assertEqual(calls, 1)
+        self.assertEqual(results, [(0x1234, 0xA3A4E4A5)] * 5)
+        self.assertEqual(self.tusc.tapos.get(), (0x1234, 0xA3A4E4A5))
+        self.assertEqual(self.tusc.rpc.calls, 0)
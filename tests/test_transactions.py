@@ -8,6 +8,7 @@ from binascii import hexlify
 from tusc import TUSC
 from tuscbase import transactions, memo, account, operations, objects
 from tuscbase.objects import Operation
+from tuscbase.serializer import deserialize_transaction, serialize_transaction
 from tuscbase.signedtransactions import Signed_Transaction
 from tuscbase.account import PrivateKey
 from graphenebase.base58 import ripemd160
@@ -38,6 +39,15 @@ class Testcases(unittest.TestCase):
         tx.verify([PrivateKey(wif).pubkey], prefix)
         txWire = hexlify(bytes(tx)).decode("ascii")
 
+        # Compare with the compiled serializer
+        compiled = serialize_transaction(tx.json(), prefix=prefix)
+        self.assertEqual(hexlify(compiled).decode("ascii"), txWire)
+
+        # Decode and serialize again
+        decoded = deserialize_transaction(bytes(tx), prefix=prefix)
+        compiled = serialize_transaction(decoded, prefix=prefix)
+        self.assertEqual(hexlify(compiled).decode("ascii"), txWire)
+
         if printWire:
             print()
             print(txWire)
@@ -1066,6 +1076,10 @@ class Testcases(unittest.TestCase):
         tx = tx.sign([wif], chain=prefix)
         tx.verify([PrivateKey(wif).pubkey], prefix)
         txWire = hexlify(bytes(tx)).decode("ascii")
+
+        # Compare with the compiled serializer
+        compiled = serialize_transaction(tx.json(), prefix=prefix)
+        self.assertEqual(hexlify(compiled).decode("ascii"), txWire)
         print("=" * 80)
         pprint(tx.json())
         print("=" * 80)
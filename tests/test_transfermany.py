@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from graphenecommon.blockchainobject import Caching
+
+from tusc import TUSC
+from tusc.memo import Memo
+from tuscbase.objects import Operation
+
+wif = "5KQwrPbwdL6PhXujxW37FSSQZ1JiwsST4cqQzDeyXtP79zkvFD3"
+pub = "TUSC6MRyAjQq8ud7hVNYcfnVPJqcVpscN5So8BhtHuGYqET5GDW5CV"
+pub2 = "TUSC5vfCLKyXYb44znYjbrJXCyvvx3SuifhmvemnQsdbf61EtoR36z"
+
+
+def account(id, name, memo_key):
+    return {
+        "id": id,
+        "name": name,
+        "options": {"memo_key": memo_key, "votes": []},
+    }
+
+
+accounts = [
+    account("1.2.100", "alice", pub),
+    account("1.2.101", "bob", pub2),
+    account("1.2.102", "carol", pub2),
+]
+asset = {
+    "id": "1.3.0",
+    "symbol": "TUSC",
+    "precision": 5,
+    "issuer": "1.2.0",
+    "options": {"issuer_permissions": 0, "flags": 0, "description": ""},
+}
+
+
+class Node:
+    chain_params = {"chain_id": "00" * 32, "prefix": "TUSC"}
+
+    def __init__(self):
+        self.calls = []
+
+    def lookup_account_names(self, names):
+        self.calls.append(("lookup_account_names", names))
+        by_name = {a["name"]: a for a in accounts}
+        return [by_name.get(name) for name in names]
+
+    def get_objects(self, ids):
+        self.calls.append(("get_objects", ids))
+        by_id = {a["id"]: a for a in accounts}
+        return [by_id.get(id) for id in ids]
+
+    def get_account_by_name(self, name):
+        return self.lookup_account_names([name])[0]
+
+    def get_asset(self, symbol):
+        if symbol not in ("TUSC", "1.3.0"):
+            return None
+        return asset
+
+
+class Builder:
+    """Records the transactions instead of signing and broadcasting."""
+
+    def __init__(self, blockchain_instance=None):
+        self.ops = []
+        blockchain_instance.built.append(self)
+
+    def appendOps(self, ops):
+        self.ops.extend(ops)
+
+    def appendSigner(self, account, permission):
+        pass
+
+    def sign(self):
+        pass
+
+    def broadcast(self):
+        if any(op.json()["amount"]["amount"] == 130000 for op in self.ops):
+            raise ValueError("rejected")
+        return {"operations": len(self.ops)}
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        Caching.clear_cache()
+        self.tusc = TUSC(offline=True, keys=[wif])
+        self.tusc.rpc = Node()
+        self.tusc.transactionbuilder_class = Builder
+        self.tusc.built = []
+
+    def test_batches(self):
+        op_size = len(
+            bytes(
+                Operation(
+                    [
+                        "transfer",
+                        {
+                            "fee": {"amount": 0, "asset_id": "1.3.0"},
+                            "from": "1.2.100",
+                            "to": "1.2.101",
+                            "amount": {"amount": 100000, "asset_id": "1.3.0"},
+                            "prefix": "TUSC",
+                        },
+                    ]
+                )
+            )
+        )
+        results = self.tusc.transfer_many(
+            [("bob", 1, "TUSC")] * 5,
+            account="alice",
+            max_size=self.tusc.transaction_overhead + 2 * op_size,
+        )
+        self.assertEqual([len(tx.ops) for tx in self.tusc.built], [2, 2, 1])
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertEqual(results[4]["transaction"], {"operations": 1})
+        # All recipients are resolved with one request
+        self.assertEqual(
+            self.tusc.rpc.calls,
+            [("lookup_account_names", ["alice"]), ("lookup_account_names", ["bob"])],
+        )
+
+    def test_memo(self):
+        results = self.tusc.transfer_many(
+            [{"to": "1.2.101", "amount": 1, "asset": "TUSC", "memo": "hi"}],
+            account="alice",
+            max_size=2048,
+        )
+        self.assertTrue(results[0]["success"])
+        memo = self.tusc.built[0].ops[0].json()["memo"]
+        self.assertEqual((memo["from"], memo["to"]), (pub, pub2))
+        self.assertEqual(Memo(blockchain_instance=self.tusc).decrypt(memo), "hi")
+
+    def test_errors(self):
+        results = self.tusc.transfer_many(
+            [
+                ("bob", 1, "TUSC"),
+                ("nobody", 1, "TUSC"),
+                ("carol", 1, "FOO"),
+                ("carol", 1.3, "TUSC"),
+            ],
+            account="alice",
+            max_size=self.tusc.transaction_overhead + 1,
+        )
+        self.assertEqual([r["success"] for r in results], [True, False, False, False])
+        self.assertIn("nobody", results[1]["error"])
+        self.assertIsNotNone(results[2]["error"])
+        # A failed broadcast fails the rows of its transaction only
+        self.assertEqual(results[3]["error"], "rejected")
+        self.assertEqual(len(self.tusc.built), 2)
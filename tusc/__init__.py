@@ -7,9 +7,14 @@ __all__ = [
     "account",
     "amount",
     "asset",
+    "assetregistry",
+    "feedanalytics",
+    "margincalls",
     "block",
     "blockchain",
+    "blockstore",
     "dex",
+    "fees",
     "market",
     "storage",
     "price",
@@ -18,5 +23,11 @@ __all__ = [
     "committee",
     "vesting",
     "proposal",
+    "signing",
+    "tapos",
+    "confirmations",
+    "singleflight",
+    "historyindex",
+    "streamprocessor",
     "message",
 ]
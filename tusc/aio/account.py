@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from .amount import Amount
 from .instance import BlockchainInstance
+from .singleflight import lookups
 from graphenecommon.aio.account import (
     Account as GrapheneAccount,
     AccountUpdate as GrapheneAccountUpdate,
@@ -45,6 +46,27 @@ class Account(GrapheneAccount):
         self.amount_class = Amount
         self.operations = operations
 
+    async def refresh(self):
+        """Refresh/Obtain an account's data from the API server.
+
+        Prefetched objects are used if available (see
+        :func:`tusc.tusc.TUSC.prefetch`). Concurrent lookups of the same
+        account through the same instance are merged into a single request.
+        """
+        data = None
+        if not self.full:
+            data = self.blockchain.prefetched("account", self.identifier)
+        if data is None:
+            data = await lookups.do(
+                (self.blockchain, "account", self.identifier, self.full), self._refresh
+            )
+        dict.update(self, data)
+        self._fetched = True
+
+    async def _refresh(self):
+        await super().refresh()
+        return dict(self)
+
     @property
     async def call_positions(self):
         """Alias for :func:tusc.account.Account.callpositions."""
@@ -11,6 +11,8 @@ from tuscbase.asset_permissions import (
 )
 
 from .instance import BlockchainInstance
+from ..exceptions import PagingNotSupported
+from .singleflight import lookups
 from ..asset import Asset as SyncAsset
 
 
@@ -33,6 +35,31 @@ class Asset(GrapheneAsset, SyncAsset):
         except Exception:
             self["description"] = self["options"]["description"]
 
+    async def refresh(self):
+        """Refresh the data from the API server.
+
+        Symbols known to the asset registry are resolved to ids locally.
+        Prefetched objects are used if available (see
+        :func:`tusc.tusc.TUSC.prefetch`). Concurrent lookups of the same
+        asset through the same instance are merged into a single request.
+        """
+        registry = getattr(self.blockchain, "asset_registry", None)
+        if registry and self.identifier in registry:
+            self.identifier = registry.id(self.identifier)
+        data = None
+        if not self.full:
+            data = self.blockchain.prefetched("asset", self.identifier)
+        if data is None:
+            data = await lookups.do(
+                (self.blockchain, "asset", self.identifier, self.full), self._refresh
+            )
+        dict.update(self, data)
+        self._fetched = True
+
+    async def _refresh(self):
+        await GrapheneAsset.refresh(self)
+        return dict(self)
+
     @property
     async def max_market_fee(self):
 
@@ -69,90 +96,190 @@ class Asset(GrapheneAsset, SyncAsset):
     async def calls(self):
         return await self.get_call_orders(10)
 
-    async def get_call_orders(self, limit=100):
-        from .price import Price
+    async def _pages(self, method, page_size):
+        """Yield pages of orders of this asset.
+
+        Async version of :func:`tusc.asset.Asset._pages`
+        """
+        call = getattr(self.blockchain.rpc, method)
+        start = None
+        while True:
+            if start is None:
+                ret = await call(self["id"], page_size)
+            else:
+                ret = await call(self["id"], page_size, start)
+                if not ret or ret[0]["id"] != start:
+                    raise PagingNotSupported(method)
+            page = [order for order in ret if order["id"] != start]
+            if page:
+                yield page
+            if len(ret) < page_size or not page:
+                return
+            start = ret[-1]["id"]
+
+    async def _get_accounts(self, ids):
+        """Resolve many account ids with a single call."""
         from .account import Account
+
+        ids = list(set(ids))
+        r = {}
+        for account in await self.blockchain.rpc.get_objects(ids):
+            if account:
+                r[account["id"]] = await Account(
+                    account, blockchain_instance=self.blockchain
+                )
+        return r
+
+    def iter_call_orders(self, page_size=100, raw=False):
+        """
+        Yield every call order (margin position) of this bitasset.
+
+        Async version of :func:`tusc.asset.Asset.iter_call_orders`
+        """
+        pages = self._pages("get_call_orders", page_size)
+        if raw:
+            return self._flatten(pages)
+        return self._call_orders(pages)
+
+    @staticmethod
+    async def _flatten(pages):
+        try:
+            async for page in pages:
+                for obj in page:
+                    yield obj
+        finally:
+            await pages.aclose()
+
+    async def _call_orders(self, pages):
         from .amount import Amount
         from .market import Market
+        from .price import Price
 
-        assert limit <= 100
         assert self.is_bitasset
         await self.ensure_full()
-        r = []
         bitasset = self["bitasset_data"]
+        backing = await Asset(
+            bitasset["options"]["short_backing_asset"],
+            blockchain_instance=self.blockchain,
+        )
         settlement_price = await Price(
             bitasset["current_feed"]["settlement_price"],
             blockchain_instance=self.blockchain,
         )
-        ret = await self.blockchain.rpc.get_call_orders(self["id"], limit)
-        for call in ret[:limit]:
-            collateral_amount = await Amount(
-                {
-                    "amount": call["collateral"],
-                    "asset_id": call["call_price"]["base"]["asset_id"],
-                },
-                blockchain_instance=self.blockchain,
-            )
-            debt_amount = await Amount(
-                {
-                    "amount": call["debt"],
-                    "asset_id": call["call_price"]["quote"]["asset_id"],
-                },
-                blockchain_instance=self.blockchain,
-            )
-            call_price = float(collateral_amount) / (
-                float(debt_amount)
-                * (bitasset["current_feed"]["maintenance_collateral_ratio"] / 1000)
-            )
-            market = await Market(
-                "{}:{}".format(
-                    bitasset["options"]["short_backing_asset"], self["symbol"]
+        mcr = bitasset["current_feed"]["maintenance_collateral_ratio"] / 1000
+        market = await Market(
+            base=self, quote=backing, blockchain_instance=self.blockchain
+        )
+        latest = float((await market.ticker())["latest"])
+        try:
+            async for page in pages:
+                accounts = await self._get_accounts(
+                    [call["borrower"] for call in page]
                 )
-            )
-            latest = (await market.ticker())["latest"]
-            r.append(
-                {
-                    "account": await Account(
-                        call["borrower"], lazy=True, blockchain_instance=self.blockchain
-                    ),
-                    "collateral": collateral_amount,
-                    "debt": debt_amount,
-                    "call_price": call_price,
-                    "settlement_price": settlement_price,
-                    "ratio": (
-                        float(collateral_amount) / float(debt_amount) * float(latest)
-                    ),
-                }
-            )
+                for call in page:
+                    collateral_amount = await Amount(
+                        int(call["collateral"]) / 10 ** backing["precision"],
+                        backing,
+                        blockchain_instance=self.blockchain,
+                    )
+                    debt_amount = await Amount(
+                        int(call["debt"]) / 10 ** self["precision"],
+                        self,
+                        blockchain_instance=self.blockchain,
+                    )
+                    yield {
+                        "account": accounts.get(call["borrower"], call["borrower"]),
+                        "collateral": collateral_amount,
+                        "debt": debt_amount,
+                        "call_price": float(collateral_amount)
+                        / (float(debt_amount) * mcr),
+                        "settlement_price": settlement_price,
+                        "ratio": (
+                            float(collateral_amount) / float(debt_amount) * latest
+                        ),
+                    }
+        finally:
+            await pages.aclose()
+
+    async def get_call_orders(self, limit=100):
+        if limit <= 100:
+
+            async def pages():
+                yield await self.blockchain.rpc.get_call_orders(self["id"], limit)
+
+            return [call async for call in self._call_orders(pages())]
+        r = []
+        calls = self.iter_call_orders()
+        try:
+            async for call in calls:
+                r.append(call)
+                if len(r) >= limit:
+                    break
+        finally:
+            await calls.aclose()
         return r
 
     @property
     async def settlements(self):
         return await self.get_settle_orders(10)
 
-    async def get_settle_orders(self, limit=100):
+    async def iter_settle_orders(self, page_size=100, raw=False):
+        """
+        Yield every force-settlement order of this bitasset.
+
+        Async version of :func:`tusc.asset.Asset.iter_settle_orders`
+        """
+        assert self.is_bitasset
+        pages = self._pages("get_settle_orders", page_size)
+        try:
+            async for page in pages:
+                if raw:
+                    for settle in page:
+                        yield settle
+                else:
+                    for settle in await self._settle_orders(page):
+                        yield settle
+        finally:
+            await pages.aclose()
+
+    async def _settle_orders(self, settles):
         from .account import Account
         from .amount import Amount
         from ..utils import formatTimeString
 
-        assert limit <= 100
-        assert self.is_bitasset
         r = []
-        ret = await self.blockchain.rpc.get_settle_orders(self["id"], limit)
-        for settle in ret[:limit]:
+        for settle in settles:
             r.append(
                 {
                     "account": await Account(
                         settle["owner"], lazy=True, blockchain_instance=self.blockchain
                     ),
                     "amount": await Amount(
-                        settle["balance"], blockchain_instance=self.blockchain
+                        int(settle["balance"]["amount"]) / 10 ** self["precision"],
+                        self,
+                        blockchain_instance=self.blockchain,
                     ),
                     "date": formatTimeString(settle["settlement_date"]),
                 }
             )
         return r
 
+    async def get_settle_orders(self, limit=100):
+        assert self.is_bitasset
+        if limit <= 100:
+            ret = await self.blockchain.rpc.get_settle_orders(self["id"], limit)
+            return await self._settle_orders(ret[:limit])
+        r = []
+        settles = self.iter_settle_orders()
+        try:
+            async for settle in settles:
+                r.append(settle)
+                if len(r) >= limit:
+                    break
+        finally:
+            await settles.aclose()
+        return r
+
     async def halt(self):
         """Halt this asset from being moved or traded."""
         from .account import Account
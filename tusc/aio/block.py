@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from .instance import BlockchainInstance
+from ..exceptions import BlockDoesNotExistsException
 from ..block import Block as SyncBlock, BlockHeader as SyncBlockHeader
 from graphenecommon.aio.block import (
     Block as GrapheneBlock,
@@ -29,7 +30,25 @@ class Block(GrapheneBlock, SyncBlock):
         print(block)
     """
 
-    pass
+    async def refresh(self):
+        """Even though blocks never change, you freshly obtain its contents
+        from an API with this method
+        """
+        store = getattr(self.blockchain, "block_store", None)
+        if store is None or not isinstance(self.identifier, int):
+            return await super().refresh()
+        identifier = self.identifier
+        block = store.get(identifier)
+        if block is None:
+            block = await self.blockchain.rpc.get_block(identifier)
+            if not block:
+                raise BlockDoesNotExistsException
+            if await self.blockchain.is_irreversible(identifier):
+                store.put(identifier, block)
+        await super(GrapheneBlock, self).__init__(
+            block, blockchain_instance=self.blockchain, use_cache=self._use_cache
+        )
+        self.identifier = identifier
 
 
 @BlockchainInstance.inject
@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
+import asyncio
+
+from collections import deque
+
 from .block import Block
 from .instance import BlockchainInstance
+from ..blockchain import block_operations, operation_ids
+from ..exceptions import BlockDoesNotExistsException
 from tuscbase import operationids
 from graphenecommon.aio.blockchain import Blockchain as GrapheneBlockchain
 
@@ -23,3 +29,101 @@ class Blockchain(GrapheneBlockchain):
     def define_classes(self):
         self.block_class = Block
         self.operationids = operationids
+
+    async def wait_for_and_get_block(self, block_number, blocks_waiting_for=None):
+        """Get the desired block from the chain, waiting for it if needed.
+
+        Async version of
+        :func:`tusc.blockchain.Blockchain.wait_for_and_get_block`.
+        """
+        block = self._stored(block_number)
+        if block is None:
+            block = await super().wait_for_and_get_block(
+                block_number, blocks_waiting_for
+            )
+            await self._store(block_number, block)
+        return block
+
+    def _stored(self, block_num):
+        """Block from the block store, ``None`` if not stored."""
+        store = getattr(self.blockchain, "block_store", None)
+        if store is not None:
+            return store.get(block_num)
+
+    async def _store(self, block_num, block):
+        """Add a block to the block store if it is irreversible."""
+        store = getattr(self.blockchain, "block_store", None)
+        if (
+            store is not None
+            and block
+            and await self.blockchain.is_irreversible(block_num)
+        ):
+            store.put(block_num, block)
+
+    async def _get_block(self, block_num):
+        block = self._stored(block_num)
+        if block is None:
+            block = await self.blockchain.rpc.get_block(block_num)
+            await self._store(block_num, block)
+        return block
+
+    async def stream(self, opNames=[], *args, fields=None, **kwargs):
+        """Yield specific operations (e.g. transfers) only
+
+        :param array opNames: List of operations (names or ids) to filter for
+        :param list fields: Fields of the operations to yield (defaults to
+            all)
+        :param int start: Start at this block
+        :param int stop: Stop at this block
+        :param str mode: We here have the choice between
+             * "head": the last block
+             * "irreversible": the block that is confirmed by 2/3 of all
+                block producers and is thus irreversible!
+
+        The dict output is formated such that ``type`` caries the
+        operation type, timestamp and block_num are taken from the
+        block the operation was stored in and the other key depend
+        on the actualy operation.
+
+        Async version of :func:`tusc.blockchain.Blockchain.stream`.
+        """
+        op_ids = operation_ids(opNames)
+        async for block in self.blocks(**kwargs):
+            for _, _, r in block_operations(block, op_ids, fields):
+                yield r
+
+    async def _block(self, block_num, block):
+        """Wrap a block as obtained from the API like :func:`blocks` does."""
+        if not block:
+            raise BlockDoesNotExistsException(block_num)
+        block = await self.block_class(block, blockchain_instance=self.blockchain)
+        block.update({"id": str(block_num), "block_num": block_num})
+        block.identifier = block_num
+        return block
+
+    async def fetch_range(self, start, stop, concurrency=8):
+        """Yields the blocks from ``start`` to ``stop`` (inclusive) in order.
+
+        :param int start: First block
+        :param int stop: Last block, must not be ahead of the head block
+        :param int concurrency: Number of blocks requested at the same time
+
+        Async version of :func:`tusc.blockchain.Blockchain.fetch_range`: up
+        to ``concurrency`` requests are in flight as tasks on the
+        connection of the instance, blocks are yielded in order.
+        """
+        pending = deque()
+        try:
+            for block_num in range(start, stop + 1):
+                task = asyncio.ensure_future(self._get_block(block_num))
+                pending.append((block_num, task))
+                if len(pending) < concurrency:
+                    continue
+                block_num, task = pending.popleft()
+                yield await self._block(block_num, await task)
+            while pending:
+                block_num, task = pending.popleft()
+                yield await self._block(block_num, await task)
+        finally:
+            for _, task in pending:
+                task.cancel()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+
+from .instance import BlockchainInstance
+from ..confirmations import ConfirmationTracker as SyncConfirmationTracker
+from ..exceptions import TransactionExpired
+
+log = logging.getLogger(__name__)
+
+
+class ConfirmationTracker(BlockchainInstance, SyncConfirmationTracker):
+    """
+    Waits for many transactions to be included in blocks.
+
+    Async version of :class:`tusc.confirmations.ConfirmationTracker`. The
+    blocks are followed by a task and :func:`track` returns an
+    :class:`asyncio.Future`. Expired transactions are searched by tasks of
+    their own, fetching :attr:`search_batch` blocks at a time.
+    """
+
+    #: Blocks fetched at once when searching for an expired transaction
+    search_batch = 20
+
+    def __init__(self, mode="irreversible", **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        SyncConfirmationTracker.__init__(self, mode=mode, **kwargs)
+        self._searches = set()
+
+    async def _scan(self):
+        from .blockchain import Blockchain
+
+        try:
+            chain = await Blockchain(
+                mode=self.mode, blockchain_instance=self.blockchain
+            )
+            start = max(1, await chain.get_current_block_num() - self.lookback)
+            async for block in chain.blocks(start=start):
+                more, expired = self._process(block)
+                for args in expired:
+                    self._start_search(args)
+                if not more:
+                    return
+        except Exception as e:
+            log.exception("Failed to follow the blocks")
+            self._fail(e)
+
+    async def _search(self, tx_id, futures, expiration, blocks, broadcast):
+        """Search the ``blocks`` for an expired transaction before failing
+        it."""
+        try:
+            for i in range(0, len(blocks), self.search_batch):
+                batch = blocks[i : i + self.search_batch]
+                fetched = await asyncio.gather(
+                    *[self.blockchain.rpc.get_block(num) for num in batch]
+                )
+                for block_num, block in zip(batch, fetched):
+                    if block and broadcast and block["timestamp"] < broadcast:
+                        break
+                    confirmation = self._found(tx_id, block_num, block)
+                    if confirmation:
+                        return self._resolve(futures, confirmation)
+                else:
+                    continue
+                break
+        except Exception as e:
+            log.exception("Failed to search for %s", tx_id)
+            return self._resolve(futures, error=e)
+        error = TransactionExpired("Transaction %s expired at %s" % (tx_id, expiration))
+        self._resolve(futures, error=error)
+
+    def _start_search(self, args):
+        """Search for an expired transaction in a task of its own, so the
+        other pending transactions are not held up."""
+        task = asyncio.ensure_future(self._search(*args))
+        self._searches.add(task)
+        task.add_done_callback(self._searches.discard)
+
+    def track(self, tx, expiration=None, broadcast=None):
+        """
+        Wait for a transaction to be included in a block.
+
+        :param tx: Transaction (as returned when broadcasting) or its id
+        :param expiration: Expiration of a transaction given by id
+        :param broadcast: Time the transaction was broadcast
+        :returns: An :class:`asyncio.Future` of the confirmation
+
+        See :func:`tusc.confirmations.ConfirmationTracker.track`.
+        """
+        future = asyncio.get_event_loop().create_future()
+        with self._lock:
+            registered = self._register(tx, future, expiration, broadcast)
+            if registered and self._thread is None:
+                self._thread = asyncio.ensure_future(self._scan())
+        return future
+
+    async def wait(self, tx, timeout=None, **kwargs):
+        """Track a transaction and wait for its confirmation."""
+        return await asyncio.wait_for(self.track(tx, **kwargs), timeout)
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import asyncio
+
 # from .storage import config
 from tuscbase import operations
 
@@ -43,22 +45,9 @@ class Dex(BlockchainInstance):
             10000000.0}, 'assert': {'fee': 20000.0},
             'committee_member_create': {'fee': 100000000.0}}
         """
-        from tuscbase.operations import operations
-
-        r = {}
-        obj, base = await self.blockchain.rpc.get_objects(["2.0.0", "1.3.0"])
-        fees = obj["parameters"]["current_fees"]["parameters"]
-        scale = float(obj["parameters"]["current_fees"]["scale"])
-        for f in fees:
-            op_name = "unknown %d" % f[0]
-            for name in operations:
-                if operations[name] == f[0]:
-                    op_name = name
-            fs = f[1]
-            for _type in fs:
-                fs[_type] = float(fs[_type]) * scale / 1e4 / 10 ** base["precision"]
-            r[op_name] = fs
-        return r
+        fee_schedule = self.blockchain.fee_schedule
+        await fee_schedule.ensure()
+        return fee_schedule.as_dict()
 
     async def list_debt_positions(self, account=None):
         """
@@ -81,22 +70,36 @@ class Dex(BlockchainInstance):
         if not account:
             raise ValueError("You need to provide an account")
         account = await Account(account, full=True, blockchain_instance=self.blockchain)
+        debts = account.get("call_orders")
+        assets = await self._get_full_assets(
+            [
+                debt["call_price"][side]["asset_id"]
+                for debt in debts
+                for side in ["base", "quote"]
+            ]
+        )
+
+        # Obtain one ticker per distinct pair, concurrently
+        pairs = sorted(
+            {
+                (
+                    debt["call_price"]["base"]["asset_id"],
+                    debt["call_price"]["quote"]["asset_id"],
+                )
+                for debt in debts
+            }
+        )
+        tickers = await asyncio.gather(
+            *[self._latest(assets[base], assets[quote]) for base, quote in pairs]
+        )
+        tickers = dict(zip(pairs, tickers))
 
         r = {}
-        for debt in account.get("call_orders"):
-            base = await Asset(
-                debt["call_price"]["base"]["asset_id"],
-                full=True,
-                blockchain_instance=self.blockchain,
-            )
-            quote = await Asset(
-                debt["call_price"]["quote"]["asset_id"],
-                full=True,
-                blockchain_instance=self.blockchain,
-            )
+        for debt in debts:
+            base = assets[debt["call_price"]["base"]["asset_id"]]
+            quote = assets[debt["call_price"]["quote"]["asset_id"]]
             if not quote.is_bitasset:
                 continue
-            await quote.ensure_full()
             bitasset = quote["bitasset_data"]
             settlement_price = await Price(
                 bitasset["current_feed"]["settlement_price"],
@@ -105,15 +108,20 @@ class Dex(BlockchainInstance):
             if not settlement_price:
                 continue
             collateral_amount = await Amount(
-                {"amount": debt["collateral"], "asset": base}
+                int(debt["collateral"]) / 10 ** base["precision"],
+                base,
+                blockchain_instance=self.blockchain,
+            )
+            debt_amount = await Amount(
+                int(debt["debt"]) / 10 ** quote["precision"],
+                quote,
+                blockchain_instance=self.blockchain,
             )
-            debt_amount = await Amount({"amount": debt["debt"], "asset": quote})
             call_price = float(collateral_amount) / (
                 float(debt_amount)
                 * (bitasset["current_feed"]["maintenance_collateral_ratio"] / 1000)
             )
-            market = await Market("{}:{}".format(base["symbol"], quote["symbol"]))
-            latest = (await market.ticker())["latest"]
+            latest = tickers[(base["id"], quote["id"])]
             r[quote["symbol"]] = {
                 "collateral": collateral_amount,
                 "debt": debt_amount,
@@ -123,6 +131,44 @@ class Dex(BlockchainInstance):
             }
         return r
 
+    async def _latest(self, base, quote):
+        if not quote.is_bitasset:
+            return None
+        market = await Market(
+            base=quote, quote=base, blockchain_instance=self.blockchain
+        )
+        return (await market.ticker())["latest"]
+
+    async def _get_full_assets(self, ids):
+        """Obtain many fully loaded assets with two ``get_objects`` calls.
+
+        Async version of :func:`tusc.dex.Dex._get_full_assets`
+        """
+        ids = sorted(set(ids))
+        if not ids:
+            return {}
+        assets = [a for a in await self.blockchain.rpc.get_objects(ids) if a]
+        data_ids = [a["dynamic_asset_data_id"] for a in assets]
+        data_ids.extend(
+            [a["bitasset_data_id"] for a in assets if "bitasset_data_id" in a]
+        )
+        data = {
+            obj["id"]: obj
+            for obj in await self.blockchain.rpc.get_objects(data_ids)
+            if obj
+        }
+        for asset in assets:
+            asset["dynamic_asset_data"] = data.get(asset["dynamic_asset_data_id"])
+            if "bitasset_data_id" in asset:
+                asset["bitasset_data"] = data.get(asset["bitasset_data_id"])
+        assets = await asyncio.gather(
+            *[
+                Asset(asset, full=True, blockchain_instance=self.blockchain)
+                for asset in assets
+            ]
+        )
+        return {asset["id"]: asset for asset in assets}
+
     async def close_debt_position(self, symbol, account=None):
         """
         Close a debt position and reclaim the collateral.
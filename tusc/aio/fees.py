@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import time
+
+from .instance import BlockchainInstance
+from ..fees import FeeSchedule as SyncFeeSchedule
+
+
+class FeeSchedule(BlockchainInstance, SyncFeeSchedule):
+    """
+    Fee schedule of the chain, indexed by operation id.
+
+    Async version of :class:`tusc.fees.FeeSchedule`. Since lookups are
+    synchronous, call :func:`ensure` before using them:
+
+    .. code-block:: python
+
+        fee_schedule = tusc.fee_schedule
+        await fee_schedule.ensure()
+        fee_schedule.fee("transfer")
+    """
+
+    def __init__(self, *args, **kwargs):
+        BlockchainInstance.__init__(self, *args, **kwargs)
+        SyncFeeSchedule.__init__(self, *args, **kwargs)
+
+    async def refresh(self):
+        """Load the fee schedule from the node."""
+        rpc = self.blockchain.rpc
+        parameters, core = await rpc.get_objects(["2.0.0", "1.3.0"])
+        self.set(parameters, core["precision"])
+        self._set_version(await rpc.get_dynamic_global_properties())
+
+    async def ensure(self):
+        """Load the fee schedule or reload it if it may have changed."""
+        if not self.loaded:
+            await self.refresh()
+        elif time.time() - self._checked > self.check_interval:
+            dgp = await self.blockchain.rpc.get_dynamic_global_properties()
+            if self._is_current(dgp):
+                self._checked = time.time()
+            else:
+                await self.refresh()
+
+    def _ensure(self):
+        if not self.loaded:
+            raise RuntimeError("Fee schedule not loaded, await ensure() first")
@@ -512,21 +512,26 @@ class Market(SyncMarket):
             }
         )
 
-        if returnOrderId:
-            # Make blocking broadcasts
-            prevblocking = self.blockchain.blocking
-            self.blockchain.blocking = returnOrderId
-
         tx = await self.blockchain.finalizeOp(
             order, account["name"], "active", **kwargs
         )
 
-        if returnOrderId and tx.get("operation_results"):
-            tx["orderid"] = tx["operation_results"][0][1]
-            self.blockchain.blocking = prevblocking
+        if returnOrderId:
+            await self._add_order_id(tx, returnOrderId)
 
         return tx
 
+    async def _add_order_id(self, tx, mode):
+        """Wait for a broadcast order to be included in a ``head`` or
+        ``irreversible`` block and add its id as ``orderid``."""
+        if "operation_results" not in tx:
+            if self.blockchain.nobroadcast or not tx.get("signatures"):
+                return
+            mode = "irreversible" if mode == "irreversible" else "head"
+            tracker = self.blockchain.confirmations(mode)
+            tx.update(await tracker.wait(tx, timeout=tracker.timeout(tx)))
+        tx["orderid"] = tx["operation_results"][0][1]
+
     async def sell(
         self,
         price,
@@ -605,18 +610,12 @@ class Market(SyncMarket):
                 "fill_or_kill": killfill,
             }
         )
-        if returnOrderId:
-            # Make blocking broadcasts
-            prevblocking = self.blockchain.blocking
-            self.blockchain.blocking = returnOrderId
-
         tx = await self.blockchain.finalizeOp(
             order, account["name"], "active", **kwargs
         )
 
         if returnOrderId:
-            tx["orderid"] = tx["operation_results"][0][1]
-            self.blockchain.blocking = prevblocking
+            await self._add_order_id(tx, returnOrderId)
 
         return tx
 
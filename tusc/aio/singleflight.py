@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+
+class SingleFlight:
+    """
+    Merges concurrent calls with the same key into one.
+
+    Async version of :class:`tusc.singleflight.SingleFlight`: coroutines
+    awaiting :func:`do` with a key while a call is in flight share its
+    result.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    def __len__(self):
+        return len(self._calls)
+
+    async def do(self, key, fn, *args, **kwargs):
+        """Await ``fn(*args, **kwargs)`` unless a call with ``key`` is in
+        flight, return its result."""
+        future = self._calls.get(key)
+        if future is None:
+            future = self._calls[key] = asyncio.ensure_future(fn(*args, **kwargs))
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(future)
+
+
+#: Lookups of blockchain objects in flight, shared by all instances
+lookups = SingleFlight()
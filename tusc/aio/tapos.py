@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from .instance import BlockchainInstance
+from ..tapos import TaposCache as SyncTaposCache, block_params
+
+
+class TaposCache(BlockchainInstance, SyncTaposCache):
+    """
+    Reference block (TaPoS) parameters of transactions, shared by the
+    transaction builders.
+
+    Async version of :class:`tusc.tapos.TaposCache`, sharing its
+    parameters with the synchronous instances.
+    """
+
+    def __init__(self, *args, **kwargs):
+        BlockchainInstance.__init__(self, *args, **kwargs)
+        self._fetching = None
+
+    async def fetch(self):
+        """Obtain the parameters from the node (bypasses the cache)."""
+        rpc = self.blockchain.rpc
+        dgp = await rpc.get_dynamic_global_properties()
+        if self.use_head_block:
+            return block_params(dgp["head_block_number"], dgp["head_block_id"])
+        block_num = int(dgp["last_irreversible_block_num"])
+        block = await rpc.get_block_header(block_num + 1)
+        return block_params(block_num, block["previous"])
+
+    async def _fetch(self, key):
+        try:
+            return self._store(key, *await self.fetch())
+        finally:
+            self._fetching = None
+
+    async def get(self):
+        """Return ``(ref_block_num, ref_block_prefix)``, fetched from the
+        node if not cached or older than :attr:`refresh_interval`."""
+        key = self.key
+        params = self._cached(key)
+        if params:
+            return params
+        # Coroutines that miss the cache at once wait for the same request
+        if self._fetching is None:
+            self._fetching = asyncio.ensure_future(self._fetch(key))
+        return await asyncio.shield(self._fetching)
@@ -6,7 +6,7 @@ from graphenecommon.aio.transactionbuilder import (
 
 from tuscbase import operations, transactions
 from tuscbase.account import PrivateKey, PublicKey
-from tuscbase.objects import Operation
+from tuscbase.objects import Asset as AssetAmount, Operation
 from tuscbase.signedtransactions import Signed_Transaction
 
 from .amount import Amount
@@ -55,3 +55,51 @@ class TransactionBuilder(GrapheneTransactionBuilder):
         self.publickey_class = PublicKey
         self.signed_transaction_class = Signed_Transaction
         self.amount_class = Amount
+
+    #: Compute the fees of common operations locally (see
+    #: :func:`tusc.fees.FeeSchedule.calculate`)
+    compute_fees_locally = True
+
+    async def add_required_fees(self, ops, asset_id="1.3.0"):
+        """Obtain the required fees for a set of operations.
+
+        Async version of
+        :func:`tusc.transactionbuilder.TransactionBuilder.add_required_fees`
+        """
+        remaining = ops
+        if self.compute_fees_locally and asset_id == "1.3.0":
+            fee_schedule = self.blockchain.fee_schedule
+            await fee_schedule.ensure()
+            remaining = self._add_local_fees(fee_schedule, ops)
+        if remaining:
+            await super().add_required_fees(remaining, asset_id=asset_id)
+        return ops
+
+    def _add_local_fees(self, fee_schedule, ops):
+        remaining = []
+        for op in ops:
+            fee = fee_schedule.calculate(op)
+            if fee is None:
+                remaining.append(op)
+            else:
+                op.op.data["fee"] = AssetAmount(amount=fee, asset_id="1.3.0")
+        return remaining
+
+    async def get_block_params(self, use_head_block=False):
+        """Obtain ``ref_block_num`` and ``ref_block_prefix``.
+
+        Async version of
+        :func:`tusc.transactionbuilder.TransactionBuilder.get_block_params`
+        """
+        if use_head_block:
+            return await super().get_block_params(use_head_block=True)
+        return await self.blockchain.tapos.get()
+
+    async def broadcast(self):
+        """Broadcast the transaction, a failure invalidates the shared
+        reference block parameters."""
+        try:
+            return await super().broadcast()
+        except Exception:
+            self.blockchain.tapos.invalidate()
+            raise
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import logging
 
 from datetime import datetime, timedelta
@@ -59,6 +60,122 @@ class TUSC(AbstractGrapheneChain, SyncTUSC):
         self.transactionbuilder_class = TransactionBuilder
         self.blockchainobject_class = BlockchainObject
 
+    # -------------------------------------------------------------------------
+    # Block store
+    # -------------------------------------------------------------------------
+    async def is_irreversible(self, block_num):
+        """
+        Tell whether a block is irreversible.
+
+        Async version of :func:`tusc.tusc.TUSC.is_irreversible`
+        """
+        if block_num > self._irreversible_block_num:
+            props = await self.rpc.get_dynamic_global_properties()
+            self._irreversible_block_num = props["last_irreversible_block_num"]
+        return block_num <= self._irreversible_block_num
+
+    # -------------------------------------------------------------------------
+    # Prefetching
+    # -------------------------------------------------------------------------
+    async def prefetch(self, accounts=None, assets=None):
+        """
+        Load accounts and assets for the lookups that follow.
+
+        Async version of :func:`tusc.tusc.TUSC.prefetch`
+        """
+        names, ids, assets = self._uncached(accounts, assets)
+        requests = []
+        for method, keys in [
+            ("lookup_account_names", names),
+            ("get_objects", ids),
+            ("lookup_asset_symbols", assets),
+        ]:
+            for i in range(0, len(keys), self.lookup_page_size):
+                chunk = keys[i : i + self.lookup_page_size]
+                requests.append(getattr(self.rpc, method)(chunk))
+        results = await asyncio.gather(*requests)
+        return self._cache_objects([obj for objects in results for obj in objects])
+
+    # -------------------------------------------------------------------------
+    # Fees
+    # -------------------------------------------------------------------------
+    @property
+    def fee_schedule(self):
+        """
+        Fee schedule shared by everything that uses this instance.
+
+        :returns: Instance of :class:`tusc.aio.fees.FeeSchedule`
+        """
+        if self._fee_schedule is None:
+            from .fees import FeeSchedule
+
+            self._fee_schedule = FeeSchedule(blockchain_instance=self)
+        return self._fee_schedule
+
+    # -------------------------------------------------------------------------
+    # Reference blocks
+    # -------------------------------------------------------------------------
+    @property
+    def tapos(self):
+        """
+        Reference block (TaPoS) parameters shared by the transaction
+        builders of this instance.
+
+        :returns: Instance of :class:`tusc.aio.tapos.TaposCache`
+        """
+        if self._tapos is None:
+            from .tapos import TaposCache
+
+            self._tapos = TaposCache(blockchain_instance=self)
+        return self._tapos
+
+    # -------------------------------------------------------------------------
+    # Confirmations
+    # -------------------------------------------------------------------------
+    def confirmations(self, mode="irreversible"):
+        """
+        Tracker of the confirmations of broadcast transactions, shared by
+        everything that uses this instance.
+
+        :param str mode: ``head`` or ``irreversible``
+        :returns: Instance of :class:`tusc.aio.confirmations.ConfirmationTracker`
+        """
+        if self._confirmation_trackers is None:
+            self._confirmation_trackers = {}
+        if mode not in self._confirmation_trackers:
+            from .confirmations import ConfirmationTracker
+
+            self._confirmation_trackers[mode] = ConfirmationTracker(
+                mode=mode, blockchain_instance=self
+            )
+        return self._confirmation_trackers[mode]
+
+    # -------------------------------------------------------------------------
+    # Parallel signing
+    # -------------------------------------------------------------------------
+    async def sign_many(self, txs, pool=None):
+        """
+        Sign many transactions on a pool of processes.
+
+        Async version of :func:`tusc.tusc.TUSC.sign_many`
+        """
+        from ..signing import (
+            SigningPool,
+            builder_chain,
+            finish_builder,
+            prepare_builder,
+        )
+
+        await asyncio.gather(*[tx.constructTx() for tx in txs])
+        jobs = [prepare_builder(tx) for tx in txs]
+        chain = builder_chain(txs[0]) if txs else None
+        if pool is None:
+            with SigningPool() as pool:
+                await pool.sign_each_async(jobs, chain=chain)
+        else:
+            await pool.sign_each_async(jobs, chain=chain)
+        return [finish_builder(tx) for tx in txs]
+
     # -------------------------------------------------------------------------
     # Simple Transfer
     # -------------------------------------------------------------------------
@@ -197,11 +314,24 @@ class TUSC(AbstractGrapheneChain, SyncTUSC):
         except Exception:
             pass
 
+        # Resolve the other accounts with a single request
+        await self.prefetch(
+            accounts=[
+                referrer,
+                registrar,
+                owner_account,
+                active_account,
+                proxy_account or "proxy-to-self",
+            ]
+            + additional_owner_accounts
+            + additional_active_accounts
+        )
+
         referrer = await Account(referrer, blockchain_instance=self)
         registrar = await Account(registrar, blockchain_instance=self)
 
         " Generate new keys from password"
-        from tuscbase.account import PasswordKey, PublicKey
+        from tuscbase.account import PasswordKey, public_key
 
         owner_key_authority = []
         active_key_authority = []
@@ -225,14 +355,14 @@ class TUSC(AbstractGrapheneChain, SyncTUSC):
             active_key_authority = [[format(active_pubkey, self.prefix), 1]]
             memo = format(memo_pubkey, self.prefix)
         elif owner_key and active_key and memo_key:
-            active_pubkey = PublicKey(active_key, prefix=self.prefix)
-            owner_pubkey = PublicKey(owner_key, prefix=self.prefix)
-            memo_pubkey = PublicKey(memo_key, prefix=self.prefix)
+            active_pubkey = public_key(active_key, prefix=self.prefix)
+            owner_pubkey = public_key(owner_key, prefix=self.prefix)
+            memo_pubkey = public_key(memo_key, prefix=self.prefix)
             owner_key_authority = [[format(owner_pubkey, self.prefix), 1]]
             active_key_authority = [[format(active_pubkey, self.prefix), 1]]
             memo = format(memo_pubkey, self.prefix)
         elif owner_account and active_account and memo_key:
-            memo_pubkey = PublicKey(memo_key, prefix=self.prefix)
+            memo_pubkey = public_key(memo_key, prefix=self.prefix)
             memo = format(memo_pubkey, self.prefix)
             owner_account = await Account(owner_account, blockchain_instance=self)
             active_account = await Account(active_account, blockchain_instance=self)
@@ -246,10 +376,10 @@ class TUSC(AbstractGrapheneChain, SyncTUSC):
 
         # additional authorities
         for k in additional_owner_keys:
-            PublicKey(k, prefix=self.prefix)
+            public_key(k, prefix=self.prefix)
             owner_key_authority.append([k, 1])
         for k in additional_active_keys:
-            PublicKey(k, prefix=self.prefix)
+            public_key(k, prefix=self.prefix)
             active_key_authority.append([k, 1])
         for k in additional_owner_accounts:
             addaccount = Account(k, blockchain_instance=self)
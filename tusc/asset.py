@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import itertools
 import json
 
 from tuscbase import operations
@@ -9,8 +10,9 @@ from tuscbase.asset_permissions import (
     todict,
 )
 from .blockchainobject import BlockchainObject
-from .exceptions import AssetDoesNotExistsException
+from .exceptions import AssetDoesNotExistsException, PagingNotSupported
 from .instance import BlockchainInstance
+from .singleflight import lookups
 
 from graphenecommon.asset import Asset as GrapheneAsset
 
@@ -47,6 +49,31 @@ class Asset(GrapheneAsset):
         except Exception:
             self["description"] = self["options"]["description"]
 
+    def refresh(self):
+        """Refresh the data from the API server.
+
+        Symbols known to the asset registry are resolved to ids locally.
+        Prefetched objects are used if available (see
+        :func:`tusc.tusc.TUSC.prefetch`). Concurrent lookups of the same
+        asset through the same instance are merged into a single request.
+        """
+        registry = getattr(self.blockchain, "asset_registry", None)
+        if registry and self.identifier in registry:
+            self.identifier = registry.id(self.identifier)
+        data = None
+        if not self.full:
+            data = self.blockchain.prefetched("asset", self.identifier)
+        if data is None:
+            data = lookups.do(
+                (self.blockchain, "asset", self.identifier, self.full), self._refresh
+            )
+        dict.update(self, data)
+        self._fetched = True
+
+    def _refresh(self):
+        super().refresh()
+        return dict(self)
+
     @property
     def market_fee_percent(self):
         return self["options"]["market_fee_percent"] / 100 / 100
@@ -86,88 +113,172 @@ class Asset(GrapheneAsset):
     def calls(self):
         return self.get_call_orders(10)
 
-    def get_call_orders(self, limit=100):
-        from .price import Price
+    def _pages(self, method, page_size):
+        """Yield pages of orders of this asset.
+
+        ``method`` (``get_call_orders`` or ``get_settle_orders``) returns
+        the orders in the sequence they are matched in. Further pages are
+        requested with the id of the last order as start id, which the
+        node includes in its response again. This depends on the optional
+        ``start`` argument of these calls in the database API, a node that
+        ignores it returns the first page again and
+        :class:`tusc.exceptions.PagingNotSupported` is raised.
+        """
+        call = getattr(self.blockchain.rpc, method)
+        start = None
+        while True:
+            if start is None:
+                ret = call(self["id"], page_size)
+            else:
+                ret = call(self["id"], page_size, start)
+                if not ret or ret[0]["id"] != start:
+                    raise PagingNotSupported(method)
+            page = [order for order in ret if order["id"] != start]
+            if page:
+                yield page
+            if len(ret) < page_size or not page:
+                return
+            start = ret[-1]["id"]
+
+    def _get_accounts(self, ids):
+        """Resolve many account ids with a single call."""
         from .account import Account
+
+        ids = list(set(ids))
+        return {
+            account["id"]: Account(account, blockchain_instance=self.blockchain)
+            for account in self.blockchain.rpc.get_objects(ids)
+            if account
+        }
+
+    def iter_call_orders(self, page_size=100, raw=False):
+        """
+        Yield every call order (margin position) of this bitasset.
+
+        :param int page_size: Number of orders obtained per call
+        :param bool raw: Yield the raw call order objects (``1.8.x``)
+            instead of building accounts and amounts
+
+        Call orders are yielded from earliest to latest to be called. The
+        latest market price is obtained once and the borrowers of each
+        page are resolved with a single call.
+        """
+        pages = self._pages("get_call_orders", page_size)
+        if raw:
+            return (call for page in pages for call in page)
+        return self._call_orders(pages)
+
+    def _call_orders(self, pages):
         from .amount import Amount
         from .market import Market
+        from .price import Price
 
-        assert limit <= 100
         assert self.is_bitasset
         self.ensure_full()
-        r = []
         bitasset = self["bitasset_data"]
+        backing = Asset(
+            bitasset["options"]["short_backing_asset"],
+            blockchain_instance=self.blockchain,
+        )
         settlement_price = Price(
             bitasset["current_feed"]["settlement_price"],
             blockchain_instance=self.blockchain,
         )
-        ret = self.blockchain.rpc.get_call_orders(self["id"], limit)
-        for call in ret[:limit]:
-            collateral_amount = Amount(
-                {
-                    "amount": call["collateral"],
-                    "asset_id": call["call_price"]["base"]["asset_id"],
-                },
-                blockchain_instance=self.blockchain,
-            )
-            debt_amount = Amount(
-                {
-                    "amount": call["debt"],
-                    "asset_id": call["call_price"]["quote"]["asset_id"],
-                },
-                blockchain_instance=self.blockchain,
-            )
-            call_price = collateral_amount / (
-                debt_amount
-                * (bitasset["current_feed"]["maintenance_collateral_ratio"] / 1000)
-            )
-            latest = Market(
-                "{}:{}".format(
-                    bitasset["options"]["short_backing_asset"], self["symbol"]
+        mcr = bitasset["current_feed"]["maintenance_collateral_ratio"] / 1000
+        latest = float(
+            Market(base=self, quote=backing, blockchain_instance=self.blockchain)
+            .ticker()["latest"]
+        )
+        for page in pages:
+            accounts = self._get_accounts([call["borrower"] for call in page])
+            for call in page:
+                collateral_amount = Amount(
+                    int(call["collateral"]) / 10 ** backing["precision"],
+                    backing,
+                    blockchain_instance=self.blockchain,
                 )
-            ).ticker()["latest"]
-            r.append(
-                {
-                    "account": Account(
-                        call["borrower"], lazy=True, blockchain_instance=self.blockchain
-                    ),
+                debt_amount = Amount(
+                    int(call["debt"]) / 10 ** self["precision"],
+                    self,
+                    blockchain_instance=self.blockchain,
+                )
+                yield {
+                    "account": accounts.get(call["borrower"], call["borrower"]),
                     "collateral": collateral_amount,
                     "debt": debt_amount,
-                    "call_price": call_price,
+                    "call_price": collateral_amount / (debt_amount * mcr),
                     "settlement_price": settlement_price,
                     "ratio": (
-                        float(collateral_amount) / float(debt_amount) * float(latest)
+                        float(collateral_amount) / float(debt_amount) * latest
                     ),
                 }
-            )
-        return r
+
+    def get_call_orders(self, limit=100):
+        """
+        List call orders (margin positions) of this bitasset.
+
+        :param int limit: Maximum number of call orders to return
+
+        Call orders are returned from earliest to latest to be called.
+        """
+        if limit <= 100:
+            ret = self.blockchain.rpc.get_call_orders(self["id"], limit)
+            return list(self._call_orders([ret]))
+        return list(itertools.islice(self.iter_call_orders(), limit))
 
     @property
     def settlements(self):
         return self.get_settle_orders(10)
 
-    def get_settle_orders(self, limit=100):
+    def iter_settle_orders(self, page_size=100, raw=False):
+        """
+        Yield every force-settlement order of this bitasset.
+
+        :param int page_size: Number of orders obtained per call
+        :param bool raw: Yield the raw settlement objects (``1.4.x``)
+            instead of building accounts and amounts
+
+        Settle orders are yielded from earliest to latest settlement date.
+        """
+        assert self.is_bitasset
+        pages = self._pages("get_settle_orders", page_size)
+        for page in pages:
+            if raw:
+                for settle in page:
+                    yield settle
+            else:
+                for settle in self._settle_orders(page):
+                    yield settle
+
+    def _settle_orders(self, settles):
         from .account import Account
         from .amount import Amount
         from .utils import formatTimeString
 
-        assert limit <= 100
+        for settle in settles:
+            yield {
+                "account": Account(
+                    settle["owner"], lazy=True, blockchain_instance=self.blockchain
+                ),
+                "amount": Amount(
+                    int(settle["balance"]["amount"]) / 10 ** self["precision"],
+                    self,
+                    blockchain_instance=self.blockchain,
+                ),
+                "date": formatTimeString(settle["settlement_date"]),
+            }
+
+    def get_settle_orders(self, limit=100):
+        """
+        List force-settlement orders of this bitasset.
+
+        :param int limit: Maximum number of settle orders to return
+        """
         assert self.is_bitasset
-        r = []
-        ret = self.blockchain.rpc.get_settle_orders(self["id"], limit)
-        for settle in ret[:limit]:
-            r.append(
-                {
-                    "account": Account(
-                        settle["owner"], lazy=True, blockchain_instance=self.blockchain
-                    ),
-                    "amount": Amount(
-                        settle["balance"], blockchain_instance=self.blockchain
-                    ),
-                    "date": formatTimeString(settle["settlement_date"]),
-                }
-            )
-        return r
+        if limit <= 100:
+            ret = self.blockchain.rpc.get_settle_orders(self["id"], limit)
+            return list(self._settle_orders(ret[:limit]))
+        return list(itertools.islice(self.iter_settle_orders(), limit))
 
     def halt(self):
         """Halt this asset from being moved or traded."""
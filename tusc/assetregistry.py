@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+import tempfile
+
+from collections import namedtuple
+
+from .instance import BlockchainInstance
+from .storage import get_default_data_dir
+
+log = logging.getLogger(__name__)
+
+#: Compact, immutable view of an asset as kept in the registry
+AssetEntry = namedtuple("AssetEntry", ["id", "symbol", "precision", "flags"])
+
+
+def _instance(object_id):
+    return int(object_id.split(".")[2])
+
+
+class AssetRegistry(BlockchainInstance):
+    """
+    Index of all assets of the chain, loaded in bulk.
+
+    :param str path: Snapshot file (defaults to a file in the user data
+        directory that is keyed by the chain id)
+    :param tusc.tusc.TUSC blockchain_instance: TUSC instance
+
+    The registry pages through ``list_assets`` once and keeps an
+    :class:`AssetEntry` (id, symbol, precision and flags) per asset,
+    indexed by symbol and id. The index can be written to a snapshot that
+    carries the chain id and the head block it was taken at, so that
+    other processes can start with every asset resolved and only fetch
+    the assets created since.
+
+    .. code-block:: python
+
+        from tusc.assetregistry import AssetRegistry
+        registry = AssetRegistry()
+        registry.load()
+        registry.id("TUSC")           # '1.3.0'
+        registry.entry("1.3.0")      # AssetEntry(id='1.3.0', ...)
+
+    .. note:: Symbol, id and precision of an asset never change, its
+              flags may. :func:`load` fetches all assets again once
+              their flags are older than :attr:`max_age` blocks.
+    """
+
+    #: Number of assets obtained per ``list_assets``/``get_objects`` call
+    page_size = 100
+
+    #: Age of the flags (in blocks) after which all assets are fetched
+    #: again (an hour of 3 second blocks)
+    max_age = 1200
+
+    def __init__(self, path=None, **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        self.path = path
+        self.chain_id = None
+        self.head_block_number = None
+        #: Head block at which all assets were fetched last
+        self.checked_block_number = None
+        self._assets = {}
+        self._symbols = {}
+
+    def __len__(self):
+        return len(self._assets)
+
+    def __contains__(self, identifier):
+        return identifier in self._assets or identifier in self._symbols
+
+    def __iter__(self):
+        return iter(self._assets.values())
+
+    def __repr__(self):
+        return "<%s assets=%d head_block_number=%s>" % (
+            self.__class__.__name__,
+            len(self),
+            self.head_block_number,
+        )
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+    def _resolve(self, identifier):
+        if identifier in self._assets:
+            return identifier
+        if identifier in self._symbols:
+            return self._symbols[identifier]
+        raise KeyError(identifier)
+
+    def get(self, identifier, default=None):
+        """Return the :class:`AssetEntry` for a symbol or id, ``default``
+        if unknown."""
+        try:
+            return self.entry(identifier)
+        except KeyError:
+            return default
+
+    def entry(self, identifier):
+        """Return the :class:`AssetEntry` for a symbol or id."""
+        return self._assets[self._resolve(identifier)]
+
+    def id(self, symbol):
+        """Return the asset id for a symbol (or id)."""
+        return self._resolve(symbol)
+
+    def symbol(self, identifier):
+        """Return the symbol for an asset id (or symbol)."""
+        return self.entry(identifier).symbol
+
+    def precision(self, identifier):
+        """Return the precision for a symbol or id."""
+        return self.entry(identifier).precision
+
+    def flags(self, identifier):
+        """Return the flags (as integer) for a symbol or id."""
+        return self.entry(identifier).flags
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+    def update(self, assets):
+        """Add or replace assets in the index.
+
+        :param list assets: Raw asset objects (``1.3.x``) or
+            :class:`AssetEntry` instances
+        :returns: Number of assets that were added or changed
+        """
+        count = 0
+        for asset in assets:
+            if not asset:
+                continue
+            if not isinstance(asset, AssetEntry):
+                asset = AssetEntry(
+                    asset["id"],
+                    asset["symbol"],
+                    asset["precision"],
+                    asset["options"]["flags"],
+                )
+            if self._assets.get(asset.id) != asset:
+                count += 1
+            self._assets[asset.id] = asset
+            self._symbols[asset.symbol] = asset.id
+        return count
+
+    def _set_head(self):
+        rpc = self.blockchain.rpc
+        self.chain_id = rpc.chain_params["chain_id"]
+        self.head_block_number = rpc.get_dynamic_global_properties()[
+            "head_block_number"
+        ]
+
+    def refresh(self):
+        """Reload the entire registry by paging through ``list_assets``."""
+        self._assets = {}
+        self._symbols = {}
+        self._set_head()
+        lower_bound = ""
+        while True:
+            ret = self.blockchain.rpc.list_assets(lower_bound, self.page_size)
+            # The lower bound is inclusive, skip the asset we already have
+            self.update([a for a in ret if a["symbol"] != lower_bound])
+            if len(ret) < self.page_size:
+                break
+            lower_bound = ret[-1]["symbol"]
+        self.checked_block_number = self.head_block_number
+        log.debug("Loaded %d assets into the registry", len(self))
+
+    def sync(self, changed=False):
+        """Fetch assets that have been created since the registry was built.
+
+        :param bool changed: Also fetch the known assets again, to take
+            over changed flags
+        :returns: Number of assets that were added or changed
+
+        Asset ids are handed out sequentially, so only ids beyond the
+        highest known one need to be requested for new assets.
+        """
+        self._set_head()
+        count = 0
+        instances = sorted([_instance(i) for i in self._assets])
+        if changed:
+            for i in range(0, len(instances), self.page_size):
+                ids = ["1.3.%d" % n for n in instances[i : i + self.page_size]]
+                count += self.update(self.blockchain.rpc.get_objects(ids))
+            self.checked_block_number = self.head_block_number
+        instance = (instances[-1] if instances else -1) + 1
+        while True:
+            ids = ["1.3.%d" % i for i in range(instance, instance + self.page_size)]
+            found = [a for a in self.blockchain.rpc.get_objects(ids) if a]
+            count += self.update(found)
+            if len(found) < len(ids):
+                break
+            instance += self.page_size
+        log.debug("Updated %d assets of the registry", count)
+        return count
+
+    def default_path(self):
+        return os.path.join(
+            get_default_data_dir(), "assets-{}.json".format(self.chain_id[:16])
+        )
+
+    def load(self, max_age=None):
+        """Load the registry from the snapshot and bring it up to date.
+
+        :param int max_age: Fetch all assets again if they were last
+            fetched more than this many blocks ago (defaults to
+            :attr:`max_age`)
+
+        If no usable snapshot exists (missing or of another chain), the
+        registry is loaded from the node. The snapshot is written
+        afterwards.
+        """
+        if max_age is None:
+            max_age = self.max_age
+        self.chain_id = self.blockchain.rpc.chain_params["chain_id"]
+        path = self.path or self.default_path()
+        snapshot = self.read(path)
+        self._set_head()
+        if snapshot and snapshot["chain_id"] == self.chain_id:
+            self.update([AssetEntry(*entry) for entry in snapshot["assets"]])
+            self.checked_block_number = snapshot["checked_block_number"]
+            age = self.head_block_number - self.checked_block_number
+            self.sync(changed=age > max_age)
+        else:
+            self.refresh()
+        self.save(path)
+        return self
+
+    # -------------------------------------------------------------------------
+    # Snapshots
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def read(path):
+        """Read a snapshot file, returns ``None`` if unavailable."""
+        try:
+            with open(path) as fid:
+                return json.load(fid)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, path=None):
+        """Write the snapshot (atomically replaces an existing file).
+
+        Each writer uses a temporary file of its own, so processes that
+        share a snapshot can save it concurrently.
+        """
+        path = path or self.path or self.default_path()
+        fd, tmp = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as fid:
+                json.dump(
+                    {
+                        "chain_id": self.chain_id,
+                        "head_block_number": self.head_block_number,
+                        "checked_block_number": self.checked_block_number,
+                        "assets": [list(entry) for entry in self],
+                    },
+                    fid,
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
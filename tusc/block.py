@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from .exceptions import BlockDoesNotExistsException
 from .instance import BlockchainInstance
 from graphenecommon.block import (
     Block as GrapheneBlock,
@@ -29,9 +30,31 @@ class Block(GrapheneBlock):
     .. note:: This class comes with its own caching function to reduce the
               load on the API server. Instances of this class can be
               refreshed with ``Account.refresh()``.
+
+    If a block store is open (see
+    :func:`tusc.tusc.TUSC.open_block_store`), blocks are read from the
+    store and irreversible blocks obtained from the node are added to it.
     """
 
-    pass
+    def refresh(self):
+        """Even though blocks never change, you freshly obtain its contents
+        from an API with this method
+        """
+        store = getattr(self.blockchain, "block_store", None)
+        if store is None or not isinstance(self.identifier, int):
+            return super().refresh()
+        identifier = self.identifier
+        block = store.get(identifier)
+        if block is None:
+            block = self.blockchain.rpc.get_block(identifier)
+            if not block:
+                raise BlockDoesNotExistsException
+            if self.blockchain.is_irreversible(identifier):
+                store.put(identifier, block)
+        super(GrapheneBlock, self).__init__(
+            block, blockchain_instance=self.blockchain, use_cache=self._use_cache
+        )
+        self.identifier = identifier
 
 
 @BlockchainInstance.inject
@@ -1,10 +1,64 @@
 # -*- coding: utf-8 -*-
+import threading
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 from .block import Block
+from .exceptions import BlockDoesNotExistsException
 from .instance import BlockchainInstance
 from tuscbase import operationids
+from grapheneapi.api import Api
 from graphenecommon.blockchain import Blockchain as GrapheneBlockchain
 
 
+def operation_ids(opNames):
+    """Set of the ids of operations (names or ids), ``None`` for all."""
+    if not opNames:
+        return None
+    op_ids = set()
+    for name in opNames:
+        if isinstance(name, int):
+            op_ids.add(name)
+        elif name in operationids.operations:
+            op_ids.add(operationids.operations[name])
+        else:
+            raise ValueError("Unknown operation {}".format(name))
+    return op_ids
+
+
+def block_operations(block, op_ids=None, fields=None):
+    """Events of the operations of a block, as streamed by
+    :func:`Blockchain.stream`.
+
+    :param dict block: Block with ``block_num``
+    :param set op_ids: Operation ids to include (see
+        :func:`operation_ids`, defaults to all)
+    :param list fields: Fields of the operations to include (defaults to
+        all)
+    :returns: Generator of ``(trx_in_block, op_in_trx, event)`` tuples
+
+    Operations of other types are skipped before any event is built for
+    them.
+    """
+    for trx_in_block, tx in enumerate(block["transactions"]):
+        for op_in_trx, (op_id, op) in enumerate(tx["operations"]):
+            if isinstance(op_id, str):
+                op_id = operationids.operations[op_id]
+            if op_ids is not None and op_id not in op_ids:
+                continue
+            r = {
+                "type": operationids.getOperationNameForId(op_id),
+                "timestamp": block["timestamp"],
+                "block_num": block["block_num"],
+            }
+            if fields is None:
+                r.update(op)
+            else:
+                r.update((key, op[key]) for key in fields if key in op)
+            yield trx_in_block, op_in_trx, r
+
+
 @BlockchainInstance.inject
 class Blockchain(GrapheneBlockchain):
     """
@@ -23,3 +77,141 @@ class Blockchain(GrapheneBlockchain):
     def define_classes(self):
         self.block_class = Block
         self.operationids = operationids
+
+    def wait_for_and_get_block(self, block_number, blocks_waiting_for=None):
+        """Get the desired block from the chain, if the current head block is
+        smaller (for both head and irreversible) then we wait, but a
+        maxmimum of blocks_waiting_for * max_block_wait_repetition time
+        before failure.
+
+        :param int block_number: desired block number
+        :param int blocks_waiting_for: (default) difference between
+            block_number and current head how many blocks we are willing to
+            wait, positive int
+
+        Blocks in the block store (see
+        :func:`tusc.tusc.TUSC.open_block_store`) are returned without
+        asking the node.
+        """
+        block = self._stored(block_number)
+        if block is None:
+            block = super().wait_for_and_get_block(block_number, blocks_waiting_for)
+            self._store(block_number, block)
+        return block
+
+    def _stored(self, block_num):
+        """Block from the block store, ``None`` if not stored."""
+        store = getattr(self.blockchain, "block_store", None)
+        if store is not None:
+            return store.get(block_num)
+
+    def _store(self, block_num, block):
+        """Add a block to the block store if it is irreversible."""
+        store = getattr(self.blockchain, "block_store", None)
+        if store is not None and block and self.blockchain.is_irreversible(block_num):
+            store.put(block_num, block)
+
+    def stream(self, opNames=[], *args, fields=None, **kwargs):
+        """Yield specific operations (e.g. transfers) only
+
+        :param array opNames: List of operations (names or ids) to filter for
+        :param list fields: Fields of the operations to yield (defaults to
+            all)
+        :param int start: Start at this block
+        :param int stop: Stop at this block
+        :param str mode: We here have the choice between
+             * "head": the last block
+             * "irreversible": the block that is confirmed by 2/3 of all
+                block producers and is thus irreversible!
+
+        The dict output is formated such that ``type`` caries the
+        operation type, timestamp and block_num are taken from the
+        block the operation was stored in and the other key depend
+        on the actualy operation.
+
+        ``opNames`` is compiled into a set of operation ids once, operations
+        of other types are skipped before any event is built for them.
+        With ``fields``, events only carry the listed fields of the
+        operation next to ``type``, ``timestamp`` and ``block_num``.
+
+        .. code-block:: python
+
+            for transfer in chain.stream(["transfer"], fields=["from", "to"]):
+                print(transfer["from"], transfer["to"])
+        """
+        op_ids = operation_ids(opNames)
+        for block in self.blocks(**kwargs):
+            for _, _, r in block_operations(block, op_ids, fields):
+                yield r
+
+    def _block(self, block_num, block):
+        """Wrap a block as obtained from the API like :func:`blocks` does."""
+        if not block:
+            raise BlockDoesNotExistsException(block_num)
+        block = self.block_class(block, blockchain_instance=self.blockchain)
+        block.update({"id": str(block_num), "block_num": block_num})
+        block.identifier = block_num
+        return block
+
+    def _connect_worker(self):
+        """API connection for a worker thread of :func:`fetch_range`.
+
+        The websocket connection of the instance handles one request at a
+        time, so each worker opens a connection of its own to the same node.
+        """
+        rpc = self.blockchain.rpc
+        if not isinstance(rpc, Api):
+            return rpc
+        return rpc.__class__(rpc.url, num_retries=rpc.num_retries, **rpc._kwargs)
+
+    def fetch_range(self, start, stop, concurrency=8):
+        """Yields the blocks from ``start`` to ``stop`` (inclusive) in order.
+
+        :param int start: First block
+        :param int stop: Last block, must not be ahead of the head block
+        :param int concurrency: Number of blocks requested at the same time
+
+        Unlike :func:`blocks`, which waits for each block before requesting
+        the next one, up to ``concurrency`` requests are in flight on as
+        many worker threads (each with its own connection to the node).
+        Blocks are yielded strictly in order and at most ``concurrency``
+        of them are held in memory, so arbitrarily long ranges can be
+        scanned. Blocks in the block store are not requested again.
+
+        :raises BlockDoesNotExistsException: if a block in the range does
+            not exist (yet)
+        """
+        local = threading.local()
+        connections = []
+
+        def get_block(block_num):
+            block = self._stored(block_num)
+            if block is not None:
+                return block
+            if not hasattr(local, "rpc"):
+                local.rpc = self._connect_worker()
+                connections.append(local.rpc)
+            block = local.rpc.get_block(block_num)
+            self._store(block_num, block)
+            return block
+
+        block_nums = iter(range(start, stop + 1))
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            for block_num in block_nums:
+                pending.append((block_num, executor.submit(get_block, block_num)))
+                if len(pending) < concurrency:
+                    continue
+                block_num, future = pending.popleft()
+                yield self._block(block_num, future.result())
+            while pending:
+                block_num, future = pending.popleft()
+                yield self._block(block_num, future.result())
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown()
+            for rpc in connections:
+                if rpc is not self.blockchain.rpc:
+                    rpc.connection.disconnect()
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+import json
+import mmap
+import os
+import struct
+import threading
+
+from .storage import get_default_data_dir
+
+#: Index record of a block: offset and length of its data in the segment
+index_record = struct.Struct("<QI")
+
+
+class Segment:
+    """
+    Blocks ``first`` to ``first + size - 1`` of a :class:`BlockStore`.
+
+    A segment consists of a data file that blocks are appended to as
+    compact JSON, and an index file with one fixed-size record (offset and
+    length in the data file) per block number. Both are memory-mapped for
+    reads and re-mapped once they have grown.
+    """
+
+    def __init__(self, path, first, size):
+        self.first = first
+        self.size = size
+        self.data_path = path + ".blocks"
+        self.index_path = path + ".index"
+        self._data = None
+        self._index = None
+        self._data_map = None
+        self._index_map = None
+
+    def _map(self, path, current, needed):
+        if current is not None and len(current) >= needed:
+            return current
+        if current is not None:
+            current.close()
+        if not os.path.exists(path) or os.path.getsize(path) < needed:
+            return None
+        with open(path, "rb") as fid:
+            return mmap.mmap(fid.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def locate(self, block_num):
+        """Offset and length of a block in the data file (length 0 if the
+        block is not stored)."""
+        position = (block_num - self.first) * index_record.size
+        self._index_map = self._map(
+            self.index_path, self._index_map, position + index_record.size
+        )
+        if self._index_map is None:
+            return 0, 0
+        return index_record.unpack_from(self._index_map, position)
+
+    def read(self, block_num):
+        offset, length = self.locate(block_num)
+        if not length:
+            return None
+        self._data_map = self._map(self.data_path, self._data_map, offset + length)
+        return self._data_map[offset : offset + length]
+
+    def append(self, block_num, data):
+        if self._data is None:
+            self._data = open(self.data_path, "ab")
+            if not os.path.exists(self.index_path):
+                open(self.index_path, "wb").close()
+            self._index = open(self.index_path, "r+b")
+        offset = self._data.seek(0, os.SEEK_END)
+        self._data.write(data)
+        self._data.flush()
+        # The index record is written last, a block only becomes visible
+        # once its data is complete. Records of missing blocks read as zero.
+        self._index.seek((block_num - self.first) * index_record.size)
+        self._index.write(index_record.pack(offset, len(data)))
+        self._index.flush()
+
+    def close(self):
+        for f in (self._data_map, self._index_map, self._data, self._index):
+            if f is not None:
+                f.close()
+        self._data = self._index = self._data_map = self._index_map = None
+
+
+class BlockStore:
+    """
+    Append-only store of irreversible blocks on disk.
+
+    :param str path: Directory of the store (created if needed)
+
+    Blocks are kept in segments of :attr:`segment_size` block numbers
+    (see :class:`Segment`). Blocks are written once and never changed, so
+    only irreversible blocks must be stored. Reads are served from
+    memory-mapped files and do not touch the node.
+
+    The store is used by :class:`tusc.block.Block` and
+    :func:`tusc.blockchain.Blockchain.blocks` once opened with
+    :func:`tusc.tusc.TUSC.open_block_store`:
+
+    .. code-block:: python
+
+        from tusc import TUSC
+        from tusc.blockchain import Blockchain
+
+        tusc = TUSC()
+        tusc.open_block_store()
+        for block in Blockchain(mode="irreversible").blocks(1, 100000):
+            ...
+
+    Repeated scans of the same range are then served locally.
+    """
+
+    #: Number of block numbers per segment (must not change for an existing
+    #: store)
+    segment_size = 100000
+
+    def __init__(self, path):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self._segments = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __contains__(self, block_num):
+        with self._lock:
+            return bool(self._segment(block_num).locate(block_num)[1])
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, self.path)
+
+    @classmethod
+    def default_path(cls, chain_id):
+        return os.path.join(get_default_data_dir(), "blocks-{}".format(chain_id[:16]))
+
+    def _segment(self, block_num):
+        number = block_num // self.segment_size
+        if number not in self._segments:
+            self._segments[number] = Segment(
+                os.path.join(self.path, "%08d" % number),
+                number * self.segment_size,
+                self.segment_size,
+            )
+        return self._segments[number]
+
+    def get(self, block_num, default=None):
+        """Return a stored block (as obtained from the API) or ``default``."""
+        with self._lock:
+            data = self._segment(block_num).read(block_num)
+        if data is None:
+            return default
+        return json.loads(data)
+
+    def put(self, block_num, block):
+        """Store an irreversible block.
+
+        :param int block_num: Block number
+        :param dict block: Block as obtained from the API
+        :returns: ``False`` if the block was stored already
+        """
+        data = json.dumps(block, separators=(",", ":")).encode("utf-8")
+        with self._lock:
+            segment = self._segment(block_num)
+            if segment.locate(block_num)[1]:
+                return False
+            segment.append(block_num, data)
+        return True
+
+    def close(self):
+        """Close all files of the store."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+            self._segments = {}
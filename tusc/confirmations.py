@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+import collections
+import hashlib
+import logging
+import threading
+
+from binascii import hexlify
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from tuscbase.serializer import serialize_transaction
+
+from .exceptions import TransactionExpired
+from .instance import BlockchainInstance
+from .utils import formatTime, parse_time
+
+log = logging.getLogger(__name__)
+
+
+def transaction_id(tx, prefix="TUSC"):
+    """Id of a transaction (hex).
+
+    :param dict tx: Transaction, e.g. as returned by
+        :func:`tusc.tusc.TUSC.finalizeOp`
+    """
+    data = serialize_transaction(tx, prefix=prefix, signatures=False)
+    return hexlify(hashlib.sha256(data).digest()[:20]).decode("ascii")
+
+
+def block_transaction_ids(block, prefix="TUSC"):
+    """Ids of the transactions of a block, in order."""
+    if "transaction_ids" in block:
+        return block["transaction_ids"]
+    return [transaction_id(tx, prefix) for tx in block["transactions"]]
+
+
+class ConfirmationTracker(BlockchainInstance):
+    """
+    Waits for many transactions to be included in blocks.
+
+    :param str mode: Wait for the ``head`` block or for the block to become
+        ``irreversible`` (default)
+    :param tusc.tusc.TUSC blockchain_instance: TUSC instance
+
+    Instead of waiting on each transaction separately, a single thread
+    follows the blocks while transactions are pending and matches the
+    ids of their transactions against the pending ones. :func:`track`
+    returns a :class:`concurrent.futures.Future` that resolves to
+
+    .. code-block:: python
+
+        {
+            "id": "...",                # transaction id
+            "block_num": 1234,
+            "trx_num": 0,               # index of the transaction in the block
+            "operation_results": [...],
+            "trx": {...},               # the transaction as included
+        }
+
+    or fails with :class:`tusc.exceptions.TransactionExpired` once a
+    block past the expiration of the transaction has been seen without it.
+    Before that, the blocks since the transaction was broadcast (and after
+    its reference block) up to the first block scanned for it are
+    searched, so that transactions included before they were tracked are
+    found as well. The search runs off the thread that follows the
+    blocks.
+
+    Use the shared trackers of a blockchain instance:
+
+    .. code-block:: python
+
+        from tusc import TUSC
+        tusc = TUSC()
+        tracker = tusc.confirmations("head")
+        futures = [tracker.track(tusc.transfer(...)) for _ in range(100)]
+        results = [future.result() for future in futures]
+    """
+
+    #: Number of blocks before the current block the scan starts with, so
+    #: that transactions broadcast right before :func:`track` are found
+    lookback = 2
+
+    #: Lifetime of transactions that are tracked by id without an
+    #: expiration, in seconds from the first block scanned for them (the
+    #: default maximum of the chain)
+    max_lifetime = 86400
+
+    #: Seconds before the broadcast time of a transaction that are searched
+    #: as well, for the clocks of the sender and the chain to differ
+    clock_skew = 30
+
+    #: Seconds :func:`timeout` waits past the expiration of a transaction,
+    #: for the blocks to become irreversible
+    expiration_margin = 60
+
+    def __init__(self, mode="irreversible", **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        self.mode = mode
+        #: Pending ``[futures, expiration, ref_block_num, first block
+        #: scanned, broadcast time]`` by transaction id
+        self.pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._searches = None
+        #: Confirmations of the last scanned blocks
+        self._recent = collections.deque(maxlen=self.lookback + 1)
+
+    def __len__(self):
+        return len(self.pending)
+
+    @property
+    def prefix(self):
+        return self.blockchain.prefix
+
+    @staticmethod
+    def _confirmation(tx_id, block, trx_num):
+        tx = block["transactions"][trx_num]
+        return {
+            "id": tx_id,
+            "block_num": block["block_num"],
+            "trx_num": trx_num,
+            "operation_results": tx.get("operation_results", []),
+            "trx": tx,
+        }
+
+    @staticmethod
+    def _time(value):
+        if isinstance(value, datetime):
+            return formatTime(value)
+        return value
+
+    def _register(self, tx, future, expiration=None, broadcast=None):
+        """Add a pending transaction, returns ``False`` if it was found in
+        the recent blocks already."""
+        ref_block_num = None
+        if isinstance(tx, str):
+            tx_id = tx
+        else:
+            tx_id = tx.get("id") or transaction_id(tx, self.prefix)
+            expiration = expiration or tx.get("expiration")
+            ref_block_num = tx.get("ref_block_num")
+        expiration = self._time(expiration)
+        broadcast = self._time(broadcast)
+        if broadcast is None and expiration and ref_block_num is not None:
+            # Built with the lifetime of this instance
+            broadcast = formatTime(
+                parse_time(expiration)
+                - timedelta(seconds=self.blockchain.expiration or 30)
+            )
+        if broadcast is not None:
+            broadcast = formatTime(
+                parse_time(broadcast) - timedelta(seconds=self.clock_skew)
+            )
+        for confirmations in self._recent:
+            if tx_id in confirmations:
+                future.set_result(confirmations[tx_id])
+                return False
+        entry = self.pending.setdefault(
+            tx_id, [[], expiration, ref_block_num, None, broadcast]
+        )
+        entry[0].append(future)
+        return True
+
+    @staticmethod
+    def _resolve(futures, result=None, error=None):
+        for future in futures:
+            if future.done():
+                # Cancelled
+                continue
+            if error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _process(self, block):
+        """Resolve the futures of the transactions in a block.
+
+        :returns: ``(more, expired)``, ``more`` is ``True`` while
+            transactions are pending, ``expired`` lists the
+            ``(tx_id, futures, expiration, blocks, broadcast)`` of the
+            transactions that expired without being seen, ``blocks`` is the
+            range of blocks to search for them (newest first, down to the
+            first one before ``broadcast``) before they are failed
+        """
+        confirmations = {}
+        resolved = []
+        expired = []
+        block_num = block["block_num"]
+        for trx_num, tx_id in enumerate(block_transaction_ids(block, self.prefix)):
+            confirmations[tx_id] = self._confirmation(tx_id, block, trx_num)
+        with self._lock:
+            self._recent.append(confirmations)
+            for tx_id in list(self.pending):
+                entry = self.pending[tx_id]
+                futures, expiration, ref_block_num, first, broadcast = entry
+                if first is None:
+                    entry[3] = first = block_num
+                if expiration is None:
+                    entry[1] = expiration = formatTime(
+                        parse_time(block["timestamp"])
+                        + timedelta(seconds=self.max_lifetime)
+                    )
+                if tx_id in confirmations:
+                    resolved.append((futures, confirmations[tx_id]))
+                elif block["timestamp"] > expiration:
+                    blocks = range(0)
+                    if ref_block_num is not None:
+                        # The reference block is the latest block whose
+                        # number ends in these 16 bits
+                        ref_block = first - ((first - ref_block_num) & 0xFFFF)
+                        blocks = range(first - 1, max(1, ref_block + 1) - 1, -1)
+                    elif broadcast is not None:
+                        blocks = range(first - 1, 0, -1)
+                    expired.append((tx_id, futures, expiration, blocks, broadcast))
+                else:
+                    continue
+                del self.pending[tx_id]
+            more = bool(self.pending)
+            if not more:
+                self._thread = None
+        for futures, result in resolved:
+            self._resolve(futures, result)
+        return more, expired
+
+    def _found(self, tx_id, block_num, block):
+        """Confirmation of a transaction if it is in ``block``."""
+        if not block:
+            return None
+        block["block_num"] = block_num
+        ids = block_transaction_ids(block, self.prefix)
+        if tx_id in ids:
+            return self._confirmation(tx_id, block, ids.index(tx_id))
+
+    def _search(self, tx_id, futures, expiration, blocks, broadcast):
+        """Search the ``blocks`` for an expired transaction before failing
+        it."""
+        try:
+            for block_num in blocks:
+                block = self.blockchain.rpc.get_block(block_num)
+                if block and broadcast and block["timestamp"] < broadcast:
+                    break
+                confirmation = self._found(tx_id, block_num, block)
+                if confirmation:
+                    return self._resolve(futures, confirmation)
+        except Exception as e:
+            log.exception("Failed to search for %s", tx_id)
+            return self._resolve(futures, error=e)
+        error = TransactionExpired("Transaction %s expired at %s" % (tx_id, expiration))
+        self._resolve(futures, error=error)
+
+    def _start_search(self, args):
+        """Search for an expired transaction on a thread of its own, so the
+        other pending transactions are not held up."""
+        if self._searches is None:
+            self._searches = ThreadPoolExecutor(max_workers=1)
+        self._searches.submit(self._search, *args)
+
+    def _fail(self, error):
+        with self._lock:
+            pending, self.pending = self.pending, {}
+            self._thread = None
+        for futures, *_ in pending.values():
+            self._resolve(futures, error=error)
+
+    def _scan(self):
+        from .blockchain import Blockchain
+
+        try:
+            chain = Blockchain(mode=self.mode, blockchain_instance=self.blockchain)
+            start = max(1, chain.get_current_block_num() - self.lookback)
+            for block in chain.blocks(start=start):
+                more, expired = self._process(block)
+                for args in expired:
+                    self._start_search(args)
+                if not more:
+                    return
+        except Exception as e:
+            log.exception("Failed to follow the blocks")
+            self._fail(e)
+
+    def track(self, tx, expiration=None, broadcast=None):
+        """
+        Wait for a transaction to be included in a block.
+
+        :param tx: Transaction (as returned when broadcasting) or its id
+        :param expiration: Expiration of a transaction given by id
+            (``datetime`` or ``%Y-%m-%dT%H:%M:%S``), defaults to
+            :attr:`max_lifetime` seconds after the first block scanned
+        :param broadcast: Time the transaction was broadcast, blocks
+            before are not searched (defaults to its expiration less the
+            lifetime of transactions of the blockchain instance)
+        :returns: A :class:`concurrent.futures.Future` of the confirmation
+        """
+        future = Future()
+        with self._lock:
+            registered = self._register(tx, future, expiration, broadcast)
+            if registered and self._thread is None:
+                self._thread = threading.Thread(target=self._scan, daemon=True)
+                self._thread.start()
+        return future
+
+    def timeout(self, tx):
+        """Seconds to wait for the confirmation of a transaction, until it
+        expires and :attr:`expiration_margin` more."""
+        expiration = None if isinstance(tx, str) else tx.get("expiration")
+        if not expiration:
+            return self.max_lifetime + self.expiration_margin
+        remaining = parse_time(expiration) - datetime.now(timezone.utc)
+        return max(0, remaining.total_seconds()) + self.expiration_margin
+
+    def wait(self, tx, timeout=None, **kwargs):
+        """Track a transaction and wait for its confirmation."""
+        return self.track(tx, **kwargs).result(timeout)
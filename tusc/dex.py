@@ -43,22 +43,7 @@ class Dex(BlockchainInstance):
             10000000.0}, 'assert': {'fee': 20000.0},
             'committee_member_create': {'fee': 100000000.0}}
         """
-        from tuscbase.operations import operations
-
-        r = {}
-        obj, base = self.blockchain.rpc.get_objects(["2.0.0", "1.3.0"])
-        fees = obj["parameters"]["current_fees"]["parameters"]
-        scale = float(obj["parameters"]["current_fees"]["scale"])
-        for f in fees:
-            op_name = "unknown %d" % f[0]
-            for name in operations:
-                if operations[name] == f[0]:
-                    op_name = name
-            fs = f[1]
-            for _type in fs:
-                fs[_type] = float(fs[_type]) * scale / 1e4 / 10 ** base["precision"]
-            r[op_name] = fs
-        return r
+        return self.blockchain.fee_schedule.as_dict()
 
     def list_debt_positions(self, account=None):
         """
@@ -81,22 +66,22 @@ class Dex(BlockchainInstance):
         if not account:
             raise ValueError("You need to provide an account")
         account = Account(account, full=True, blockchain_instance=self.blockchain)
+        debts = account.get("call_orders")
+        assets = self._get_full_assets(
+            [
+                debt["call_price"][side]["asset_id"]
+                for debt in debts
+                for side in ["base", "quote"]
+            ]
+        )
 
         r = {}
-        for debt in account.get("call_orders"):
-            base = Asset(
-                debt["call_price"]["base"]["asset_id"],
-                full=True,
-                blockchain_instance=self.blockchain,
-            )
-            quote = Asset(
-                debt["call_price"]["quote"]["asset_id"],
-                full=True,
-                blockchain_instance=self.blockchain,
-            )
+        tickers = {}
+        for debt in debts:
+            base = assets[debt["call_price"]["base"]["asset_id"]]
+            quote = assets[debt["call_price"]["quote"]["asset_id"]]
             if not quote.is_bitasset:
                 continue
-            quote.ensure_full()
             bitasset = quote["bitasset_data"]
             settlement_price = Price(
                 bitasset["current_feed"]["settlement_price"],
@@ -104,16 +89,27 @@ class Dex(BlockchainInstance):
             )
             if not settlement_price:
                 continue
-            collateral_amount = Amount({"amount": debt["collateral"], "asset": base})
-            debt_amount = Amount({"amount": debt["debt"], "asset": quote})
+            collateral_amount = Amount(
+                int(debt["collateral"]) / 10 ** base["precision"],
+                base,
+                blockchain_instance=self.blockchain,
+            )
+            debt_amount = Amount(
+                int(debt["debt"]) / 10 ** quote["precision"],
+                quote,
+                blockchain_instance=self.blockchain,
+            )
             # call_price = Price(debt["call_price"], blockchain_instance=self.blockchain)
             call_price = collateral_amount / (
                 debt_amount
                 * (bitasset["current_feed"]["maintenance_collateral_ratio"] / 1000)
             )
-            latest = Market("{}:{}".format(base["symbol"], quote["symbol"])).ticker()[
-                "latest"
-            ]
+            pair = (base["id"], quote["id"])
+            if pair not in tickers:
+                tickers[pair] = Market(
+                    base=quote, quote=base, blockchain_instance=self.blockchain
+                ).ticker()["latest"]
+            latest = tickers[pair]
             r[quote["symbol"]] = {
                 "collateral": collateral_amount,
                 "debt": debt_amount,
@@ -123,6 +119,35 @@ class Dex(BlockchainInstance):
             }
         return r
 
+    def _get_full_assets(self, ids):
+        """Obtain many fully loaded assets with two ``get_objects`` calls.
+
+        :param list ids: Asset ids (may contain duplicates)
+        :returns: :class:`tusc.asset.Asset` (with ``bitasset_data`` and
+            ``dynamic_asset_data``) indexed by id
+        """
+        ids = sorted(set(ids))
+        if not ids:
+            return {}
+        assets = [a for a in self.blockchain.rpc.get_objects(ids) if a]
+        data_ids = [a["dynamic_asset_data_id"] for a in assets]
+        data_ids.extend(
+            [a["bitasset_data_id"] for a in assets if "bitasset_data_id" in a]
+        )
+        data = {
+            obj["id"]: obj for obj in self.blockchain.rpc.get_objects(data_ids) if obj
+        }
+        r = {}
+        for asset in assets:
+            asset = dict(asset)
+            asset["dynamic_asset_data"] = data.get(asset["dynamic_asset_data_id"])
+            if "bitasset_data_id" in asset:
+                asset["bitasset_data"] = data.get(asset["bitasset_data_id"])
+            r[asset["id"]] = Asset(
+                asset, full=True, blockchain_instance=self.blockchain
+            )
+        return r
+
     def close_debt_position(self, symbol, account=None):
         """
         Close a debt position and reclaim the collateral.
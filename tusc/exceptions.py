@@ -47,3 +47,15 @@ class HtlcDoesNotExistException(Exception):
     """HTLC object does not exist."""
 
     pass
+
+
+class PagingNotSupported(Exception):
+    """The node ignored the start id of a paged request."""
+
+    pass
+
+
+class TransactionExpired(Exception):
+    """The transaction expired without being included in a block."""
+
+    pass
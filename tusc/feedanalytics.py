@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+import statistics
+
+from collections import namedtuple
+
+from .instance import BlockchainInstance
+from .utils import formatTimeString
+
+#: Feed statistics of a single bitasset. Prices are given in units of
+#: the bitasset per backing asset (e.g. ``USD/TUSC``), ages in seconds.
+FeedStats = namedtuple(
+    "FeedStats",
+    [
+        "asset_id",
+        "symbol",
+        "backing_asset_id",
+        "producers",
+        "feeds",
+        "stale",
+        "current",
+        "median",
+        "min",
+        "max",
+        "spread",
+        "stdev",
+        "oldest",
+    ],
+)
+
+
+class FeedAnalytics(BlockchainInstance):
+    """
+    Price feed statistics across many bitassets at once.
+
+    :param tusc.tusc.TUSC blockchain_instance: TUSC instance
+
+    All bitasset data objects are obtained with batched ``get_objects``
+    calls and the statistics are computed from the raw feeds, without
+    creating :class:`tusc.price.PriceFeed` or
+    :class:`tusc.account.Account` instances.
+
+    .. code-block:: python
+
+        from tusc.feedanalytics import FeedAnalytics
+        stats = FeedAnalytics().stats()
+        stats["USD"].median, stats["USD"].oldest
+
+    If an asset registry has been loaded with
+    :func:`tusc.tusc.TUSC.load_asset_registry`, the asset objects are
+    fetched by the ids it holds and precisions are taken from it.
+    """
+
+    #: Number of objects obtained per ``list_assets``/``get_objects`` call
+    page_size = 100
+
+    def _get_objects(self, ids):
+        r = []
+        for i in range(0, len(ids), self.page_size):
+            r.extend(self.blockchain.rpc.get_objects(ids[i : i + self.page_size]))
+        return r
+
+    def _list_assets(self):
+        registry = getattr(self.blockchain, "asset_registry", None)
+        if registry:
+            return [a for a in self._get_objects([e.id for e in registry]) if a]
+        r = []
+        lower_bound = ""
+        while True:
+            ret = self.blockchain.rpc.list_assets(lower_bound, self.page_size)
+            r.extend([a for a in ret if a["symbol"] != lower_bound])
+            if len(ret) < self.page_size:
+                return r
+            lower_bound = ret[-1]["symbol"]
+
+    def _get_assets(self, symbols):
+        registry = getattr(self.blockchain, "asset_registry", None)
+        if registry:
+            symbols = [registry.id(s) if s in registry else s for s in symbols]
+        ids = [s for s in symbols if s.startswith("1.3.")]
+        names = [s for s in symbols if not s.startswith("1.3.")]
+        r = self._get_objects(ids) if ids else []
+        if names:
+            r.extend(self.blockchain.rpc.lookup_asset_symbols(names))
+        return [a for a in r if a]
+
+    @staticmethod
+    def _price(price, asset_id, precisions):
+        """Convert a raw price into a float in units of ``asset_id``
+        per the other asset, returns ``None`` for unset prices."""
+        base, quote = price["base"], price["quote"]
+        if base["asset_id"] != asset_id:
+            base, quote = quote, base
+        if not int(base["amount"]) or not int(quote["amount"]):
+            return None
+        return (int(base["amount"]) / 10 ** precisions[base["asset_id"]]) / (
+            int(quote["amount"]) / 10 ** precisions[quote["asset_id"]]
+        )
+
+    def stats(self, assets=None):
+        """
+        Compute feed statistics.
+
+        :param list assets: Symbols or ids of the bitassets (defaults to
+            all bitassets)
+        :returns: :class:`FeedStats` indexed by symbol
+        :rtype: dict
+
+        Feeds without a price and feeds older than the feed lifetime of
+        the asset are not taken into account for the price statistics;
+        the latter are counted as ``stale``. ``oldest`` is the age of the
+        oldest published feed.
+        """
+        if assets is None:
+            assets = self._list_assets()
+        else:
+            assets = self._get_assets(list(assets))
+        # Precisions of the bitassets and their backing assets
+        precisions = {a["id"]: a["precision"] for a in assets}
+        assets = [a for a in assets if "bitasset_data_id" in a]
+        bitassets = self._get_objects([a["bitasset_data_id"] for a in assets])
+        backing = {b["options"]["short_backing_asset"] for b in bitassets if b}
+        missing = sorted(backing - set(precisions))
+        registry = getattr(self.blockchain, "asset_registry", None)
+        if registry:
+            precisions.update(
+                {i: registry.precision(i) for i in missing if i in registry}
+            )
+            missing = [i for i in missing if i not in precisions]
+        precisions.update(
+            {a["id"]: a["precision"] for a in self._get_objects(missing) if a}
+        )
+
+        now = formatTimeString(
+            self.blockchain.rpc.get_dynamic_global_properties()["time"]
+        )
+
+        r = {}
+        for asset, bitasset in zip(assets, bitassets):
+            if not bitasset:
+                continue
+            lifetime = bitasset["options"]["feed_lifetime_sec"]
+            prices = []
+            ages = []
+            stale = 0
+            for _, (date, feed) in bitasset["feeds"]:
+                price = self._price(feed["settlement_price"], asset["id"], precisions)
+                if price is None:
+                    continue
+                age = (now - formatTimeString(date)).total_seconds()
+                ages.append(age)
+                if age > lifetime:
+                    stale += 1
+                    continue
+                prices.append(price)
+            r[asset["symbol"]] = FeedStats(
+                asset_id=asset["id"],
+                symbol=asset["symbol"],
+                backing_asset_id=bitasset["options"]["short_backing_asset"],
+                producers=len(bitasset["feeds"]),
+                feeds=len(prices),
+                stale=stale,
+                current=self._price(
+                    bitasset["current_feed"]["settlement_price"],
+                    asset["id"],
+                    precisions,
+                ),
+                median=statistics.median(prices) if prices else None,
+                min=min(prices) if prices else None,
+                max=max(prices) if prices else None,
+                spread=(max(prices) - min(prices)) / min(prices) if prices else None,
+                stdev=statistics.pstdev(prices) if prices else None,
+                oldest=max(ages) if ages else None,
+            )
+        return r
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+import logging
+import time
+
+from tuscbase.operationids import getOperationNameForId, operations
+
+from .instance import BlockchainInstance
+
+log = logging.getLogger(__name__)
+
+#: Operations that are charged their flat ``fee``
+flat_fee_operations = {
+    operations[name]
+    for name in [
+        "limit_order_create",
+        "limit_order_cancel",
+        "call_order_update",
+        "asset_update_bitasset",
+        "asset_update_feed_producers",
+        "asset_reserve",
+        "asset_fund_fee_pool",
+        "asset_settle",
+        "asset_global_settle",
+        "asset_publish_feed",
+    ]
+}
+
+
+def calculate_data_fee(size, price_per_kbyte):
+    """Fee for ``size`` bytes of data (as done by the chain)."""
+    return size * price_per_kbyte // 1024
+
+
+def is_cheap_name(name):
+    """Names containing digits, separators or no vowels are not premium."""
+    if any(c.isdigit() or c in ".-/" for c in name):
+        return True
+    return not any(c in "aeiouy" for c in name)
+
+
+class FeeSchedule(BlockchainInstance):
+    """
+    Fee schedule of the chain, indexed by operation id.
+
+    :param tusc.tusc.TUSC blockchain_instance: TUSC instance
+
+    The chain parameters (``2.0.0``) are loaded once. Since they can only
+    change at a maintenance interval, the schedule merely compares the
+    ``next_maintenance_time`` of the dynamic global properties (at most
+    every ``check_interval`` seconds) and reloads when it has moved on.
+    Alternatively, pass the object notices of a subscription to
+    :func:`on_object`.
+
+    Use the shared instance of a blockchain instance rather than creating
+    a new one:
+
+    .. code-block:: python
+
+        from tusc import TUSC
+        tusc = TUSC()
+        tusc.fee_schedule.fee("transfer")                 # in satoshi
+        tusc.fee_schedule.get("account_create")           # all parameters
+    """
+
+    #: Seconds between two checks of the maintenance time
+    check_interval = 60
+
+    def __init__(self, *args, **kwargs):
+        BlockchainInstance.__init__(self, *args, **kwargs)
+        self._fees = None
+        self.scale = None
+        self.core_precision = None
+        self.maximum_transaction_size = None
+        self.next_maintenance_time = None
+        self._checked = 0
+
+    def __contains__(self, op):
+        self._ensure()
+        return self._id(op) in self._fees
+
+    def __iter__(self):
+        self._ensure()
+        return iter(self._fees)
+
+    def __repr__(self):
+        return "<%s operations=%s scale=%s>" % (
+            self.__class__.__name__,
+            len(self._fees) if self._fees is not None else None,
+            self.scale,
+        )
+
+    @staticmethod
+    def _id(op):
+        if isinstance(op, str):
+            return operations[op]
+        return int(op)
+
+    @property
+    def loaded(self):
+        return self._fees is not None
+
+    def set(self, parameters, core_precision=None):
+        """Index the fees of a global properties object (``2.0.0``).
+
+        :param dict parameters: Global properties object
+        :param int core_precision: Precision of the core asset
+        """
+        current_fees = parameters["parameters"]["current_fees"]
+        self._fees = {
+            int(op_id): dict(fees) for op_id, fees in current_fees["parameters"]
+        }
+        self.scale = int(current_fees["scale"])
+        self.maximum_transaction_size = parameters["parameters"].get(
+            "maximum_transaction_size", self.maximum_transaction_size
+        )
+        if core_precision is not None:
+            self.core_precision = core_precision
+        self._checked = time.time()
+
+    def _set_version(self, dynamic_global_properties):
+        self.next_maintenance_time = dynamic_global_properties[
+            "next_maintenance_time"
+        ]
+        self._checked = time.time()
+
+    def refresh(self):
+        """Load the fee schedule from the node."""
+        rpc = self.blockchain.rpc
+        parameters, core = rpc.get_objects(["2.0.0", "1.3.0"])
+        self.set(parameters, core["precision"])
+        self._set_version(rpc.get_dynamic_global_properties())
+        log.debug("Loaded fee schedule for %d operations", len(self._fees))
+
+    def _is_current(self, dynamic_global_properties):
+        return (
+            dynamic_global_properties["next_maintenance_time"]
+            == self.next_maintenance_time
+        )
+
+    def ensure(self):
+        """Load the fee schedule or reload it if it may have changed."""
+        if not self.loaded:
+            self.refresh()
+        elif (
+            self.blockchain.is_connected()
+            and time.time() - self._checked > self.check_interval
+        ):
+            dgp = self.blockchain.rpc.get_dynamic_global_properties()
+            if self._is_current(dgp):
+                self._checked = time.time()
+            else:
+                self.refresh()
+
+    def _ensure(self):
+        self.ensure()
+
+    def on_object(self, notice):
+        """Process an object notice of a subscription (``2.0.0``)."""
+        if (
+            self.loaded
+            and isinstance(notice, dict)
+            and notice.get("id") == "2.0.0"
+        ):
+            self.set(notice)
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+    def _scaled(self, value):
+        return int(value) * self.scale // 10000
+
+    def get(self, op, default=None):
+        """Return the scaled fee parameters (in satoshi of the core asset)
+        of an operation.
+
+        :param op: Operation name or id
+        """
+        self._ensure()
+        fees = self._fees.get(self._id(op))
+        if fees is None:
+            return default
+        return {key: self._scaled(value) for key, value in fees.items()}
+
+    def __getitem__(self, op):
+        fees = self.get(op)
+        if fees is None:
+            raise KeyError(op)
+        return fees
+
+    def fee(self, op, key="fee"):
+        """Return a single scaled fee parameter (in satoshi of the core
+        asset), e.g. ``fee`` or ``price_per_kbyte``."""
+        return self[op][key]
+
+    def as_dict(self):
+        """Return all fees (in units of the core asset) indexed by
+        operation name, as done by :func:`tusc.dex.Dex.returnFees`."""
+        self._ensure()
+        r = {}
+        for op_id, fees in self._fees.items():
+            name = getOperationNameForId(op_id)
+            if name.startswith("Unknown"):
+                name = "unknown %d" % op_id
+            r[name] = {
+                key: float(value) * self.scale / 1e4 / 10 ** self.core_precision
+                for key, value in fees.items()
+            }
+        return r
+
+    # -------------------------------------------------------------------------
+    # Fee computation
+    # -------------------------------------------------------------------------
+    def calculate(self, op):
+        """
+        Compute the fee (in satoshi of the core asset) of an operation
+        locally, as the chain does.
+
+        :param tuscbase.objects.Operation op: Operation
+        :returns: The fee or ``None`` if the operation is not supported
+            (e.g. proposals), in which case the node has to be asked
+
+        Supported are transfers (including the memo data fee), asset
+        issuance, account and asset creation, asset updates and the
+        operations in :data:`flat_fee_operations`.
+        """
+        self._ensure()
+        fees = self._fees.get(op.id)
+        if fees is None:
+            return None
+        data = op.op.data
+        name = getOperationNameForId(op.id)
+        if op.id in flat_fee_operations:
+            fee = fees["fee"]
+        elif name in ["transfer", "asset_issue"]:
+            fee = fees["fee"]
+            memo = data["memo"]
+            if not memo.isempty():
+                fee += calculate_data_fee(
+                    len(bytes(memo.data)), fees["price_per_kbyte"]
+                )
+        elif name == "asset_update":
+            fee = fees["fee"] + calculate_data_fee(
+                len(bytes(op.op)), fees["price_per_kbyte"]
+            )
+        elif name == "account_create":
+            fee = fees["basic_fee"]
+            if not is_cheap_name(str(data["name"])):
+                fee = fees["premium_fee"]
+            fee += calculate_data_fee(len(bytes(op.op)), fees["price_per_kbyte"])
+        elif name == "asset_create":
+            symbol = str(data["symbol"])
+            if "." in symbol:
+                # Sub-assets may be charged differently
+                return None
+            fee = {3: fees["symbol3"], 4: fees["symbol4"]}.get(
+                len(symbol), fees["long_symbol"]
+            )
+            fee += calculate_data_fee(len(bytes(op.op)), fees["price_per_kbyte"])
+        else:
+            return None
+        return self._scaled(fee)
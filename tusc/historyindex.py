@@ -0,0 +1,426 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+import re
+import sqlite3
+
+from datetime import datetime
+
+from tuscbase.operationids import operations
+
+from .account import Account
+from .asset import Asset
+from .instance import BlockchainInstance
+from .storage import get_default_data_dir
+from .utils import formatTime
+
+log = logging.getLogger(__name__)
+
+#: Fields of an operation that name an account, in order of relevance for
+#: the counterparty
+account_fields = (
+    "from",
+    "to",
+    "issuer",
+    "issue_to_account",
+    "seller",
+    "account_id",
+    "account",
+    "payer",
+    "funding_account",
+    "deposit_to_account",
+    "owner",
+    "registrar",
+    "account_to_upgrade",
+    "authorizing_account",
+    "account_to_list",
+    "fee_paying_account",
+    "bidder",
+    "new_issuer",
+    "publisher",
+)
+
+#: Fields that name the receiving account of an operation
+receiving_fields = ("to", "issue_to_account", "deposit_to_account", "new_issuer")
+
+#: Fields of an operation that carry the amount it is about
+amount_fields = (
+    "amount",
+    "asset_to_issue",
+    "amount_to_sell",
+    "pays",
+    "amount_to_reserve",
+    "amount_to_claim",
+    "total_claimed",
+    "delta_collateral",
+    "delta_debt",
+    "debt_covered",
+)
+
+schema = """
+CREATE TABLE IF NOT EXISTS operations (
+    account TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    op_type INTEGER NOT NULL,
+    block_num INTEGER NOT NULL,
+    block_time TEXT NOT NULL,
+    counterparty TEXT,
+    incoming INTEGER NOT NULL,
+    asset TEXT,
+    amount INTEGER,
+    entry TEXT NOT NULL,
+    PRIMARY KEY (account, id)
+);
+CREATE INDEX IF NOT EXISTS operations_type
+    ON operations (account, op_type, block_time);
+CREATE INDEX IF NOT EXISTS operations_counterparty
+    ON operations (account, counterparty, block_time);
+CREATE INDEX IF NOT EXISTS operations_asset
+    ON operations (account, asset, block_time);
+CREATE INDEX IF NOT EXISTS operations_time
+    ON operations (account, block_time);
+CREATE TABLE IF NOT EXISTS sync_state (
+    account TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_progress (
+    account TEXT PRIMARY KEY,
+    newest_id INTEGER NOT NULL,
+    oldest_id INTEGER NOT NULL
+);
+"""
+
+
+def _instance(object_id):
+    return int(object_id.split(".")[2])
+
+
+class AccountHistoryIndex(BlockchainInstance):
+    """
+    Local index of the history of selected accounts in SQLite.
+
+    :param str path: Database file (defaults to a file in the user data
+        directory that is keyed by the chain id)
+    :param tusc.tusc.TUSC blockchain_instance: TUSC instance
+
+    :func:`sync` pages through ``get_account_history`` from the newest
+    entry down to the newest one already stored, so only new operations
+    are requested once an account has been synced. Operations are indexed
+    by type, counterparty, asset and block time, and :func:`query` runs on
+    the local database only.
+
+    .. code-block:: python
+
+        from tusc.historyindex import AccountHistoryIndex
+        index = AccountHistoryIndex()
+        index.sync(["init0", "init1"])
+        index.query(
+            "init0",
+            op_type="transfer",
+            asset="1.3.0",
+            incoming=True,
+            start="2020-07-01T00:00:00",
+            stop="2020-10-01T00:00:00",
+        )
+
+    The sync state of an account only advances once a pass is complete.
+    Until then, the oldest entry reached is checkpointed with every page,
+    and an interrupted pass continues below it on the next sync. The
+    block times of a page are obtained with a single
+    ``get_block_header_batch`` call.
+    """
+
+    #: Number of entries obtained per ``get_account_history`` call (the
+    #: maximum the node accepts)
+    page_size = 100
+
+    def __init__(self, path=None, **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        if path is None:
+            path = os.path.join(
+                get_default_data_dir(),
+                "history-{}.sqlite".format(
+                    self.blockchain.rpc.chain_params["chain_id"][:16]
+                ),
+            )
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(schema)
+        self._accounts = {}
+        self._assets = {}
+        self._block_times = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, self.path)
+
+    def close(self):
+        """Close the database."""
+        self.db.close()
+
+    # -------------------------------------------------------------------------
+    # Identifiers
+    # -------------------------------------------------------------------------
+    def account_id(self, account):
+        """Return the id of an account (name, id or
+        :class:`tusc.account.Account`)."""
+        if isinstance(account, Account):
+            return account["id"]
+        if re.match(r"^1\.2\.\d+$", account):
+            return account
+        if account not in self._accounts:
+            self._accounts[account] = Account(
+                account, blockchain_instance=self.blockchain
+            )["id"]
+        return self._accounts[account]
+
+    def asset_id(self, asset):
+        """Return the id of an asset (symbol, id or
+        :class:`tusc.asset.Asset`)."""
+        if isinstance(asset, Asset):
+            return asset["id"]
+        if re.match(r"^1\.3\.\d+$", asset):
+            return asset
+        if asset not in self._assets:
+            self._assets[asset] = Asset(asset, blockchain_instance=self.blockchain)[
+                "id"
+            ]
+        return self._assets[asset]
+
+    def op_type(self, op_type):
+        """Return the id of an operation type (name or id)."""
+        if isinstance(op_type, int):
+            return op_type
+        if op_type not in operations:
+            raise ValueError("Unknown operation {}".format(op_type))
+        return operations[op_type]
+
+    # -------------------------------------------------------------------------
+    # Syncing
+    # -------------------------------------------------------------------------
+    def last_id(self, account):
+        """Instance of the newest stored history entry of an account
+        (``None`` if it has not been synced)."""
+        row = self.db.execute(
+            "SELECT last_id FROM sync_state WHERE account = ?",
+            (self.account_id(account),),
+        ).fetchone()
+        return row[0] if row else None
+
+    def progress(self, account):
+        """Newest and oldest instance of an interrupted pass over the
+        history of an account (``None`` if there is none)."""
+        return self.db.execute(
+            "SELECT newest_id, oldest_id FROM sync_progress WHERE account = ?",
+            (self.account_id(account),),
+        ).fetchone()
+
+    def load_block_times(self, entries):
+        """Obtain the times of the blocks of many entries with one call."""
+        block_nums = sorted(
+            {e["block_num"] for e in entries if not e.get("block_time")}
+            - set(self._block_times)
+        )
+        if not block_nums:
+            return
+        for block_num, header in self.blockchain.rpc.get_block_header_batch(
+            block_nums
+        ):
+            if header:
+                self._block_times[block_num] = header["timestamp"]
+
+    def block_time(self, entry):
+        """Time of the block an entry is in (as ``%Y-%m-%dT%H:%M:%S``)."""
+        if entry.get("block_time"):
+            return entry["block_time"]
+        block_num = entry["block_num"]
+        if block_num not in self._block_times:
+            header = self.blockchain.rpc.get_block_header(block_num)
+            self._block_times[block_num] = header["timestamp"]
+        return self._block_times[block_num]
+
+    def row(self, account_id, entry):
+        """Index columns of a history entry."""
+        op_type, op = entry["op"]
+        op_type = self.op_type(op_type)
+        counterparty = None
+        incoming = False
+        for key in account_fields:
+            value = op.get(key)
+            if not isinstance(value, str) or not value.startswith("1.2."):
+                continue
+            if value == account_id:
+                incoming = incoming or key in receiving_fields
+            elif counterparty is None:
+                counterparty = value
+        asset = amount = None
+        for key in amount_fields:
+            if isinstance(op.get(key), dict) and "asset_id" in op[key]:
+                asset = op[key]["asset_id"]
+                amount = int(op[key]["amount"])
+                break
+        else:
+            asset = op.get("asset_to_update") or op.get("asset_id")
+        return (
+            account_id,
+            _instance(entry["id"]),
+            op_type,
+            entry["block_num"],
+            self.block_time(entry),
+            counterparty,
+            incoming,
+            asset,
+            amount,
+            json.dumps(entry, separators=(",", ":")),
+        )
+
+    def sync_account(self, account):
+        """Fetch the operations of an account that are not stored yet.
+
+        :param str account: Account name or id
+        :returns: Number of new operations
+        """
+        account_id = self.account_id(account)
+        self._block_times = {}
+        count = 0
+        progress = self.progress(account_id)
+        if progress is not None:
+            newest, oldest = progress
+            count += self._sync_pass(account_id, newest, oldest - 1)
+        count += self._sync_pass(account_id)
+        log.debug("Indexed %d operations of %s", count, account_id)
+        return count
+
+    def _sync_pass(self, account_id, newest=None, start=None):
+        """Page from ``start`` (``None`` for the newest entry) down to the
+        newest stored entry, ``newest`` is the first entry of an
+        interrupted pass."""
+        last = self.last_id(account_id)
+        # Entry ``1.11.0`` is included when stopping at it
+        first = 0 if last is None else last + 1
+        count = 0
+        while start is None or start >= first:
+            # A start of ``1.11.0`` stands for the newest entry, entry 0 is
+            # reached from ``1.11.1``
+            entries = self.blockchain.rpc.get_account_history(
+                account_id,
+                "1.11.{}".format(max(0, first - 1)),
+                self.page_size,
+                "1.11.{}".format(1 if start == 0 else start or 0),
+                api="history",
+            )
+            new = [e for e in entries if _instance(e["id"]) >= first]
+            if start is not None:
+                new = [e for e in new if _instance(e["id"]) <= start]
+            if not new:
+                break
+            if newest is None:
+                newest = _instance(new[0]["id"])
+            self.load_block_times(new)
+            oldest = _instance(new[-1]["id"])
+            with self.db:
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO operations VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [self.row(account_id, entry) for entry in new],
+                )
+                self.db.execute(
+                    "INSERT OR REPLACE INTO sync_progress VALUES (?, ?, ?)",
+                    (account_id, newest, oldest),
+                )
+            count += len(new)
+            # Entries come newest first, ``start`` is inclusive
+            start = oldest - 1
+            if len(entries) < self.page_size:
+                break
+        if newest is not None:
+            with self.db:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES (?, ?)",
+                    (account_id, newest),
+                )
+                self.db.execute(
+                    "DELETE FROM sync_progress WHERE account = ?", (account_id,)
+                )
+        return count
+
+    def sync(self, accounts):
+        """Bring the index up to date for a list of accounts.
+
+        :param list accounts: Account names or ids
+        :returns: Number of new operations per account id
+        :rtype: dict
+        """
+        return {
+            self.account_id(account): self.sync_account(account)
+            for account in accounts
+        }
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def query(
+        self,
+        account,
+        op_type=None,
+        counterparty=None,
+        asset=None,
+        incoming=None,
+        start=None,
+        stop=None,
+        limit=None,
+    ):
+        """Look up stored operations of an account, newest first.
+
+        :param str account: Account name or id
+        :param op_type: Operation type (name or id)
+        :param str counterparty: The other account of the operations
+        :param str asset: Asset (symbol or id) the operations are about
+        :param bool incoming: Only operations the account received
+            (``True``) or did not receive (``False``), e.g. the direction
+            of transfers
+        :param start: Earliest block time (``datetime`` or
+            ``%Y-%m-%dT%H:%M:%S``, inclusive)
+        :param stop: Latest block time (exclusive)
+        :param int limit: Maximum number of entries
+        :returns: History entries as obtained from the API with
+            ``block_time`` added
+        :rtype: list
+        """
+        where = ["account = ?"]
+        args = [self.account_id(account)]
+        if op_type is not None:
+            where.append("op_type = ?")
+            args.append(self.op_type(op_type))
+        if counterparty is not None:
+            where.append("counterparty = ?")
+            args.append(self.account_id(counterparty))
+        if asset is not None:
+            where.append("asset = ?")
+            args.append(self.asset_id(asset))
+        if incoming is not None:
+            where.append("incoming = ?")
+            args.append(bool(incoming))
+        if start is not None:
+            where.append("block_time >= ?")
+            args.append(formatTime(start) if isinstance(start, datetime) else start)
+        if stop is not None:
+            where.append("block_time < ?")
+            args.append(formatTime(stop) if isinstance(stop, datetime) else stop)
+        sql = "SELECT block_time, entry FROM operations WHERE {} ".format(
+            " AND ".join(where)
+        ) + "ORDER BY block_time DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT {:d}".format(limit)
+        results = []
+        for block_time, entry in self.db.execute(sql, args):
+            entry = json.loads(entry)
+            entry["block_time"] = block_time
+            results.append(entry)
+        return results
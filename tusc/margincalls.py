@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+from array import array
+from bisect import bisect_left, bisect_right
+
+from tuscapi.websocket import TUSCWebsocket
+
+from .asset import Asset
+from .instance import BlockchainInstance
+
+
+class MarginCallScanner(BlockchainInstance):
+    """
+    Index of all call orders (margin positions) of a bitasset, sorted by
+    collateral ratio.
+
+    :param str asset: Symbol or id of the bitasset
+    :param tusc.tusc.TUSC blockchain_instance: TUSC instance
+
+    Collateral, debt and the collateral-per-debt ratio of each position
+    are kept in parallel arrays that are sorted by ratio. Since the
+    ratio does not depend on the feed price, the positions that are
+    margin called at any feed price can be found by bisection.
+
+    .. code-block:: python
+
+        from tusc.margincalls import MarginCallScanner
+        scanner = MarginCallScanner("USD")
+        scanner.load()
+        scanner.called(-0.1)    # positions called if the feed drops by 10%
+
+    The index is kept up to date by passing the ``1.8.x`` (and ``2.4.x``
+    for feed changes) object notices of a subscription to
+    :func:`on_object` and :func:`on_object_removed`, :func:`subscribe`
+    returns a websocket that does so:
+
+    .. code-block:: python
+
+        scanner.subscribe().run_forever()
+    """
+
+    def __init__(self, asset, **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        self.asset = Asset(asset, full=True, blockchain_instance=self.blockchain)
+        assert self.asset.is_bitasset
+        self.backing = Asset(
+            self.asset["bitasset_data"]["options"]["short_backing_asset"],
+            blockchain_instance=self.blockchain,
+        )
+        self._ratios = array("d")
+        self._collateral = array("q")
+        self._debt = array("q")
+        self._ids = []
+        self._orders = {}
+        self.update_feed(self.asset["bitasset_data"]["current_feed"])
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, id):
+        return id in self._orders
+
+    def __repr__(self):
+        return "<%s %s positions=%d feed=%s>" % (
+            self.__class__.__name__,
+            self.asset["symbol"],
+            len(self),
+            self.feed_price,
+        )
+
+    # -------------------------------------------------------------------------
+    # Index
+    # -------------------------------------------------------------------------
+    def _ratio(self, call):
+        """Collateral per debt (in backing asset per bitasset)."""
+        return (int(call["collateral"]) / 10 ** self.backing["precision"]) / (
+            int(call["debt"]) / 10 ** self.asset["precision"]
+        )
+
+    def _insert(self, call):
+        ratio = self._ratio(call)
+        i = bisect_right(self._ratios, ratio)
+        self._ratios.insert(i, ratio)
+        self._collateral.insert(i, int(call["collateral"]))
+        self._debt.insert(i, int(call["debt"]))
+        self._ids.insert(i, call["id"])
+        self._orders[call["id"]] = call
+
+    def _remove(self, id):
+        call = self._orders.pop(id)
+        ratio = self._ratio(call)
+        i = bisect_left(self._ratios, ratio)
+        while self._ids[i] != id:
+            i += 1
+        del self._ratios[i]
+        del self._collateral[i]
+        del self._debt[i]
+        del self._ids[i]
+
+    def load(self):
+        """(Re)load all call orders of the asset."""
+        self._ratios = array("d")
+        self._collateral = array("q")
+        self._debt = array("q")
+        self._ids = []
+        self._orders = {}
+        calls = [c for c in self.asset.iter_call_orders(raw=True) if int(c["debt"])]
+        calls.sort(key=self._ratio)
+        for call in calls:
+            self._ratios.append(self._ratio(call))
+            self._collateral.append(int(call["collateral"]))
+            self._debt.append(int(call["debt"]))
+            self._ids.append(call["id"])
+            self._orders[call["id"]] = call
+        return self
+
+    def update(self, call):
+        """Add, replace or remove (if ``call`` is an id) a call order."""
+        if isinstance(call, str):
+            if call in self._orders:
+                self._remove(call)
+            return
+        if call["call_price"]["quote"]["asset_id"] != self.asset["id"]:
+            return
+        if call["id"] in self._orders:
+            self._remove(call["id"])
+        if int(call["debt"]):
+            self._insert(call)
+
+    def update_feed(self, feed):
+        """Set the feed from a raw ``current_feed`` (as found in the
+        bitasset data)."""
+        price = feed["settlement_price"]
+        base, quote = price["base"], price["quote"]
+        if base["asset_id"] != self.asset["id"]:
+            base, quote = quote, base
+        #: Feed price in bitasset per backing asset
+        self.feed_price = (int(base["amount"]) / 10 ** self.asset["precision"]) / (
+            int(quote["amount"]) / 10 ** self.backing["precision"]
+        )
+        #: Maintenance collateral ratio
+        self.mcr = feed["maintenance_collateral_ratio"] / 1000
+
+    def on_object(self, notice):
+        """Process an object notice of a subscription.
+
+        Call orders (``1.8.x``) of the asset update the index, the
+        bitasset data object (``2.4.x``) of the asset updates the feed.
+        """
+        id = notice.get("id", "")
+        if id.startswith("1.8."):
+            self.update(notice)
+        elif id == self.asset["bitasset_data_id"]:
+            self.update_feed(notice["current_feed"])
+
+    def on_object_removed(self, id):
+        """Process the id of an object removed from a subscription, closed
+        call orders (``1.8.x``) leave the index."""
+        if id.startswith("1.8."):
+            self.update(id)
+
+    def subscribe(self, **kwargs):
+        """Websocket that passes the call order and feed notices of the
+        asset to :func:`on_object` and :func:`on_object_removed`.
+
+        Keyword arguments are passed on to
+        :class:`tuscapi.websocket.TUSCWebsocket`, notices are processed
+        once ``run_forever()`` is called on it.
+        """
+        rpc = self.blockchain.rpc
+        return TUSCWebsocket(
+            urls=rpc.urls,
+            user=rpc.user,
+            password=rpc.password,
+            objects=["1.8.x", self.asset["bitasset_data_id"]],
+            on_object=self.on_object,
+            on_object_removed=self.on_object_removed,
+            **kwargs
+        )
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def _index(self, move):
+        if not self.feed_price:
+            return 0
+        return bisect_left(self._ratios, self.mcr / (self.feed_price * (1 + move)))
+
+    def count_called(self, move=0.0):
+        """Number of positions that are margin called if the feed price
+        (bitasset per backing asset) moves by ``move`` (e.g. ``-0.1``)."""
+        return self._index(move)
+
+    def called(self, move=0.0):
+        """Ids of the call orders that are margin called if the feed
+        price moves by ``move``, lowest collateral ratio first."""
+        return self._ids[: self._index(move)]
+
+    def debt_called(self, move=0.0):
+        """Total debt (in satoshi of the bitasset) that is called if the
+        feed price moves by ``move``."""
+        return sum(self._debt[: self._index(move)])
+
+    def collateral_called(self, move=0.0):
+        """Total collateral (in satoshi of the backing asset) that is
+        called if the feed price moves by ``move``."""
+        return sum(self._collateral[: self._index(move)])
+
+    def collateral_ratio(self, id):
+        """Current collateral ratio of a call order at the feed price."""
+        return self._ratio(self._orders[id]) * self.feed_price
+
+    def positions(self, move=0.0):
+        """Raw call orders that are called if the feed moves by ``move``."""
+        return [self._orders[id] for id in self.called(move)]
+
+    def move_to_call(self, id):
+        """Relative feed move at which a call order is margin called."""
+        return self.mcr / self.collateral_ratio(id) - 1
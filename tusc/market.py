@@ -539,19 +539,24 @@ class Market(dict):
             }
         )
 
-        if returnOrderId:
-            # Make blocking broadcasts
-            prevblocking = self.blockchain.blocking
-            self.blockchain.blocking = returnOrderId
-
         tx = self.blockchain.finalizeOp(order, account["name"], "active", **kwargs)
 
-        if returnOrderId and tx.get("operation_results"):
-            tx["orderid"] = tx["operation_results"][0][1]
-            self.blockchain.blocking = prevblocking
+        if returnOrderId:
+            self._add_order_id(tx, returnOrderId)
 
         return tx
 
+    def _add_order_id(self, tx, mode):
+        """Wait for a broadcast order to be included in a ``head`` or
+        ``irreversible`` block and add its id as ``orderid``."""
+        if "operation_results" not in tx:
+            if self.blockchain.nobroadcast or not tx.get("signatures"):
+                return
+            mode = "irreversible" if mode == "irreversible" else "head"
+            tracker = self.blockchain.confirmations(mode)
+            tx.update(tracker.wait(tx, timeout=tracker.timeout(tx)))
+        tx["orderid"] = tx["operation_results"][0][1]
+
     def sell(
         self,
         price,
@@ -630,16 +635,10 @@ class Market(dict):
                 "fill_or_kill": killfill,
             }
         )
-        if returnOrderId:
-            # Make blocking broadcasts
-            prevblocking = self.blockchain.blocking
-            self.blockchain.blocking = returnOrderId
-
         tx = self.blockchain.finalizeOp(order, account["name"], "active", **kwargs)
 
         if returnOrderId:
-            tx["orderid"] = tx["operation_results"][0][1]
-            self.blockchain.blocking = prevblocking
+            self._add_order_id(tx, returnOrderId)
 
         return tx
 
@@ -1,6 +1,19 @@
 # -*- coding: utf-8 -*-
+import itertools
+import random
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
 from graphenecommon.memo import Memo as GrapheneMemo
 from tuscbase.account import PrivateKey, PublicKey
+from tuscbase.memo import (
+    decode_memo_with_shared_secret,
+    encode_memo_with_shared_secret,
+    get_shared_secret,
+)
 
 from .account import Account
 from .instance import BlockchainInstance
@@ -9,6 +22,8 @@ from .exceptions import (
     AccountDoesNotExistsException,
     WrongMemoKey,
     InvalidMessageSignature,
+    KeyNotFound,
+    MissingKeyError,
 )
 
 
@@ -51,9 +66,380 @@ class Memo(GrapheneMemo):
         print(memo.decrypt(op_data["memo"]))
 
     if ``op_data`` being the payload of a transfer operation.
+
+    Shared secrets are cached (least recently used first, up to
+    :attr:`shared_secrets_size` key pairs), so many memos between the same
+    parties, e.g. with :func:`encrypt_many` and :func:`decrypt_many`, only
+    derive the secret once.
     """
 
     def define_classes(self):
         self.account_class = Account
         self.privatekey_class = PrivateKey
         self.publickey_class = PublicKey
+
+    #: Shared secrets indexed by the keys of both parties, least recently
+    #: used first
+    shared_secrets = OrderedDict()
+
+    #: Maximum number of key pairs in :attr:`shared_secrets`
+    shared_secrets_size = 1024
+
+    _shared_secrets_lock = threading.Lock()
+
+    #: Seconds a key that is not in the wallet is remembered as missing
+    missing_key_ttl = 10
+
+    def get_private_key(self, pubkey):
+        """Obtain (and keep) the private key for a public key from the
+        wallet.
+
+        :raises MissingKeyError: if the key is not in the wallet
+        """
+        if not hasattr(self, "_private_keys"):
+            self._private_keys = {}
+            self._missing_keys = {}
+        if pubkey in self._private_keys:
+            return self._private_keys[pubkey]
+        # Decrypting a history tries the keys of the other parties over and
+        # over again, misses are remembered for a short while
+        if self._missing_keys.get(pubkey, 0) <= time.monotonic():
+            try:
+                wif = self.blockchain.wallet.getPrivateKeyForPublicKey(pubkey)
+            except KeyNotFound:
+                wif = None
+            if wif:
+                self._missing_keys.pop(pubkey, None)
+                self._private_keys[pubkey] = self.privatekey_class(wif)
+                return self._private_keys[pubkey]
+            self._missing_keys[pubkey] = time.monotonic() + self.missing_key_ttl
+        raise MissingKeyError("Memo private key {} could not be found".format(pubkey))
+
+    def get_prefix(self):
+        """Public key prefix of the chain."""
+        if not hasattr(self, "chain_prefix"):
+            self.chain_prefix = self.blockchain.prefix
+        return self.chain_prefix
+
+    def cached_shared_secret(self, priv, pub):
+        """Shared secret between a private and a public key if it is
+        cached, ``None`` otherwise."""
+        # Keyed by public keys only, the cache must not hold private keys
+        key = (str(priv.pubkey), str(pub))
+        with self._shared_secrets_lock:
+            if key in self.shared_secrets:
+                self.shared_secrets.move_to_end(key)
+                return self.shared_secrets[key]
+
+    def cache_shared_secret(self, priv, pub, shared_secret):
+        """Add the shared secret between a private and a public key to the
+        cache."""
+        key = (str(priv.pubkey), str(pub))
+        with self._shared_secrets_lock:
+            self.shared_secrets[key] = shared_secret
+            while len(self.shared_secrets) > self.shared_secrets_size:
+                self.shared_secrets.popitem(last=False)
+
+    def get_shared_secret(self, priv, pub):
+        """Shared secret between a private and a public key (cached).
+
+        :param tuscbase.account.PrivateKey priv: Private key
+        :param str pub: Public key
+        """
+        shared_secret = self.cached_shared_secret(priv, pub)
+        if shared_secret is None:
+            shared_secret = get_shared_secret(
+                priv, self.publickey_class(pub, prefix=self.get_prefix())
+            )
+            self.cache_shared_secret(priv, pub, shared_secret)
+        return shared_secret
+
+    def encrypt(self, message):
+        """Encrypt a memo
+
+        :param str message: clear text memo message
+        :returns: encrypted message
+        :rtype: dict
+        """
+        if not message:
+            return None
+
+        nonce = str(random.getrandbits(64))
+        from_key = self.from_account["options"]["memo_key"]
+        to_key = self.to_account["options"]["memo_key"]
+        shared_secret = self.get_shared_secret(self.get_private_key(from_key), to_key)
+        return {
+            "message": encode_memo_with_shared_secret(shared_secret, nonce, message),
+            "nonce": nonce,
+            "from": from_key,
+            "to": to_key,
+        }
+
+    def encrypt_many(self, messages):
+        """Encrypt memos from :attr:`from_account` to many recipients
+
+        :param list messages: ``(to, message)`` tuples with the recipient
+            account (name, id or :class:`tusc.account.Account`) and the
+            clear text message
+        :returns: encrypted messages (``None`` for empty ones) in the order
+            of ``messages``
+        :rtype: list
+
+        Recipients are loaded with a single call to
+        :func:`tusc.tusc.TUSC.prefetch`.
+        """
+        messages = list(messages)
+        self.blockchain.prefetch(accounts=[to for to, message in messages])
+        recipients = {}
+        encrypted = []
+        for to, message in messages:
+            if isinstance(to, str):
+                if to not in recipients:
+                    recipients[to] = Account(to, blockchain_instance=self.blockchain)
+                to = recipients[to]
+            self.to_account = to
+            encrypted.append(self.encrypt(message))
+        return encrypted
+
+    def get_memo_keys(self, message):
+        """Private key from the wallet and public key of the other party
+        to decrypt a memo with.
+
+        :param dict message: encrypted memo message
+        :raises MissingKeyError: if none of the memo keys is in the wallet
+        """
+        # We first try to decode assuming we received the memo
+        try:
+            return self.get_private_key(message["to"]), message["from"]
+        except MissingKeyError:
+            try:
+                return self.get_private_key(message["from"]), message["to"]
+            except MissingKeyError:
+                raise MissingKeyError(
+                    "None of the required memo keys are installed! "
+                    "Need any of {}".format([message["to"], message["from"]])
+                )
+
+    def decrypt(self, message):
+        """Decrypt a memo
+
+        :param dict message: encrypted memo message
+        :returns: decrypted message
+        :rtype: str
+        :raises MissingKeyError: if none of the memo keys is in the wallet
+        """
+        if not message:
+            return None
+        priv, pub = self.get_memo_keys(message)
+        return decode_memo_with_shared_secret(
+            self.get_shared_secret(priv, pub),
+            int(message["nonce"]),
+            message["message"],
+        )
+
+    def decrypt_many(self, messages):
+        """Decrypt many memos, e.g. those of an account history
+
+        :param list messages: encrypted memo messages
+        :returns: decrypted messages in the order of ``messages``
+        :rtype: list
+
+        The shared secret is derived once per pair of memo keys.
+        """
+        return [self.decrypt(message) for message in messages]
+
+    def decrypt_operations(self, operations, processes=None):
+        """Decrypt the memos of many transfer operations on a pool of
+        processes, see :class:`MemoDecryptionPool`.
+
+        :param operations: Transfer operations, e.g. an account history
+        :param int processes: Number of worker processes (defaults to the
+            number of CPUs)
+        :returns: ``(message, error)`` tuples in the order of ``operations``
+        """
+        with MemoDecryptionPool(processes) as pool:
+            yield from pool.decrypt(self, operations)
+
+
+def _error(e):
+    return type(e).__name__, str(e)
+
+
+def decrypt_memos(job):
+    """Decrypt memos that are encrypted with the same pair of keys.
+
+    :param tuple job: Shared secret (``None`` if it has to be derived),
+        the keys ``(wif, public key, prefix)`` to derive it from and a
+        list of ``(nonce, message)`` tuples
+    :returns: The shared secret and one ``(message, error)`` tuple per
+        memo
+    :rtype: tuple
+
+    This is the function that runs in the worker processes. Deriving the
+    shared secret is the expensive part of decrypting, the keys are only
+    used for this job and not kept. A memo that fails to decrypt reports
+    its error as ``(type, message)`` strings instead of the message.
+    """
+    shared_secret, keys, memos = job
+    if shared_secret is None:
+        wif, pub, prefix = keys
+        try:
+            shared_secret = get_shared_secret(
+                PrivateKey(wif), PublicKey(pub, prefix=prefix)
+            )
+        except Exception as e:
+            return None, [(None, _error(e))] * len(memos)
+    results = []
+    for nonce, message in memos:
+        try:
+            message = decode_memo_with_shared_secret(shared_secret, int(nonce), message)
+        except Exception as e:
+            results.append((None, _error(e)))
+        else:
+            results.append((message, None))
+    return shared_secret, results
+
+
+class MemoDecryptionPool:
+    """
+    Decrypts the memos of many transfer operations on a pool of processes.
+
+    :param int processes: Number of worker processes (defaults to the
+        number of CPUs)
+
+    Operations are read in batches of :attr:`batch_size`. Within a batch
+    the memos are grouped by the pair of keys they are encrypted with, and
+    the workers derive the shared secret of each pair, which is the
+    expensive part. A job carries the private key of its pair only, and
+    workers do not keep it. Derived secrets are added to the cache of the
+    memo instance (see :func:`Memo.get_shared_secret`), pairs that are
+    cached already are sent with their shared secret instead of keys.
+
+    Decrypting with the pool pays off for memos with many different pairs
+    of keys, e.g. the deposits of an exchange. For few pairs,
+    :func:`Memo.decrypt_many` derives each secret once as well and
+    avoids the overhead of the processes (see
+    ``benchmarks/memos.py``).
+
+    The results come back in the order of the operations as ``(message,
+    error)`` tuples. Operations without a memo give ``(None, None)``, a
+    memo that cannot be decrypted (e.g. a missing key or a bad checksum)
+    gives ``(None, (type, message))`` with the name of the exception and
+    its message instead of raising.
+
+    .. code-block:: python
+
+        from tusc.memo import Memo, MemoDecryptionPool
+
+        memo = Memo(blockchain_instance=tusc)
+        history = account.history(only_ops=["transfer"])
+        with MemoDecryptionPool() as pool:
+            for message, error in pool.decrypt(memo, history):
+                print(message or error)
+
+    Operations may be given as account history entries, as
+    ``[type, payload]`` lists or as the payload itself.
+    """
+
+    #: Number of operations read at once
+    batch_size = 5000
+
+    #: Number of memos sent to a worker at once
+    chunksize = 250
+
+    def __init__(self, processes=None):
+        self.processes = processes
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.processes)
+        return self._executor
+
+    def close(self):
+        """Shut the worker processes down."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @staticmethod
+    def _memo(operation):
+        if "op" in operation:
+            operation = operation["op"]
+        if isinstance(operation, (list, tuple)):
+            operation = operation[1]
+        return operation.get("memo")
+
+    def decrypt_jobs(self, jobs):
+        """Run :func:`decrypt_memos` jobs, returns the results in order."""
+        if len(jobs) < 2 or self.processes == 1:
+            return [decrypt_memos(job) for job in jobs]
+        return list(self.executor.map(decrypt_memos, jobs))
+
+    def decrypt_batch(self, memo, operations):
+        """Decrypt the memos of a list of operations.
+
+        :param tusc.memo.Memo memo: Memo instance to look up keys with
+        :param list operations: Transfer operations
+        :returns: ``(message, error)`` tuples in order
+        :rtype: list
+        """
+        results = [(None, None)] * len(operations)
+        groups = {}
+        for i, operation in enumerate(operations):
+            message = self._memo(operation)
+            if not message:
+                continue
+            try:
+                priv, pub = memo.get_memo_keys(message)
+            except Exception as e:
+                results[i] = (None, _error(e))
+                continue
+            key = (str(priv.pubkey), str(pub))
+            if key not in groups:
+                groups[key] = (priv, pub, [])
+            groups[key][2].append((i, message["nonce"], message["message"]))
+
+        jobs, rows, pairs = [], [], []
+        prefix = memo.get_prefix()
+        for priv, pub, memos in groups.values():
+            shared_secret = memo.cached_shared_secret(priv, pub)
+            keys = None if shared_secret else (str(priv), str(pub), prefix)
+            for start in range(0, len(memos), self.chunksize):
+                chunk = memos[start : start + self.chunksize]
+                jobs.append((shared_secret, keys, [memo[1:] for memo in chunk]))
+                rows.append([memo[0] for memo in chunk])
+                pairs.append((priv, pub))
+        decrypted = self.decrypt_jobs(jobs)
+        for (priv, pub), indices, (shared_secret, messages) in zip(
+            pairs, rows, decrypted
+        ):
+            if shared_secret is not None:
+                memo.cache_shared_secret(priv, pub, shared_secret)
+            for i, result in zip(indices, messages):
+                results[i] = result
+        return results
+
+    def decrypt(self, memo, operations):
+        """
+        Decrypt the memos of transfer operations.
+
+        :param tusc.memo.Memo memo: Memo instance to look up keys with
+        :param operations: Iterable of transfer operations, it is consumed
+            in batches so it may be a generator over a long history
+        :returns: Generator of ``(message, error)`` tuples in the order of
+            ``operations``
+        """
+        operations = iter(operations)
+        while True:
+            batch = list(itertools.islice(operations, self.batch_size))
+            if not batch:
+                return
+            yield from self.decrypt_batch(memo, batch)
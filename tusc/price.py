@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from fractions import Fraction
+from math import gcd
 
 from .account import Account
 from .amount import Amount
@@ -399,3 +400,281 @@ class PriceFeed(dict):
                     ),
                 },
             )
+
+
+class RationalPrice:
+    """
+    Immutable, lightweight price for hot loops.
+
+    The price is kept as an integer ratio of satoshis ``base/quote`` and
+    carries only asset ids and precisions. The floating point value is
+    computed once. Comparison, inversion and multiplication are pure
+    integer operations and never touch the API.
+
+    :param int base_amount: Amount of the base asset in satoshis
+    :param int quote_amount: Amount of the quote asset in satoshis
+    :param str base_asset_id: Id of the base asset
+    :param str quote_asset_id: Id of the quote asset
+    :param int base_precision: Precision of the base asset
+    :param int quote_precision: Precision of the quote asset
+
+    .. code-block:: python
+
+        from tusc.price import RationalPrice
+        p = RationalPrice(31500, 100000, "1.3.121", "1.3.0", 4, 5)
+        float(p)                 # 3.15
+        p.invert()               # 0.31746... 1.3.0/1.3.121
+        p > RationalPrice(3, 1, "1.3.121", "1.3.0", 4, 5)
+        p.to_price()             # tusc.price.Price
+
+    Use :func:`RationalPrice.from_price` and :func:`RationalPrice.to_price`
+    to convert from and to :class:`tusc.price.Price`. Prices are only equal
+    to other prices (of the same market, in either orientation), they can
+    be ordered against numbers as well.
+    """
+
+    __slots__ = (
+        "numerator",
+        "denominator",
+        "base_asset_id",
+        "quote_asset_id",
+        "base_precision",
+        "quote_precision",
+        "_float",
+    )
+
+    def __init__(
+        self,
+        base_amount,
+        quote_amount,
+        base_asset_id,
+        quote_asset_id,
+        base_precision,
+        quote_precision,
+    ):
+        base_amount, quote_amount = int(base_amount), int(quote_amount)
+        if quote_amount < 0:
+            base_amount, quote_amount = -base_amount, -quote_amount
+        divisor = gcd(base_amount, quote_amount) or 1
+        setter = object.__setattr__
+        setter(self, "numerator", base_amount // divisor)
+        setter(self, "denominator", quote_amount // divisor)
+        setter(self, "base_asset_id", base_asset_id)
+        setter(self, "quote_asset_id", quote_asset_id)
+        setter(self, "base_precision", base_precision)
+        setter(self, "quote_precision", quote_precision)
+        if self.denominator:
+            value = (self.numerator / self.denominator) * 10 ** (
+                quote_precision - base_precision
+            )
+        else:
+            value = float("Inf")
+        setter(self, "_float", value)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("RationalPrice is immutable")
+
+    @classmethod
+    def from_price(cls, price):
+        """Create an instance from a :class:`tusc.price.Price`."""
+        return cls(
+            int(price["base"]),
+            int(price["quote"]),
+            price["base"]["asset"]["id"],
+            price["quote"]["asset"]["id"],
+            price["base"]["asset"]["precision"],
+            price["quote"]["asset"]["precision"],
+        )
+
+    @classmethod
+    def from_dict(cls, price, precisions):
+        """Create an instance from a raw price object as returned by the API.
+
+        :param dict price: ``{"base": {..}, "quote": {..}}`` with
+            ``amount`` and ``asset_id`` each
+        :param dict precisions: Maps asset ids to their precision, e.g. an
+            instance of :class:`tusc.assetregistry.AssetRegistry` works
+            through its ``precision`` method as well
+        """
+        base, quote = price["base"], price["quote"]
+        lookup = getattr(precisions, "precision", None) or precisions.__getitem__
+        return cls(
+            base["amount"],
+            quote["amount"],
+            base["asset_id"],
+            quote["asset_id"],
+            lookup(base["asset_id"]),
+            lookup(quote["asset_id"]),
+        )
+
+    def to_price(self, **kwargs):
+        """Return an instance of :class:`tusc.price.Price`."""
+        return Price(self.json(), **kwargs)
+
+    def json(self):
+        return {
+            "base": {"amount": self.numerator, "asset_id": self.base_asset_id},
+            "quote": {"amount": self.denominator, "asset_id": self.quote_asset_id},
+        }
+
+    @property
+    def fraction(self):
+        """The satoshi ratio ``base/quote`` as :class:`fractions.Fraction`."""
+        return Fraction(self.numerator, self.denominator)
+
+    def invert(self):
+        """Return the inverted price (e.g. ``USD/TUSC`` to ``TUSC/USD``)."""
+        return RationalPrice(
+            self.denominator,
+            self.numerator,
+            self.quote_asset_id,
+            self.base_asset_id,
+            self.quote_precision,
+            self.base_precision,
+        )
+
+    def as_base(self, asset_id):
+        """Return the price with ``asset_id`` as base asset."""
+        if asset_id == self.base_asset_id:
+            return self
+        elif asset_id == self.quote_asset_id:
+            return self.invert()
+        raise InvalidAssetException
+
+    def as_quote(self, asset_id):
+        """Return the price with ``asset_id`` as quote asset."""
+        if asset_id == self.quote_asset_id:
+            return self
+        elif asset_id == self.base_asset_id:
+            return self.invert()
+        raise InvalidAssetException
+
+    def _aligned(self, other):
+        """Return the numerator and denominator of ``other`` in our pair."""
+        if (
+            other.base_asset_id == self.base_asset_id
+            and other.quote_asset_id == self.quote_asset_id
+        ):
+            return other.numerator, other.denominator
+        elif (
+            other.base_asset_id == self.quote_asset_id
+            and other.quote_asset_id == self.base_asset_id
+        ):
+            return other.denominator, other.numerator
+        raise InvalidAssetException
+
+    def _compare(self, other):
+        if isinstance(other, RationalPrice):
+            numerator, denominator = self._aligned(other)
+            return self.numerator * denominator - numerator * self.denominator
+        return self._float - float(other)
+
+    def __eq__(self, other):
+        # Only prices are equal to prices: a price equals its inverse, so a
+        # hash that agrees with equality to numbers does not exist
+        if not isinstance(other, RationalPrice):
+            return NotImplemented
+        try:
+            return self._compare(other) == 0
+        except InvalidAssetException:
+            return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        return self._compare(other) < 0
+
+    def __le__(self, other):
+        return self._compare(other) <= 0
+
+    def __gt__(self, other):
+        return self._compare(other) > 0
+
+    def __ge__(self, other):
+        return self._compare(other) >= 0
+
+    def __hash__(self):
+        # A price equals its inverse, hash both in the same orientation
+        if self.base_asset_id <= self.quote_asset_id:
+            return hash(
+                (
+                    self.numerator,
+                    self.denominator,
+                    self.base_asset_id,
+                    self.quote_asset_id,
+                )
+            )
+        numerator, denominator = self.denominator, self.numerator
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        return hash((numerator, denominator, self.quote_asset_id, self.base_asset_id))
+
+    def __float__(self):
+        return self._float
+
+    def __bool__(self):
+        return bool(self.numerator)
+
+    def __mul__(self, other):
+        if isinstance(other, RationalPrice):
+            # a/b * b/c = a/c
+            if self.quote_asset_id == other.base_asset_id:
+                base, quote = self, other
+            # a/b * c/a = c/b
+            elif self.base_asset_id == other.quote_asset_id:
+                base, quote = other, self
+            else:
+                raise InvalidAssetException
+            return RationalPrice(
+                self.numerator * other.numerator,
+                self.denominator * other.denominator,
+                base.base_asset_id,
+                quote.quote_asset_id,
+                base.base_precision,
+                quote.quote_precision,
+            )
+        frac = Fraction(other)
+        return RationalPrice(
+            self.numerator * frac.numerator,
+            self.denominator * frac.denominator,
+            self.base_asset_id,
+            self.quote_asset_id,
+            self.base_precision,
+            self.quote_precision,
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, RationalPrice):
+            if {other.base_asset_id, other.quote_asset_id} == {
+                self.base_asset_id,
+                self.quote_asset_id,
+            }:
+                # Same market: the ratio of both prices
+                numerator, denominator = self._aligned(other)
+                return (self.numerator * denominator) / (self.denominator * numerator)
+            return self * other.invert()
+        return self * (1 / Fraction(other))
+
+    def __repr__(self):
+        return "{price:.{precision}f} {base}/{quote}".format(
+            price=self._float,
+            base=self.base_asset_id,
+            quote=self.quote_asset_id,
+            precision=self.base_precision + self.quote_precision,
+        )
+
+    def __reduce__(self):
+        return (
+            RationalPrice,
+            (
+                self.numerator,
+                self.denominator,
+                self.base_asset_id,
+                self.quote_asset_id,
+                self.base_precision,
+                self.quote_precision,
+            ),
+        )
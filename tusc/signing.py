@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+
+from concurrent.futures import ProcessPoolExecutor
+
+from graphenebase.types import Array, Signature
+from tuscbase.chains import known_chains
+from tuscbase.ecdsa import get_backend, set_backend, sign_message
+
+from .exceptions import MissingKeyError
+
+log = logging.getLogger(__name__)
+
+
+def sign_digest_message(job):
+    """Sign a message with each of the given keys.
+
+    :param tuple job: The message (chain id followed by the serialized
+        transaction) and a list of WIF keys
+    :returns: One signature per key
+    :rtype: list
+
+    This is the function that runs in the worker processes. Only the
+    message and the WIF strings are sent, both pickle cheaply.
+    """
+    message, wifs = job
+    return [sign_message(message, wif) for wif in wifs]
+
+
+class SigningPool:
+    """
+    Signs many independent transactions on a pool of processes.
+
+    :param int processes: Number of worker processes (defaults to the
+        number of CPUs)
+
+    Signing is the expensive part of building a transaction with the pure
+    Python ECDSA implementation. The pool derives the digest of each
+    transaction in the calling process and only sends the message and the
+    private keys to the workers. The signed transactions are returned in
+    the order they were passed in.
+
+    .. code-block:: python
+
+        from tusc.signing import SigningPool
+
+        with SigningPool() as pool:
+            pool.sign(txs, ["5K..."], chain="TUSC")
+
+    Transaction builders are signed with :func:`tusc.tusc.TUSC.sign_many`.
+    """
+
+    #: Number of transactions sent to a worker at once
+    chunksize = 8
+
+    def __init__(self, processes=None):
+        self.processes = processes
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            # Workers sign with the backend that is active here
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                initializer=set_backend,
+                initargs=(get_backend().name,),
+            )
+        return self._executor
+
+    def close(self):
+        """Shut the worker processes down."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @staticmethod
+    def _job(tx, wifs, chain):
+        tx.deriveDigest(chain)
+        return tx.message, sorted(set(str(wif) for wif in wifs))
+
+    @staticmethod
+    def _apply(tx, signatures):
+        tx.data["signatures"] = Array([Signature(sig) for sig in signatures])
+        return tx
+
+    def sign_messages(self, jobs):
+        """Sign ``(message, wifs)`` jobs, returns the signatures in order."""
+        jobs = list(jobs)
+        if len(jobs) < 2 or self.processes == 1:
+            return [sign_digest_message(job) for job in jobs]
+        return list(
+            self.executor.map(sign_digest_message, jobs, chunksize=self.chunksize)
+        )
+
+    def sign(self, transactions, wifs, chain=None):
+        """
+        Sign transactions with the same keys.
+
+        :param list transactions: Instances of
+            :class:`tuscbase.signedtransactions.Signed_Transaction`
+        :param list wifs: Private keys (WIF)
+        :param chain: Chain identifier or chain parameters
+        :returns: The signed transactions, in order
+        """
+        return self.sign_each([(tx, wifs) for tx in transactions], chain=chain)
+
+    def sign_each(self, transactions, chain=None):
+        """
+        Sign transactions with individual keys.
+
+        :param list transactions: ``(transaction, wifs)`` tuples
+        :param chain: Chain identifier or chain parameters
+        :returns: The signed transactions, in order
+        """
+        transactions = list(transactions)
+        jobs = [self._job(tx, wifs, chain) for tx, wifs in transactions]
+        return [
+            self._apply(tx, signatures)
+            for (tx, _), signatures in zip(transactions, self.sign_messages(jobs))
+        ]
+
+    async def sign_messages_async(self, jobs):
+        """Sign ``(message, wifs)`` jobs without blocking the event loop."""
+        loop = asyncio.get_event_loop()
+        return await asyncio.gather(
+            *[
+                loop.run_in_executor(self.executor, sign_digest_message, job)
+                for job in jobs
+            ]
+        )
+
+    async def sign_each_async(self, transactions, chain=None):
+        """Async version of :func:`sign_each`."""
+        transactions = list(transactions)
+        jobs = [self._job(tx, wifs, chain) for tx, wifs in transactions]
+        signatures = await self.sign_messages_async(jobs)
+        return [
+            self._apply(tx, sigs) for (tx, _), sigs in zip(transactions, signatures)
+        ]
+
+
+def builder_chain(builder):
+    """Chain parameters to sign a builder for.
+
+    As in the builder's own ``sign()``, these are the parameters of the
+    node, or offline those stored in the builder. Offline builders
+    without parameters are signed for the TUSC chain.
+    """
+    if builder.blockchain.rpc:
+        return builder.blockchain.rpc.chain_params
+    return builder.get("blockchain") or known_chains["TUSC"]
+
+
+def prepare_builder(builder):
+    """Set the prefix and check the keys of a constructed builder."""
+    builder.operations.default_prefix = builder_chain(builder)["prefix"]
+    if not any(builder.wifs):
+        raise MissingKeyError
+    return builder.tx, builder.wifs
+
+
+def finish_builder(builder):
+    """Copy the signatures of the signed transaction into the builder."""
+    builder["signatures"].extend(builder.tx.json().get("signatures"))
+    return builder
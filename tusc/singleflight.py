@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import threading
+
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Merges concurrent calls with the same key into one.
+
+    The first thread calling :func:`do` with a key runs the function,
+    threads calling it with the same key in the meantime wait for that
+    call and share its result (or exception).
+
+    .. code-block:: python
+
+        flight = SingleFlight()
+        flight.do(("account", "init0"), rpc.lookup_account_names, ["init0"])
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def __len__(self):
+        return len(self._calls)
+
+    def do(self, key, fn, *args, **kwargs):
+        """Call ``fn(*args, **kwargs)`` unless a call with ``key`` is in
+        flight, return its result."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+#: Lookups of blockchain objects in flight, shared by all instances
+lookups = SingleFlight()
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import os
+
 from graphenestorage import (
     InRamConfigurationStore,
     InRamEncryptedKeyStore,
@@ -25,3 +27,8 @@ def get_default_key_store(config, *args, **kwargs):
     if "appname" not in kwargs:
         kwargs["appname"] = "tusc"
     return SqliteEncryptedKeyStore(config=config, **kwargs)
+
+
+def get_default_data_dir(appname="tusc"):
+    """Directory that holds the local stores (next to the sqlite wallet)."""
+    return os.path.dirname(SQLiteFile(appname=appname).sqlite_file)
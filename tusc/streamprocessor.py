@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+import logging
+import os
+import sqlite3
+import time
+
+from collections import namedtuple
+from contextlib import closing
+
+from .blockchain import Blockchain, block_operations, operation_ids
+from .instance import BlockchainInstance
+from .storage import get_default_data_dir
+
+log = logging.getLogger(__name__)
+
+#: Position of an operation in the chain
+Checkpoint = namedtuple("Checkpoint", ["block_num", "trx_in_block", "op_in_trx"])
+
+schema = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name TEXT PRIMARY KEY,
+    block_num INTEGER NOT NULL,
+    trx_in_block INTEGER NOT NULL,
+    op_in_trx INTEGER NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+
+class StreamProcessor(BlockchainInstance):
+    """
+    Resumable stream of operations with checkpoints in SQLite.
+
+    :param str name: Name of the consumer, every name has its own
+        checkpoint
+    :param list opNames: Operations (names or ids) to stream (defaults
+        to all)
+    :param str path: Database file (defaults to a file in the user data
+        directory that is keyed by the chain id)
+    :param str mode: Stream ``irreversible`` (default) or ``head`` blocks
+    :param tusc.tusc.TUSC blockchain_instance: TUSC instance
+
+    The processor keeps the position (block number, transaction index and
+    operation index) of the last acknowledged operation. On restart, the
+    stream continues with the operation after it. Positions are written to
+    the database once :attr:`checkpoint_interval` operations have been
+    acknowledged or :attr:`checkpoint_timeout` seconds have passed, and
+    when the stream ends, so that saving them does not slow the stream
+    down. Operations after the last saved checkpoint are delivered again
+    after a crash (at-least-once delivery).
+
+    .. code-block:: python
+
+        from tusc.streamprocessor import StreamProcessor
+
+        processor = StreamProcessor("payments", ["transfer"])
+        processor.run(handle_transfer, start=1000)
+
+    :func:`run` acknowledges an operation once the handler returns. With
+    :func:`stream`, an operation is acknowledged when the next one is
+    requested or the stream is exhausted.
+
+    .. note:: Only irreversible blocks are guaranteed to stay the same,
+              resuming within ``head`` blocks may miss or repeat
+              operations after a chain reorganization.
+    """
+
+    #: Number of acknowledged operations after which the checkpoint is saved
+    checkpoint_interval = 1000
+
+    #: Seconds after which the checkpoint is saved at the latest
+    checkpoint_timeout = 10
+
+    def __init__(self, name, opNames=[], path=None, mode="irreversible", **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        if path is None:
+            path = os.path.join(
+                get_default_data_dir(),
+                "streams-{}.sqlite".format(
+                    self.blockchain.rpc.chain_params["chain_id"][:16]
+                ),
+            )
+        self.name = name
+        self.path = path
+        self.reader = Blockchain(mode=mode, blockchain_instance=self.blockchain)
+        self.op_ids = operation_ids(opNames)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(schema)
+        #: Position of the last acknowledged operation
+        self.position = self.checkpoint
+        self._saved = self.position
+        self._pending = 0
+        self._last_save = time.time()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return "<%s %s %s>" % (self.__class__.__name__, self.name, self.position)
+
+    def close(self):
+        """Save the checkpoint and close the database."""
+        self.save()
+        self.db.close()
+
+    # -------------------------------------------------------------------------
+    # Checkpoints
+    # -------------------------------------------------------------------------
+    @property
+    def checkpoint(self):
+        """The saved :class:`Checkpoint` (``None`` if there is none)."""
+        row = self.db.execute(
+            "SELECT block_num, trx_in_block, op_in_trx FROM checkpoints "
+            "WHERE name = ?",
+            (self.name,),
+        ).fetchone()
+        return Checkpoint(*row) if row else None
+
+    def save(self):
+        """Write the position of the last acknowledged operation."""
+        if self.position is not None and self.position != self._saved:
+            with self.db:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?)",
+                    (self.name,) + tuple(self.position) + (time.time(),),
+                )
+            log.debug("Saved checkpoint %s of %s", self.position, self.name)
+            self._saved = self.position
+        self._pending = 0
+        self._last_save = time.time()
+
+    def reset(self):
+        """Forget the checkpoint, the next stream starts from scratch."""
+        with self.db:
+            self.db.execute("DELETE FROM checkpoints WHERE name = ?", (self.name,))
+        self.position = self._saved = None
+
+    def acknowledge(self, position, count=1):
+        """Mark everything up to ``position`` as processed, the checkpoint
+        is saved if due."""
+        self.position = position
+        self._pending += count
+        if (
+            self._pending >= self.checkpoint_interval
+            or time.time() - self._last_save >= self.checkpoint_timeout
+        ):
+            self.save()
+
+    # -------------------------------------------------------------------------
+    # Streaming
+    # -------------------------------------------------------------------------
+    def operations(self, start=None, stop=None):
+        """Operations after the last acknowledged one, without
+        acknowledging any.
+
+        :param int start: Block to start at if there is no checkpoint
+            (defaults to the current block)
+        :param int stop: Stop at this block
+        :returns: Generator of ``(position, operation)`` tuples
+        """
+        resume = self.position
+        if resume is not None:
+            start = resume.block_num
+        for block in self.reader.blocks(start=start, stop=stop):
+            block_num = block["block_num"]
+            for trx_in_block, op_in_trx, r in block_operations(block, self.op_ids):
+                position = Checkpoint(block_num, trx_in_block, op_in_trx)
+                if resume is not None and position <= resume:
+                    continue
+                r["trx_in_block"] = trx_in_block
+                r["op_in_trx"] = op_in_trx
+                yield position, r
+            # Past the last operation of the block, a restart does not go
+            # through it again
+            yield Checkpoint(block_num, len(block["transactions"]), 0), None
+
+    def stream(self, start=None, stop=None):
+        """Yield the operations after the last acknowledged one.
+
+        :param int start: Block to start at if there is no checkpoint
+            (defaults to the current block)
+        :param int stop: Stop at this block
+
+        Operations are dicts like those of
+        :func:`tusc.blockchain.Blockchain.stream` with ``trx_in_block`` and
+        ``op_in_trx`` added. An operation is acknowledged once the next one
+        is requested. The checkpoint is saved when the generator ends or is
+        closed.
+        """
+        try:
+            for position, operation in self.operations(start=start, stop=stop):
+                if operation is None:
+                    self.acknowledge(position, count=0)
+                    continue
+                yield operation
+                self.acknowledge(position)
+        finally:
+            self.save()
+
+    def run(self, handler, start=None, stop=None):
+        """Call ``handler`` with every operation after the last acknowledged
+        one.
+
+        :param callable handler: Called with each operation, the operation
+            is acknowledged when it returns
+        :param int start: Block to start at if there is no checkpoint
+            (defaults to the current block)
+        :param int stop: Stop at this block
+        :returns: Number of operations handled
+
+        If the handler raises, the checkpoint of the operations before is
+        saved and the exception propagates, the failed operation is
+        delivered again on the next run.
+        """
+        count = 0
+        with closing(self.stream(start=start, stop=stop)) as operations:
+            for operation in operations:
+                handler(operation)
+                count += 1
+        return count
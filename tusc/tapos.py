@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+import logging
+import struct
+import threading
+import time
+
+from binascii import unhexlify
+
+from .instance import BlockchainInstance
+
+log = logging.getLogger(__name__)
+
+
+def block_params(block_num, block_id):
+    """``ref_block_num`` and ``ref_block_prefix`` referencing a block.
+
+    :param int block_num: Number of the block
+    :param str block_id: Id of the block (hex)
+    """
+    return block_num & 0xFFFF, struct.unpack_from("<I", unhexlify(block_id), 4)[0]
+
+
+class TaposCache(BlockchainInstance):
+    """
+    Reference block (TaPoS) parameters of transactions, shared by the
+    transaction builders.
+
+    :param tusc.tusc.TUSC blockchain_instance: TUSC instance
+
+    Transactions reference a recent block by ``ref_block_num`` and
+    ``ref_block_prefix``. Any block of the last 65536 stays a valid
+    reference, so instead of asking the node for each transaction the
+    parameters are reused for ``refresh_interval`` seconds. They are
+    dropped with :func:`invalidate` when a broadcast fails.
+
+    The parameters are stored by chain id in a class attribute, so all
+    builders of all instances (including :mod:`tusc.aio`) connected to the
+    same chain share them. Concurrent builders wait for a single request
+    to the node.
+
+    Use the shared instance of a blockchain instance:
+
+    .. code-block:: python
+
+        from tusc import TUSC
+        tusc = TUSC()
+        tusc.tapos.refresh_interval = 60
+        tusc.tapos.get()                   # (ref_block_num, ref_block_prefix)
+    """
+
+    #: Seconds the parameters are reused before fetching them again
+    refresh_interval = 300
+
+    #: Reference the head block instead of the last irreversible block
+    use_head_block = False
+
+    #: ``(ref_block_num, ref_block_prefix, time fetched)`` by chain id and
+    #: :attr:`use_head_block`
+    _params = {}
+    _lock = threading.Lock()
+
+    @property
+    def key(self):
+        return self.blockchain.rpc.chain_params["chain_id"], self.use_head_block
+
+    def _cached(self, key):
+        params = self._params.get(key)
+        if params and time.monotonic() - params[2] < self.refresh_interval:
+            return params[:2]
+
+    def _store(self, key, ref_block_num, ref_block_prefix):
+        self._params[key] = (ref_block_num, ref_block_prefix, time.monotonic())
+        log.debug("Reference block %d:%d", ref_block_num, ref_block_prefix)
+        return ref_block_num, ref_block_prefix
+
+    def fetch(self):
+        """Obtain the parameters from the node (bypasses the cache)."""
+        rpc = self.blockchain.rpc
+        dgp = rpc.get_dynamic_global_properties()
+        if self.use_head_block:
+            return block_params(dgp["head_block_number"], dgp["head_block_id"])
+        # Block headers have no id, the following block references it
+        block_num = int(dgp["last_irreversible_block_num"])
+        block = rpc.get_block_header(block_num + 1)
+        return block_params(block_num, block["previous"])
+
+    def get(self):
+        """Return ``(ref_block_num, ref_block_prefix)``, fetched from the
+        node if not cached or older than :attr:`refresh_interval`."""
+        key = self.key
+        params = self._cached(key)
+        if params:
+            return params
+        with self._lock:
+            # Another thread may have fetched them in the meantime
+            params = self._cached(key)
+            if params:
+                return params
+            return self._store(key, *self.fetch())
+
+    def invalidate(self):
+        """Drop the parameters, the next transaction fetches new ones."""
+        self._params.pop(self.key, None)
@@ -6,7 +6,7 @@ from graphenecommon.transactionbuilder import (
 
 from tuscbase import operations, transactions
 from tuscbase.account import PrivateKey, PublicKey
-from tuscbase.objects import Operation
+from tuscbase.objects import Asset as AssetAmount, Operation
 from tuscbase.signedtransactions import Signed_Transaction
 
 from .amount import Amount
@@ -51,3 +51,49 @@ class TransactionBuilder(GrapheneTransactionBuilder):
         self.publickey_class = PublicKey
         self.signed_transaction_class = Signed_Transaction
         self.amount_class = Amount
+
+    #: Compute the fees of common operations locally (see
+    #: :func:`tusc.fees.FeeSchedule.calculate`)
+    compute_fees_locally = True
+
+    def add_required_fees(self, ops, asset_id="1.3.0"):
+        """Obtain the required fees for a set of operations.
+
+        Fees in the core asset of the operations supported by
+        :func:`tusc.fees.FeeSchedule.calculate` are computed locally from
+        the shared fee schedule; the node is only asked for the remaining
+        operations (e.g. proposals) and for fees in other assets.
+        """
+        remaining = ops
+        if self.compute_fees_locally and asset_id == "1.3.0":
+            remaining = self._add_local_fees(self.blockchain.fee_schedule, ops)
+        if remaining:
+            super().add_required_fees(remaining, asset_id=asset_id)
+        return ops
+
+    def _add_local_fees(self, fee_schedule, ops):
+        remaining = []
+        for op in ops:
+            fee = fee_schedule.calculate(op)
+            if fee is None:
+                remaining.append(op)
+            else:
+                op.op.data["fee"] = AssetAmount(amount=fee, asset_id="1.3.0")
+        return remaining
+
+    def get_block_params(self, use_head_block=False):
+        """Obtain ``ref_block_num`` and ``ref_block_prefix`` from the
+        reference block parameters shared by the builders (see
+        :class:`tusc.tapos.TaposCache`)."""
+        if use_head_block:
+            return super().get_block_params(use_head_block=True)
+        return self.blockchain.tapos.get()
+
+    def broadcast(self):
+        """Broadcast the transaction, a failure invalidates the shared
+        reference block parameters."""
+        try:
+            return super().broadcast()
+        except Exception:
+            self.blockchain.tapos.invalidate()
+            raise
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 import logging
+import re
+import time
 
 from datetime import datetime, timedelta
 
@@ -9,12 +11,18 @@ from tuscapi.tuscnoderpc import TUSCNodeRPC
 from tuscbase import operations
 from tuscbase.account import PublicKey
 from tuscbase.asset_permissions import asset_permissions, toint
+from tuscbase.objects import Operation
+from tuscbase.serializer import serialize_transaction
 
 from .account import Account
 from .amount import Amount
 from .asset import Asset
 from .committee import Committee
-from .exceptions import AccountExistsException, KeyAlreadyInStoreException
+from .exceptions import (
+    AccountDoesNotExistsException,
+    AccountExistsException,
+    KeyAlreadyInStoreException,
+)
 from .instance import set_shared_blockchain_instance, shared_blockchain_instance
 from .price import Price
 from .storage import get_default_config_store
@@ -113,6 +121,21 @@ class TUSC(AbstractGrapheneChain):
     This class also deals with edits, votes and reading content.
     """
 
+    #: Instance of :class:`tusc.assetregistry.AssetRegistry` once loaded
+    asset_registry = None
+
+    #: Instance of :class:`tusc.blockstore.BlockStore` once opened
+    block_store = None
+
+    #: Seconds prefetched objects are kept
+    prefetch_expiration = 60
+
+    _prefetched = None
+    _fee_schedule = None
+    _tapos = None
+    _confirmation_trackers = None
+    _irreversible_block_num = 0
+
     def define_classes(self):
         from .blockchainobject import BlockchainObject
 
@@ -124,6 +147,256 @@ class TUSC(AbstractGrapheneChain):
         self.transactionbuilder_class = TransactionBuilder
         self.blockchainobject_class = BlockchainObject
 
+    # -------------------------------------------------------------------------
+    # Asset registry
+    # -------------------------------------------------------------------------
+    def load_asset_registry(self, path=None, max_age=None):
+        """
+        Load all assets of the chain into a local registry.
+
+        Once loaded, :class:`tusc.asset.Asset` resolves symbols to ids from
+        the registry instead of querying the node for each of them.
+
+        :param str path: (optional) Snapshot file to read from and write to
+            (defaults to a file keyed by chain id in the user data directory)
+        :param int max_age: (optional) Fetch all assets from the node again
+            if they were last fetched more than this many blocks ago
+        :returns: Instance of :class:`tusc.assetregistry.AssetRegistry`
+        """
+        from .assetregistry import AssetRegistry
+
+        registry = AssetRegistry(path=path, blockchain_instance=self)
+        registry.load(max_age=max_age)
+        self.asset_registry = registry
+        return registry
+
+    # -------------------------------------------------------------------------
+    # Block store
+    # -------------------------------------------------------------------------
+    def open_block_store(self, path=None):
+        """
+        Keep irreversible blocks in a local store.
+
+        Once opened, :class:`tusc.block.Block` and
+        :func:`tusc.blockchain.Blockchain.blocks` read blocks from the store
+        and add the irreversible blocks they obtain from the node.
+
+        :param str path: (optional) Directory of the store (defaults to a
+            directory keyed by chain id in the user data directory)
+        :returns: Instance of :class:`tusc.blockstore.BlockStore`
+        """
+        from .blockstore import BlockStore
+
+        if not path:
+            path = BlockStore.default_path(self.rpc.chain_params["chain_id"])
+        self.block_store = BlockStore(path)
+        return self.block_store
+
+    def is_irreversible(self, block_num):
+        """
+        Tell whether a block is irreversible.
+
+        The node is only asked for blocks beyond the last irreversible block
+        that is known already.
+        """
+        if block_num > self._irreversible_block_num:
+            self._irreversible_block_num = self.rpc.get_dynamic_global_properties()[
+                "last_irreversible_block_num"
+            ]
+        return block_num <= self._irreversible_block_num
+
+    # -------------------------------------------------------------------------
+    # Prefetching
+    # -------------------------------------------------------------------------
+    def prefetch(self, accounts=None, assets=None):
+        """
+        Load accounts and assets for the lookups that follow.
+
+        :param list accounts: Account names or ids
+        :param list assets: Asset symbols or ids
+        :returns: Number of objects loaded
+
+        Account names, account ids and assets are loaded with batched
+        requests, the ``Account(...)`` and ``Asset(...)`` lookups that
+        follow are served from them for :attr:`prefetch_expiration`
+        seconds. Prefetched objects are kept by this instance rather than
+        in the shared object cache, which holds a limited number of
+        objects. Objects that are cached or prefetched already are not
+        requested again and unknown names are skipped.
+        """
+        names, ids, assets = self._uncached(accounts, assets)
+        objects = list(self._lookup_accounts(names + ids).values())
+        objects.extend(self._lookup("lookup_asset_symbols", assets).values())
+        return self._cache_objects(objects)
+
+    @staticmethod
+    def _split_accounts(accounts):
+        """Split account names and ids (sorted, without duplicates)."""
+        accounts = set(accounts)
+        names = sorted(a for a in accounts if not re.match(r"^1\.2\.[0-9]+$", a))
+        return names, sorted(accounts.difference(names))
+
+    def _uncached(self, accounts, assets):
+        """Split the objects to prefetch into account names, account ids
+        and assets that are neither cached nor prefetched."""
+
+        def missing(kind, cache, keys):
+            return [
+                key
+                for key in keys or []
+                if isinstance(key, str)
+                and key not in cache
+                and self.prefetched(kind, key) is None
+            ]
+
+        names, ids = self._split_accounts(missing("account", Account._cache, accounts))
+        return names, ids, sorted(set(missing("asset", Asset._cache, assets)))
+
+    #: Number of names or ids per lookup call
+    lookup_page_size = 100
+
+    def _lookup(self, method, keys):
+        """Look up objects with batched calls of an API ``method``.
+
+        :returns: the objects found, indexed by the given key
+        """
+        r = {}
+        for i in range(0, len(keys), self.lookup_page_size):
+            chunk = keys[i : i + self.lookup_page_size]
+            objects = getattr(self.rpc, method)(chunk)
+            r.update({key: obj for key, obj in zip(chunk, objects) if obj})
+        return r
+
+    def _lookup_accounts(self, accounts):
+        """Resolve many account names and ids with batched calls.
+
+        :returns: raw account objects indexed by the given name or id
+        """
+        names, ids = self._split_accounts(accounts)
+        r = self._lookup("get_objects", ids)
+        r.update(self._lookup("lookup_account_names", names))
+        return r
+
+    def _cache_objects(self, objects):
+        """Keep prefetched objects by id and name (or symbol)."""
+        now = time.monotonic()
+        # Drop the expired objects of earlier prefetches
+        self._prefetched = {
+            key: item
+            for key, item in (self._prefetched or {}).items()
+            if item[0] > now
+        }
+        expiration = now + self.prefetch_expiration
+        objects = [obj for obj in objects if obj]
+        for obj in objects:
+            if "symbol" in obj:
+                kind, key = "asset", obj["symbol"]
+            else:
+                kind, key = "account", obj["name"]
+            self._prefetched[(kind, obj["id"])] = (expiration, obj)
+            self._prefetched[(kind, key)] = (expiration, obj)
+        return len(objects)
+
+    def prefetched(self, kind, identifier):
+        """
+        Return a prefetched object.
+
+        :param str kind: ``account`` or ``asset``
+        :param str identifier: Name, symbol or id
+        :returns: The raw object, ``None`` if it has not been prefetched
+            or has expired
+        """
+        item = (self._prefetched or {}).get((kind, identifier))
+        if item and item[0] > time.monotonic():
+            return item[1]
+
+    # -------------------------------------------------------------------------
+    # Fees
+    # -------------------------------------------------------------------------
+    @property
+    def fee_schedule(self):
+        """
+        Fee schedule shared by everything that uses this instance.
+
+        :returns: Instance of :class:`tusc.fees.FeeSchedule`
+        """
+        if self._fee_schedule is None:
+            from .fees import FeeSchedule
+
+            self._fee_schedule = FeeSchedule(blockchain_instance=self)
+        return self._fee_schedule
+
+    # -------------------------------------------------------------------------
+    # Reference blocks
+    # -------------------------------------------------------------------------
+    @property
+    def tapos(self):
+        """
+        Reference block (TaPoS) parameters shared by the transaction
+        builders of this instance.
+
+        :returns: Instance of :class:`tusc.tapos.TaposCache`
+        """
+        if self._tapos is None:
+            from .tapos import TaposCache
+
+            self._tapos = TaposCache(blockchain_instance=self)
+        return self._tapos
+
+    # -------------------------------------------------------------------------
+    # Confirmations
+    # -------------------------------------------------------------------------
+    def confirmations(self, mode="irreversible"):
+        """
+        Tracker of the confirmations of broadcast transactions, shared by
+        everything that uses this instance.
+
+        :param str mode: ``head`` or ``irreversible``
+        :returns: Instance of :class:`tusc.confirmations.ConfirmationTracker`
+        """
+        if self._confirmation_trackers is None:
+            self._confirmation_trackers = {}
+        if mode not in self._confirmation_trackers:
+            from .confirmations import ConfirmationTracker
+
+            self._confirmation_trackers[mode] = ConfirmationTracker(
+                mode=mode, blockchain_instance=self
+            )
+        return self._confirmation_trackers[mode]
+
+    # -------------------------------------------------------------------------
+    # Parallel signing
+    # -------------------------------------------------------------------------
+    def sign_many(self, txs, pool=None):
+        """
+        Sign many transactions on a pool of processes.
+
+        :param list txs: Instances of
+            :class:`tusc.transactionbuilder.TransactionBuilder` with
+            operations and signers appended
+        :param tusc.signing.SigningPool pool: (optional) Pool to sign
+            with (a temporary pool is used otherwise)
+        :returns: The signed transaction builders, in order, ready to be
+            broadcast
+        """
+        from .signing import (
+            SigningPool,
+            builder_chain,
+            finish_builder,
+            prepare_builder,
+        )
+
+        for tx in txs:
+            tx.constructTx()
+        jobs = [prepare_builder(tx) for tx in txs]
+        chain = builder_chain(txs[0]) if txs else None
+        if pool is None:
+            with SigningPool() as pool:
+                pool.sign_each(jobs, chain=chain)
+        else:
+            pool.sign_each(jobs, chain=chain)
+        return [finish_builder(tx) for tx in txs]
+
     # -------------------------------------------------------------------------
     # Simple Transfer
     # -------------------------------------------------------------------------
@@ -165,6 +438,131 @@ class TUSC(AbstractGrapheneChain):
         )
         return self.finalizeOp(op, account, "active", **kwargs)
 
+    #: Bytes of a transaction besides its operations (TaPoS, expiration,
+    #: extensions and a signature)
+    transaction_overhead = len(
+        serialize_transaction(
+            {
+                "ref_block_num": 0,
+                "ref_block_prefix": 0,
+                "expiration": "1970-01-01T00:00:00",
+                "operations": [],
+                "signatures": ["00" * 65],
+            }
+        )
+    )
+
+    def transfer_many(self, transfers, account=None, max_size=None, **kwargs):
+        """
+        Send many transfers, packed into as few transactions as possible.
+
+        :param list transfers: Transfers as ``(to, amount, asset)`` or
+            ``(to, amount, asset, memo)`` tuples or as dicts with the keys
+            ``to``, ``amount``, ``asset`` and (optionally) ``memo``
+        :param str account: (optional) the source account for the transfers
+            if not ``default_account``
+        :param int max_size: (optional) Maximum size of a transaction in
+            bytes (defaults to the ``maximum_transaction_size`` chain
+            parameter)
+        :returns: One result per transfer, in order, with the keys
+            ``success``, ``error`` (message or ``None``) and
+            ``transaction`` (the broadcast result of the transaction the
+            transfer was part of)
+        :rtype: list
+
+        All recipients are resolved with batched ``lookup_account_names``
+        calls and memos are encrypted with cached shared secrets. A row
+        that cannot be resolved or encoded fails alone; a transaction
+        that fails to broadcast fails all of its rows.
+        """
+        from .memo import Memo
+
+        if not account:
+            if "default_account" in self.config:
+                account = self.config["default_account"]
+        if not account:
+            raise ValueError("You need to provide an account")
+        account = Account(account, blockchain_instance=self)
+
+        rows = []
+        for transfer in transfers:
+            if isinstance(transfer, dict):
+                rows.append(transfer)
+            else:
+                rows.append(dict(zip(["to", "amount", "asset", "memo"], transfer)))
+        recipients = self._lookup_accounts([str(row["to"]) for row in rows])
+        assets = {}
+        memo = Memo(from_account=account, blockchain_instance=self)
+
+        results = [
+            {"success": False, "error": None, "transaction": None} for row in rows
+        ]
+        ops = []
+        for i, row in enumerate(rows):
+            try:
+                to = recipients.get(str(row["to"]))
+                if not to:
+                    raise AccountDoesNotExistsException(row["to"])
+                if row["asset"] not in assets:
+                    assets[row["asset"]] = Asset(
+                        row["asset"], blockchain_instance=self
+                    )
+                amount = Amount(
+                    row["amount"], assets[row["asset"]], blockchain_instance=self
+                )
+                memo.to_account = Account(to, blockchain_instance=self)
+                op = operations.Transfer(
+                    **{
+                        "fee": {"amount": 0, "asset_id": "1.3.0"},
+                        "from": account["id"],
+                        "to": to["id"],
+                        "amount": {
+                            "amount": int(amount),
+                            "asset_id": amount.asset["id"],
+                        },
+                        "memo": memo.encrypt(row.get("memo")),
+                        "prefix": self.prefix,
+                    }
+                )
+            except Exception as e:
+                results[i]["error"] = str(e) or e.__class__.__name__
+                continue
+            ops.append((i, op))
+
+        if max_size is None:
+            self.fee_schedule.ensure()
+            max_size = self.fee_schedule.maximum_transaction_size or 2048
+        batch, size = [], self.transaction_overhead
+        for i, op in ops:
+            op_size = len(bytes(Operation(op)))
+            if batch and size + op_size > max_size:
+                self._broadcast_batch(batch, account, results)
+                batch, size = [], self.transaction_overhead
+            batch.append((i, op))
+            size += op_size
+        if batch:
+            self._broadcast_batch(batch, account, results)
+        return results
+
+    def _broadcast_batch(self, batch, account, results):
+        tx = self.transactionbuilder_class(blockchain_instance=self)
+        try:
+            tx.appendOps([op for _, op in batch])
+            if self.unsigned:
+                tx.addSigningInformation(account, "active")
+                ret = tx
+            else:
+                tx.appendSigner(account, "active")
+                tx.sign()
+                ret = tx.broadcast()
+        except Exception as e:
+            for i, _ in batch:
+                results[i]["error"] = str(e) or e.__class__.__name__
+            return
+        for i, _ in batch:
+            results[i]["success"] = True
+            results[i]["transaction"] = ret
+
     # -------------------------------------------------------------------------
     # Account related calls
     # -------------------------------------------------------------------------
@@ -264,11 +662,24 @@ class TUSC(AbstractGrapheneChain):
         except Exception:
             pass
 
+        # Resolve the other accounts with a single request
+        self.prefetch(
+            accounts=[
+                referrer,
+                registrar,
+                owner_account,
+                active_account,
+                proxy_account or "proxy-to-self",
+            ]
+            + additional_owner_accounts
+            + additional_active_accounts
+        )
+
         referrer = Account(referrer, blockchain_instance=self)
         registrar = Account(registrar, blockchain_instance=self)
 
         " Generate new keys from password"
-        from tuscbase.account import PasswordKey, PublicKey
+        from tuscbase.account import PasswordKey, public_key
 
         owner_key_authority = []
         active_key_authority = []
@@ -292,14 +703,14 @@ class TUSC(AbstractGrapheneChain):
             active_key_authority = [[format(active_pubkey, self.prefix), 1]]
             memo = format(memo_pubkey, self.prefix)
         elif owner_key and active_key and memo_key:
-            active_pubkey = PublicKey(active_key, prefix=self.prefix)
-            owner_pubkey = PublicKey(owner_key, prefix=self.prefix)
-            memo_pubkey = PublicKey(memo_key, prefix=self.prefix)
+            active_pubkey = public_key(active_key, prefix=self.prefix)
+            owner_pubkey = public_key(owner_key, prefix=self.prefix)
+            memo_pubkey = public_key(memo_key, prefix=self.prefix)
             owner_key_authority = [[format(owner_pubkey, self.prefix), 1]]
             active_key_authority = [[format(active_pubkey, self.prefix), 1]]
             memo = format(memo_pubkey, self.prefix)
         elif owner_account and active_account and memo_key:
-            memo_pubkey = PublicKey(memo_key, prefix=self.prefix)
+            memo_pubkey = public_key(memo_key, prefix=self.prefix)
             memo = format(memo_pubkey, self.prefix)
             owner_account = Account(owner_account, blockchain_instance=self)
             active_account = Account(active_account, blockchain_instance=self)
@@ -313,10 +724,10 @@ class TUSC(AbstractGrapheneChain):
 
         # additional authorities
         for k in additional_owner_keys:
-            PublicKey(k, prefix=self.prefix)
+            public_key(k, prefix=self.prefix)
             owner_key_authority.append([k, 1])
         for k in additional_active_keys:
-            PublicKey(k, prefix=self.prefix)
+            public_key(k, prefix=self.prefix)
             active_key_authority.append([k, 1])
         for k in additional_owner_accounts:
             addaccount = Account(k, blockchain_instance=self)
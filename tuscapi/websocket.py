@@ -34,6 +34,7 @@ class TUSCWebsocket(Events):
 
     * ``on_tx``
     * ``on_object``
+    * ``on_object_removed``
     * ``on_block``
     * ``on_account``
     * ``on_market``
@@ -65,6 +66,8 @@ class TUSCWebsocket(Events):
              'total_core_in_orders': '6788960277634',
              'total_ops': 505865}
 
+    * ``on_object_removed``: the id of a removed object, e.g. ``'1.8.2'``
+
     * ``on_block``:
 
         .. code-block:: js
@@ -94,7 +97,14 @@ class TUSCWebsocket(Events):
             ['1.7.68612']
     """
 
-    __events__ = ["on_tx", "on_object", "on_block", "on_account", "on_market"]
+    __events__ = [
+        "on_tx",
+        "on_object",
+        "on_block",
+        "on_account",
+        "on_market",
+        "on_object_removed",
+    ]
 
     def __init__(
         self,
@@ -110,6 +120,7 @@ class TUSCWebsocket(Events):
         on_block=None,
         on_account=None,
         on_market=None,
+        on_object_removed=None,
         keep_alive=25,
         num_retries=-1,
         **kwargs
@@ -143,6 +154,8 @@ class TUSCWebsocket(Events):
             self.on_tx += on_tx
         if on_object:
             self.on_object += on_object
+        if on_object_removed:
+            self.on_object_removed += on_object_removed
         if on_block:
             self.on_block += on_block
         if on_account:
@@ -181,7 +194,11 @@ class TUSCWebsocket(Events):
         # Subscribe to events on the Backend and give them a
         # callback number that allows us to identify the event
 
-        if len(self.on_object) or len(self.subscription_accounts):
+        if (
+            len(self.on_object)
+            or len(self.on_object_removed)
+            or len(self.subscription_accounts)
+        ):
             self.set_subscribe_callback(self.__events__.index("on_object"), False)
 
         if self.subscription_accounts and self.on_account:
@@ -229,6 +246,20 @@ class TUSCWebsocket(Events):
             # Treat account updates separately
             self.on_account(notice)
 
+    def process_removed(self, id):
+        """
+        This method is called on the ids of removed objects.
+
+        Here, we call the ``on_object_removed`` slots.
+        """
+        _a, _b, _ = id.split(".")
+
+        if (
+            id in self.subscription_objects
+            or ".".join([_a, _b, "x"]) in self.subscription_objects
+        ):
+            self.on_object_removed(id)
+
     def on_message(self, reply, *args, **kwargs):
         """
         This method is called by the websocket connection on every message that is
@@ -258,11 +289,15 @@ class TUSCWebsocket(Events):
                 # Let's see if a specific object has changed
                 for notice in data["params"][1]:
                     try:
-                        if "id" in notice:
+                        if isinstance(notice, str):
+                            self.process_removed(notice)
+                        elif "id" in notice:
                             self.process_notice(notice)
                         else:
                             for obj in notice:
-                                if "id" in obj:
+                                if isinstance(obj, str):
+                                    self.process_removed(obj)
+                                elif "id" in obj:
                                     self.process_notice(obj)
                     except Exception as e:
                         log.critical(f"Error in process_notice: {str(e)}\n\n{traceback.format_exc}")
@@ -3,11 +3,13 @@ __all__ = [
     "account",
     "bip38",
     "chains",
+    "ecdsa",
     "memo",
     "objects",
     "objecttypes",
     "operationids",
     "operations",
+    "serializer",
     "signedtransactions",
     "transactions",
 ]
@@ -3,6 +3,7 @@ import hashlib
 import sys
 
 from binascii import hexlify, unhexlify
+from functools import lru_cache
 
 from graphenebase.account import Address as GPHAddress
 from graphenebase.account import BrainKey as GPHBrainKey
@@ -82,10 +83,30 @@ class PublicKey(GPHPublicKey):
               method ``unCompressed`` can be used::
 
                   PublicKey("xxxxx").unCompressed()
+
+    The curve point and the address are computed once per instance. Use
+    :func:`public_key` to share parsed instances instead of decoding the
+    same string again.
     """
 
     prefix = default_prefix
 
+    _point = None
+    _address = None
+
+    def point(self):
+        """Return the point for the public key"""
+        if self._point is None:
+            self._point = super().point()
+        return self._point
+
+    @property
+    def address(self):
+        """Obtain a GrapheneAddress from a public key"""
+        if self._address is None or self._address.prefix != self.prefix:
+            self._address = super().address
+        return self._address
+
 
 class PrivateKey(GPHPrivateKey):
     """
@@ -109,6 +130,38 @@ class PrivateKey(GPHPrivateKey):
         Instance of ``PublicKey`` using uncompressed key.
     * ``PrivateKey("w-i-f").uncompressed.address``:
         Instance of ``Address`` using uncompressed key.
+
+    The public key is derived once per instance.
     """
 
     prefix = default_prefix
+
+    _compressed = None
+
+    @property
+    def compressed(self):
+        if self._compressed is None or self._compressed.prefix != self.prefix:
+            self._compressed = PublicKey.from_privkey(self, prefix=self.prefix)
+        return self._compressed
+
+
+@lru_cache(maxsize=4096)
+def _public_key(pk, prefix):
+    return PublicKey(pk, prefix=prefix)
+
+
+def public_key(pk, prefix=default_prefix):
+    """Parse a public key, sharing the instance with earlier calls.
+
+    :param str pk: Base58 encoded public key
+    :param str prefix: Network prefix (defaults to ``TUSC``)
+    :rtype: PublicKey
+
+    The most recently used keys are kept by string and prefix, so the same
+    key showing up in many operations or permissions is decoded (and its
+    point and address computed) only once. Returned instances are shared
+    and must not be modified.
+    """
+    if not isinstance(pk, str):
+        return PublicKey(pk, prefix=prefix)
+    return _public_key(pk, prefix)
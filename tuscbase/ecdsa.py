@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import logging
+import os
+import struct
+
+import ecdsa
+
+from ecdsa.ellipticcurve import INFINITY, PointJacobi
+from ecdsa.numbertheory import inverse_mod
+from ecdsa.rfc6979 import generate_k
+from graphenebase.ecdsa import _is_canonical
+
+from .account import PrivateKey
+
+log = logging.getLogger(__name__)
+
+curve = ecdsa.SECP256k1
+order = curve.order
+generator = curve.generator
+
+#: Environment variable that selects the backend
+backend_environment_variable = "TUSCBASE_ECDSA_BACKEND"
+
+
+def nonce_data(counter):
+    """Additional data of the deterministic (RFC6979) nonce of the
+    ``counter``-th attempt to find a canonical signature."""
+    return struct.pack("<I", counter) + b"\x00" * 28
+
+
+class PurePythonBackend:
+    """
+    Backend on top of the pure Python ``ecdsa`` package.
+
+    Nonces are derived as done by libsecp256k1 and signatures are
+    normalized to a low ``s``, so that both backends give identical
+    signatures. The recovery parameter is taken from the nonce point
+    instead of recovering up to four public keys.
+    """
+
+    name = "ecdsa"
+
+    @staticmethod
+    def available():
+        return True
+
+    def sign(self, digest, secret):
+        """Sign a digest, returns the 64 byte signature and the recovery
+        parameter."""
+        secexp = int.from_bytes(secret, "big")
+        e = int.from_bytes(digest, "big")
+        counter = 0
+        while True:
+            counter += 1
+            if not counter % 20:
+                log.info("Tried %d times to find a canonical signature", counter)
+            k = generate_k(
+                order, secexp, hashlib.sha256, digest, extra_entropy=nonce_data(counter)
+            )
+            point = generator * k
+            r = point.x() % order
+            s = inverse_mod(k, order) * (e + r * secexp) % order
+            if not r or not s:
+                continue
+            recid = (point.y() & 1) | (2 if point.x() >= order else 0)
+            if s > order // 2:
+                s = order - s
+                recid ^= 1
+            signature = r.to_bytes(32, "big") + s.to_bytes(32, "big")
+            if _is_canonical(signature):
+                return signature, recid
+
+    def recover(self, digest, signature, recid):
+        """Recover the compressed public key from a signature.
+
+        The signature is valid for the recovered key by construction.
+        """
+        r = int.from_bytes(signature[:32], "big")
+        s = int.from_bytes(signature[32:], "big")
+        if not (0 < r < order and 0 < s < order):
+            raise ValueError("Invalid signature")
+        p = curve.curve.p()
+        x = r + (recid // 2) * order
+        alpha = (pow(x, 3, p) + curve.curve.a() * x + curve.curve.b()) % p
+        beta = pow(alpha, (p + 1) // 4, p)
+        if x >= p or beta * beta % p != alpha:
+            raise ValueError("Invalid signature")
+        y = beta if beta % 2 == recid % 2 else p - beta
+        point = PointJacobi(curve.curve, x, y, 1, order)
+        rinv = inverse_mod(r, order)
+        e = int.from_bytes(digest, "big")
+        key = generator.mul_add(-e * rinv % order, point, s * rinv % order)
+        if key == INFINITY:
+            raise ValueError("Invalid signature")
+        return bytes([2 + (key.y() & 1)]) + key.x().to_bytes(32, "big")
+
+
+class Secp256k1Backend:
+    """
+    Backend on top of libsecp256k1 (``pip install secp256k1``).
+    """
+
+    name = "secp256k1"
+
+    def __init__(self):
+        import secp256k1
+
+        self.secp256k1 = secp256k1
+
+    @staticmethod
+    def available():
+        try:
+            import secp256k1  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def sign(self, digest, secret):
+        """Sign a digest, returns the 64 byte signature and the recovery
+        parameter."""
+        ffi, lib = self.secp256k1.ffi, self.secp256k1.lib
+        privkey = self.secp256k1.PrivateKey(secret, raw=True)
+        counter = 0
+        while True:
+            counter += 1
+            ndata = ffi.new("unsigned char[32]", nonce_data(counter))
+            sig = ffi.new("secp256k1_ecdsa_recoverable_signature *")
+            signed = lib.secp256k1_ecdsa_sign_recoverable(
+                self.secp256k1.secp256k1_ctx,
+                sig,
+                digest,
+                privkey.private_key,
+                ffi.NULL,
+                ndata,
+            )
+            if signed != 1:  # pragma: no cover
+                raise AssertionError()
+            signature, recid = privkey.ecdsa_recoverable_serialize(sig)
+            if _is_canonical(signature):
+                return signature, recid
+
+    def recover(self, digest, signature, recid):
+        """Recover the compressed public key from a signature."""
+        pub = self.secp256k1.PublicKey()
+        sig = pub.ecdsa_recoverable_deserialize(signature, recid)
+        key = self.secp256k1.PublicKey(pub.ecdsa_recover(digest, sig, raw=True))
+        return key.serialize(compressed=True)
+
+
+#: Backends by name, in order of preference
+backends = {
+    Secp256k1Backend.name: Secp256k1Backend,
+    PurePythonBackend.name: PurePythonBackend,
+}
+
+_backend = None
+
+
+def available_backends():
+    """Names of the backends that can be used."""
+    return [name for name, klass in backends.items() if klass.available()]
+
+
+def set_backend(name=None):
+    """Select the backend used to sign, verify and recover.
+
+    :param str name: Name of the backend (see :data:`backends`), defaults
+        to the ``TUSCBASE_ECDSA_BACKEND`` environment variable or the
+        fastest available backend
+    """
+    global _backend
+    name = name or os.environ.get(backend_environment_variable)
+    if name is None:
+        name = available_backends()[0]
+    if name not in backends:
+        raise ValueError("Unknown ecdsa backend %s" % name)
+    if not backends[name].available():
+        raise ValueError("The ecdsa backend %s is not installed" % name)
+    _backend = backends[name]()
+    log.debug("Using ecdsa backend: %s" % name)
+    return _backend
+
+
+def get_backend():
+    """Return the active backend, its ``name`` tells which one it is."""
+    if _backend is None:
+        return set_backend()
+    return _backend
+
+
+def sign_message(message, wif, hashfn=hashlib.sha256):
+    """Sign a message with a wif key
+
+    :param bytes message: Message
+    :param str wif: Private key
+    :returns: The compact signature (65 bytes)
+    """
+    if not isinstance(message, bytes):
+        message = bytes(message, "utf-8")
+    digest = hashfn(message).digest()
+    signature, recid = get_backend().sign(digest, bytes(PrivateKey(wif)))
+    # compressed (4) and compact (27)
+    return struct.pack("<B", recid + 4 + 27) + signature
+
+
+def verify_message(message, signature, hashfn=hashlib.sha256):
+    """Verify a compact signature of a message
+
+    :param bytes message: Message
+    :param bytes signature: Compact signature (65 bytes)
+    :returns: The compressed public key (33 bytes) that signed the message
+    """
+    if not isinstance(message, bytes):
+        message = bytes(message, "utf-8")
+    digest = hashfn(message).digest()
+    recid = bytearray(signature)[0] - 4 - 27
+    return get_backend().recover(digest, bytes(signature[1:]), recid)
@@ -1,2 +1,51 @@
 # -*- coding: utf-8 -*-
-from graphenebase.memo import get_shared_secret, encode_memo, decode_memo, _unpad, _pad
+import hashlib
+
+from binascii import hexlify, unhexlify
+
+from graphenebase.memo import (
+    get_shared_secret,
+    init_aes,
+    encode_memo,
+    decode_memo,
+    _unpad,
+    _pad,
+)
+
+
+def encode_memo_with_shared_secret(shared_secret, nonce, message):
+    """Encode a message like :func:`encode_memo` but with a shared secret
+    that has already been derived (see :func:`get_shared_secret`)
+
+    :param hex shared_secret: Shared secret between Alice and Bob
+    :param int nonce: Random nonce
+    :param str message: Memo message
+    :return: Encrypted message
+    :rtype: hex
+    """
+    aes = init_aes(shared_secret, nonce)
+    raw = bytes(message, "utf8")
+    checksum = hashlib.sha256(raw).digest()
+    raw = _pad(checksum[0:4] + raw, 16)
+    return hexlify(aes.encrypt(raw)).decode("ascii")
+
+
+def decode_memo_with_shared_secret(shared_secret, nonce, message):
+    """Decode a message like :func:`decode_memo` but with a shared secret
+    that has already been derived (see :func:`get_shared_secret`)
+
+    :param hex shared_secret: Shared secret between Alice and Bob
+    :param int nonce: Nonce used for Encryption
+    :param str message: Encrypted Memo message
+    :return: Decrypted message
+    :rtype: str
+    :raise ValueError: if the checksum does not match or the message
+           cannot be decoded as valid UTF-8 string
+    """
+    aes = init_aes(shared_secret, nonce)
+    cleartext = aes.decrypt(unhexlify(bytes(message, "ascii")))
+    checksum = cleartext[0:4]
+    raw = _unpad(cleartext[4:], 16)
+    if hashlib.sha256(raw).digest()[0:4] != checksum:
+        raise ValueError("checksum verification failure")
+    return raw.decode("utf8")
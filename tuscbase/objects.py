@@ -25,7 +25,7 @@ from graphenebase.types import (
     Ripemd160,
 )
 
-from .account import PublicKey
+from .account import PublicKey, public_key
 from .objecttypes import object_type
 from .operationids import operations
 
@@ -68,8 +68,8 @@ class Memo(GrapheneObject):
                 super().__init__(
                     OrderedDict(
                         [
-                            ("from", PublicKey(kwargs["from"], prefix=prefix)),
-                            ("to", PublicKey(kwargs["to"], prefix=prefix)),
+                            ("from", public_key(kwargs["from"], prefix=prefix)),
+                            ("to", public_key(kwargs["to"], prefix=prefix)),
                             ("nonce", Uint64(int(kwargs["nonce"]))),
                             ("message", Bytes(kwargs["message"])),
                         ]
@@ -129,7 +129,7 @@ class Permission(GrapheneObject):
                 kwargs = args[0]
             kwargs["key_auths"] = sorted(
                 kwargs["key_auths"],
-                key=lambda x: PublicKey(x[0], prefix=prefix),
+                key=lambda x: public_key(x[0], prefix=prefix),
                 reverse=False,
             )
             accountAuths = Map(
@@ -140,7 +140,7 @@ class Permission(GrapheneObject):
             )
             keyAuths = Map(
                 [
-                    [PublicKey(e[0], prefix=prefix), Uint16(e[1])]
+                    [public_key(e[0], prefix=prefix), Uint16(e[1])]
                     for e in kwargs["key_auths"]
                 ]
             )
@@ -175,7 +175,7 @@ class AccountOptions(GrapheneObject):
             super().__init__(
                 OrderedDict(
                     [
-                        ("memo_key", PublicKey(kwargs["memo_key"], prefix=prefix)),
+                        ("memo_key", public_key(kwargs["memo_key"], prefix=prefix)),
                         (
                             "voting_account",
                             ObjectId(kwargs["voting_account"], "account"),
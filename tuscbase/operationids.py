@@ -66,14 +66,13 @@ ops = [
     "liquidity_pool_withdraw",
     "liquidity_pool_exchange",
 ]
-operations = {o: ops.index(o) for o in ops}
+operations = {o: i for i, o in enumerate(ops)}
 
 
 def getOperationNameForId(i):
     """Convert an operation id into the corresponding string."""
-    for key in operations:
-        if int(operations[key]) is int(i):
-            return key
+    if 0 <= int(i) < len(ops):
+        return ops[int(i)]
     return "Unknown Operation ID %d" % i
 
 
@@ -27,7 +27,7 @@ from graphenebase.types import (
     Hash160,
 )
 
-from .account import PublicKey
+from .account import public_key
 from .objects import (
     AccountCreateExtensions,
     AccountOptions,
@@ -46,7 +46,7 @@ from .objects import (
     isArgsThisClass,
     AssertPredicate,
 )
-from .operationids import operations
+from .operationids import operations, ops
 
 
 default_prefix = "TUSC"
@@ -76,9 +76,8 @@ def getOperationIdForClass(name):
 
 def getOperationNameForId(i):
     """Convert an operation id into the corresponding string."""
-    for key in operations:
-        if int(operations[key]) is int(i):
-            return key
+    if 0 <= int(i) < len(ops):
+        return ops[int(i)]
     return "Unknown Operation ID %d" % i
 
 
@@ -352,14 +351,14 @@ class Proposal_update(GrapheneObject):
                         (
                             "key_approvals_to_add",
                             Array(
-                                [PublicKey(o) for o in kwargs["key_approvals_to_add"]]
+                                [public_key(o) for o in kwargs["key_approvals_to_add"]]
                             ),
                         ),
                         (
                             "key_approvals_to_remove",
                             Array(
                                 [
-                                    PublicKey(o)
+                                    public_key(o)
                                     for o in kwargs["key_approvals_to_remove"]
                                 ]
                             ),
@@ -683,7 +682,7 @@ class Witness_update(GrapheneObject):
                 new_url = Optional(None)
 
             if "new_signing_key" in kwargs and kwargs["new_signing_key"]:
-                new_signing_key = Optional(PublicKey(kwargs["new_signing_key"]))
+                new_signing_key = Optional(public_key(kwargs["new_signing_key"]))
             else:
                 new_signing_key = Optional(None)
 
@@ -918,7 +917,7 @@ class Balance_claim(GrapheneObject):
                 ("balance_to_claim", ObjectId(kwargs["balance_to_claim"], "balance")),
                 (
                     "balance_owner_key",
-                    PublicKey(kwargs["balance_owner_key"], prefix=prefix),
+                    public_key(kwargs["balance_owner_key"], prefix=prefix),
                 ),
                 ("total_claimed", Asset(kwargs["total_claimed"])),
             ]
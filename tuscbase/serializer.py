@@ -0,0 +1,1481 @@
+# -*- coding: utf-8 -*-
+import re
+import struct
+import time
+
+from binascii import hexlify, unhexlify
+from calendar import timegm
+from functools import lru_cache
+
+from graphenebase.base58 import Base58
+from graphenebase.objects import GrapheneObject
+from graphenebase.types import timeformat, varint
+from graphenebase.utils import unicodify
+
+from .account import PublicKey, public_key as parse_public_key
+from .objects import Operation
+from .objecttypes import object_type
+from .operationids import getOperationNameForId, operations, ops
+from .operations import ticket_type_strings
+
+default_prefix = "TUSC"
+
+
+class NotCompiled(Exception):
+    """The data is not covered by the schema, the operation class has to
+    serialize it."""
+
+    pass
+
+
+# -----------------------------------------------------------------------------
+# Types
+#
+# An encoder takes a (JSON) value and the prefix of public keys and returns
+# the wire format, as the corresponding ``graphenebase.types`` class does.
+# Its ``decode`` attribute takes a buffer, an offset and the prefix and
+# returns the (JSON) value and the offset following it. Encoders of fields
+# that may be left out carry ``optional = True``.
+# -----------------------------------------------------------------------------
+#: Decoded value of an optional field that is not set
+missing = object()
+
+
+def decoder(decode, optional=False):
+    """Attach ``decode`` to an encoder."""
+
+    def wrap(encode):
+        encode.decode = decode
+        if optional:
+            encode.optional = True
+        return encode
+
+    return wrap
+
+
+def read_varint(data, pos):
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _integer(fmt):
+    packer = struct.Struct(fmt)
+    pack = packer.pack
+
+    def decode(data, pos, prefix):
+        return packer.unpack_from(data, pos)[0], pos + packer.size
+
+    @decoder(decode)
+    def encode(value, prefix):
+        return pack(int(value))
+
+    return encode
+
+
+uint8 = _integer("<B")
+uint16 = _integer("<H")
+uint32 = _integer("<I")
+uint64 = _integer("<Q")
+int64 = _integer("<q")
+
+
+def _varint32(data, pos, prefix):
+    return read_varint(data, pos)
+
+
+@decoder(_varint32)
+def varint32(value, prefix):
+    return varint(int(value))
+
+
+def _boolean(data, pos, prefix):
+    return bool(data[pos]), pos + 1
+
+
+@decoder(_boolean)
+def boolean(value, prefix):
+    return b"\x01" if value else b"\x00"
+
+
+_escaped = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _string(data, pos, prefix):
+    length, pos = read_varint(data, pos)
+    return str(data[pos : pos + length], "utf-8"), pos + length
+
+
+@decoder(_string)
+def string(value, prefix):
+    if not value:
+        return b"\x00"
+    if _escaped.search(value):
+        data = unicodify(value)
+    else:
+        data = value.encode("utf-8")
+    return varint(len(data)) + data
+
+
+def _hexbytes(data, pos, prefix):
+    length, pos = read_varint(data, pos)
+    return hexlify(data[pos : pos + length]).decode("ascii"), pos + length
+
+
+@decoder(_hexbytes)
+def hexbytes(value, prefix):
+    data = unhexlify(value)
+    return varint(len(data)) + data
+
+
+def fixed_bytes(size):
+    """Hash or commitment of ``size`` bytes, given in hex."""
+
+    def decode(data, pos, prefix):
+        return hexlify(data[pos : pos + size]).decode("ascii"), pos + size
+
+    @decoder(decode)
+    def encode(value, prefix):
+        return unhexlify(value)
+
+    return encode
+
+
+ripemd160 = fixed_bytes(20)
+sha256 = fixed_bytes(32)
+commitment = fixed_bytes(33)
+
+
+@lru_cache(maxsize=1024)
+def _point_in_time(value):
+    return struct.pack("<I", timegm(time.strptime(value + "UTC", timeformat)))
+
+
+@lru_cache(maxsize=1024)
+def _format_time(timestamp):
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(timestamp))
+
+
+def _read_point_in_time(data, pos, prefix):
+    return _format_time(struct.unpack_from("<I", data, pos)[0]), pos + 4
+
+
+@decoder(_read_point_in_time)
+def point_in_time(value, prefix):
+    return _point_in_time(value)
+
+
+def _public_key(value, prefix):
+    return bytes(parse_public_key(value, prefix))
+
+
+@lru_cache(maxsize=4096)
+def _format_public_key(data, prefix):
+    return format(PublicKey(hexlify(data).decode("ascii"), prefix=prefix), prefix)
+
+
+def _read_public_key(data, pos, prefix):
+    return _format_public_key(bytes(data[pos : pos + 33]), prefix), pos + 33
+
+
+@decoder(_read_public_key)
+def public_key(value, prefix):
+    return _public_key(value, prefix)
+
+
+def _address(data, pos, prefix):
+    address = Base58(hexlify(data[pos : pos + 20]).decode("ascii"), prefix=prefix)
+    return format(address, prefix), pos + 20
+
+
+@decoder(_address)
+def address(value, prefix):
+    raise NotCompiled
+
+
+def _vote_id(data, pos, prefix):
+    vote = struct.unpack_from("<I", data, pos)[0]
+    return "%d:%d" % (vote & 0xFF, vote >> 8), pos + 4
+
+
+@decoder(_vote_id)
+def vote_id(value, prefix):
+    type, instance = value.split(":")
+    return struct.pack("<I", (int(type) & 0xFF) | (int(instance) << 8))
+
+
+def object_id(type_name, space=1):
+    """Object id of the given type, serialized as its instance."""
+    expected = object_type[type_name] if isinstance(type_name, str) else type_name
+    template = "%d.%d.%%d" % (space, expected)
+
+    def decode(data, pos, prefix):
+        instance, pos = read_varint(data, pos)
+        return template % instance, pos
+
+    @decoder(decode)
+    def encode(value, prefix):
+        space, type, instance = value.split(".")
+        if int(type) != expected:
+            raise ValueError(
+                "Object id %s does not match object type %s" % (value, type_name)
+            )
+        return varint(int(instance))
+
+    return encode
+
+
+def _full_object_id(data, pos, prefix):
+    id = struct.unpack_from("<Q", data, pos)[0]
+    return "%d.%d.%d" % (id >> 56, (id >> 48) & 0xFF, id & (2 ** 48 - 1)), pos + 8
+
+
+@decoder(_full_object_id)
+def full_object_id(value, prefix):
+    space, type, instance = [int(x) for x in value.split(".")]
+    return struct.pack("<Q", (space << 56) | (type << 48) | instance)
+
+
+def optional(encoder):
+    """Flag and value, left out if missing or empty."""
+
+    def decode(data, pos, prefix):
+        if not data[pos]:
+            return missing, pos + 1
+        return encoder.decode(data, pos + 1, prefix)
+
+    @decoder(decode, optional=True)
+    def encode(value, prefix):
+        if value is None or (not value and not isinstance(value, int)):
+            return b"\x00"
+        data = encoder(value, prefix)
+        return b"\x01" + data if data else b"\x00"
+
+    return encode
+
+
+def array(encoder, key=None):
+    """Array of values, sorted by ``key`` if given."""
+    read = encoder.decode
+
+    def decode(data, pos, prefix):
+        length, pos = read_varint(data, pos)
+        values = []
+        for _ in range(length):
+            value, pos = read(data, pos, prefix)
+            values.append(value)
+        return values, pos
+
+    @decoder(decode)
+    def encode(value, prefix):
+        if key:
+            value = sorted(value, key=key)
+        return varint(len(value)) + b"".join([encoder(v, prefix) for v in value])
+
+    return encode
+
+
+def pairs(key, value):
+    """Map serialized as array of ``[key, value]`` pairs."""
+    return array(struct_tuple(key, value))
+
+
+def struct_tuple(*encoders):
+    """Fixed number of values, given as list."""
+
+    def decode(data, pos, prefix):
+        values = []
+        for encoder in encoders:
+            value, pos = encoder.decode(data, pos, prefix)
+            values.append(value)
+        return values, pos
+
+    @decoder(decode)
+    def encode(value, prefix):
+        return b"".join([encoder(v, prefix) for encoder, v in zip(encoders, value)])
+
+    return encode
+
+
+def static_variant(*encoders):
+    """``[type id, value]`` pairs."""
+
+    def decode(data, pos, prefix):
+        type_id, pos = read_varint(data, pos)
+        if type_id >= len(encoders):
+            raise ValueError("Unknown type %d of static variant" % type_id)
+        value, pos = encoders[type_id].decode(data, pos, prefix)
+        return [type_id, value], pos
+
+    @decoder(decode)
+    def encode(value, prefix):
+        type_id, data = value
+        return varint(type_id) + encoders[type_id](data, prefix)
+
+    return encode
+
+
+def flat_set(encoder, key=None):
+    """Array of unique values, sorted by ``key`` (or the values)."""
+    return array(encoder, key=key or (lambda value: value))
+
+
+def lazy(get):
+    """Encoder returned by ``get()``, for recursive types."""
+
+    def decode(data, pos, prefix):
+        return get().decode(data, pos, prefix)
+
+    @decoder(decode)
+    def encode(value, prefix):
+        return get()(value, prefix)
+
+    return encode
+
+
+def default_empty(encoder):
+    """Array that may be left out."""
+
+    @decoder(encoder.decode, optional=True)
+    def encode(value, prefix):
+        return encoder(value or [], prefix)
+
+    return encode
+
+
+def _extensions(data, pos, prefix):
+    length, pos = read_varint(data, pos)
+    values = []
+    for _ in range(length):
+        type_id, pos = read_varint(data, pos)
+        if type_id:
+            raise ValueError("Unknown type %d of extension" % type_id)
+        values.append([type_id, {}])
+    return values, pos
+
+
+@decoder(_extensions, optional=True)
+def extensions(value, prefix):
+    """Future extensions (a set of empty static variants, always empty in
+    practice)."""
+    if not value:
+        return b"\x00"
+    return varint(len(value)) + b"".join([varint(type_id) for type_id, _ in value])
+
+
+def struct_(*fields):
+    """Object with the given ``(name, encoder)`` fields in wire order."""
+    fields = [
+        (name, encoder, getattr(encoder, "optional", False))
+        for name, encoder in fields
+    ]
+    readers = [(name, encoder.decode) for name, encoder, _ in fields]
+
+    def decode(data, pos, prefix):
+        obj = {}
+        for name, read in readers:
+            value, pos = read(data, pos, prefix)
+            if value is not missing:
+                obj[name] = value
+        return obj, pos
+
+    @decoder(decode)
+    def encode(value, prefix):
+        return b"".join(
+            [
+                encoder(value.get(name) if optional else value[name], prefix)
+                for name, encoder, optional in fields
+            ]
+        )
+
+    return encode
+
+
+def extension_set(*fields):
+    """Extension with the given ``(name, encoder)`` fields, serialized as
+    the number of fields that are set followed by the index and value of
+    each."""
+
+    def decode(data, pos, prefix):
+        length, pos = read_varint(data, pos)
+        obj = {}
+        for _ in range(length):
+            index, pos = read_varint(data, pos)
+            if index >= len(fields):
+                raise ValueError("Unknown field %d of extension" % index)
+            name, encoder = fields[index]
+            obj[name], pos = encoder.decode(data, pos, prefix)
+        return obj, pos
+
+    @decoder(decode, optional=True)
+    def encode(value, prefix):
+        value = value or {}
+        data = [
+            varint(index) + encoder(value[name], prefix)
+            for index, (name, encoder) in enumerate(fields)
+            if value.get(name) is not None
+        ]
+        return varint(len(data)) + b"".join(data)
+
+    return encode
+
+
+# -----------------------------------------------------------------------------
+# Objects
+# -----------------------------------------------------------------------------
+def _instance(value):
+    return int(value.split(".")[2])
+
+
+account = object_id("account")
+asset_id = object_id("asset")
+asset = struct_(("amount", int64), ("asset_id", asset_id))
+price = struct_(("base", asset), ("quote", asset))
+price_feed = struct_(
+    ("settlement_price", price),
+    ("maintenance_collateral_ratio", uint16),
+    ("maximum_short_squeeze_ratio", uint16),
+    ("core_exchange_rate", price),
+)
+
+_memo = struct_(
+    ("from", public_key),
+    ("to", public_key),
+    ("nonce", uint64),
+    ("message", hexbytes),
+)
+
+
+@decoder(_memo.decode)
+def memo(value, prefix):
+    if not isinstance(value, dict):
+        return bytes(value) if value else b""
+    if not value.get("message"):
+        return b""
+    return _memo(value, value.get("prefix", prefix))
+
+
+def _permission(data, pos, prefix):
+    obj = {}
+    obj["weight_threshold"], pos = uint32.decode(data, pos, prefix)
+    obj["account_auths"], pos = pairs(account, uint16).decode(data, pos, prefix)
+    obj["key_auths"], pos = pairs(public_key, uint16).decode(data, pos, prefix)
+    obj["address_auths"], pos = pairs(address, uint16).decode(data, pos, prefix)
+    return obj, pos
+
+
+@decoder(_permission)
+def permission(value, prefix):
+    if value.get("address_auths"):
+        raise NotCompiled
+    key_auths = sorted(
+        [(parse_public_key(key, prefix), weight) for key, weight in value["key_auths"]],
+        key=lambda auth: auth[0],
+    )
+    return b"".join(
+        [
+            uint32(value["weight_threshold"], prefix),
+            varint(len(value["account_auths"])),
+            b"".join(
+                [
+                    account(id, prefix) + uint16(weight, prefix)
+                    for id, weight in value["account_auths"]
+                ]
+            ),
+            varint(len(key_auths)),
+            b"".join(
+                [bytes(key) + uint16(weight, prefix) for key, weight in key_auths]
+            ),
+            b"\x00",
+        ]
+    )
+
+
+_vote_ids = array(vote_id)
+
+
+@decoder(_vote_ids.decode)
+def _votes(value, prefix):
+    votes = sorted(set(value), key=lambda x: float(x.split(":")[1]))
+    return _vote_ids(votes, prefix)
+
+
+account_options = struct_(
+    ("memo_key", public_key),
+    ("voting_account", account),
+    ("num_witness", uint16),
+    ("num_committee", uint16),
+    ("votes", _votes),
+    ("extensions", extensions),
+)
+
+asset_options = struct_(
+    ("max_supply", int64),
+    ("market_fee_percent", uint16),
+    ("max_market_fee", int64),
+    ("issuer_permissions", uint16),
+    ("flags", uint16),
+    ("core_exchange_rate", price),
+    ("whitelist_authorities", array(account)),
+    ("blacklist_authorities", array(account)),
+    ("whitelist_markets", array(asset_id)),
+    ("blacklist_markets", array(asset_id)),
+    ("description", string),
+    (
+        "extensions",
+        extension_set(
+            ("reward_percent", uint16),
+            ("whitelist_market_fee_sharing", flat_set(account, key=_instance)),
+            ("taker_fee_percent", uint16),
+        ),
+    ),
+)
+
+bitasset_options = struct_(
+    ("feed_lifetime_sec", uint32),
+    ("minimum_feeds", uint8),
+    ("force_settlement_delay_sec", uint32),
+    ("force_settlement_offset_percent", uint16),
+    ("maximum_force_settlement_volume", uint16),
+    ("short_backing_asset", asset_id),
+    (
+        "extensions",
+        extension_set(
+            ("initial_collateral_ratio", uint16),
+            ("maintenance_collateral_ratio", uint16),
+            ("maximum_short_squeeze_ratio", uint16),
+            ("margin_call_fee_ratio", uint16),
+            ("force_settle_fee_percent", uint16),
+        ),
+    ),
+)
+
+special_authority = static_variant(
+    struct_(), struct_(("asset", asset_id), ("num_top_holders", uint8))
+)
+
+account_create_extensions = extension_set(
+    ("null_ext", struct_()),
+    ("owner_special_authority", special_authority),
+    ("active_special_authority", special_authority),
+    (
+        "buyback_options",
+        struct_(
+            ("asset_to_buy", asset_id),
+            ("asset_to_buy_issuer", account),
+            ("markets", array(asset_id)),
+        ),
+    ),
+)
+
+
+@decoder(extension_set(("target_collateral_ratio", uint16)).decode)
+def call_order_extensions(value, prefix):
+    if isinstance(value, dict) and value.get("target_collateral_ratio"):
+        return b"\x01\x00" + uint16(value["target_collateral_ratio"], prefix)
+    return b"\x00"
+
+
+def _ticket_type(data, pos, prefix):
+    value, pos = read_varint(data, pos)
+    if value < len(ticket_type_strings):
+        return ticket_type_strings[value], pos
+    return value, pos
+
+
+@decoder(_ticket_type)
+def ticket_type(value, prefix):
+    if isinstance(value, int):
+        return varint(value)
+    return varint(ticket_type_strings.index(value))
+
+
+def _proposed_operation(data, pos, prefix):
+    op, pos = read_operation(data, pos, prefix)
+    return {"op": op}, pos
+
+
+@decoder(_proposed_operation)
+def proposed_operation(value, prefix):
+    return serialize_operation(value["op"], prefix)
+
+
+_asset_update = struct_(
+    ("fee", asset),
+    ("issuer", account),
+    ("asset_to_update", asset_id),
+    ("new_issuer", optional(account)),
+    ("new_options", asset_options),
+    (
+        "extensions",
+        extension_set(("new_precision", uint8), ("skip_core_exchange_rate", boolean)),
+    ),
+)
+
+
+@decoder(_asset_update.decode)
+def asset_update(value, prefix):
+    if "new_issuer" in value:
+        # Rejected by the operation class
+        raise NotCompiled
+    return _asset_update(value, prefix)
+
+
+htlc_hash = static_variant(ripemd160, fixed_bytes(20), sha256, ripemd160)
+
+stealth_confirmation = struct_(
+    ("one_time_key", public_key),
+    ("to", optional(public_key)),
+    ("encrypted_memo", hexbytes),
+)
+
+blind_input = struct_(("commitment", commitment), ("owner", permission))
+
+blind_output = struct_(
+    ("commitment", commitment),
+    ("range_proof", hexbytes),
+    ("owner", permission),
+    ("stealth_memo", optional(stealth_confirmation)),
+)
+
+account_update_extensions = extension_set(
+    ("null_ext", struct_()),
+    ("owner_special_authority", special_authority),
+    ("active_special_authority", special_authority),
+    ("update_last_voting_time", boolean),
+)
+
+#: Objects that restrictions of custom authorities may refer to
+restriction_objects = [
+    "account",
+    "asset",
+    "force_settlement",
+    "committee_member",
+    "witness",
+    "limit_order",
+    "call_order",
+    "custom",
+    "proposal",
+    "withdraw_permission",
+    "vesting_balance",
+    "worker",
+    "balance",
+]
+
+_restrictions = array(lazy(lambda: restriction))
+
+restriction_argument = static_variant(
+    struct_(),
+    boolean,
+    int64,
+    string,
+    point_in_time,
+    public_key,
+    sha256,
+    *[object_id(name) for name in restriction_objects],
+    flat_set(boolean),
+    flat_set(int64),
+    flat_set(string),
+    flat_set(point_in_time),
+    array(public_key),
+    flat_set(sha256),
+    *[flat_set(object_id(name), key=_instance) for name in restriction_objects],
+    _restrictions,
+    array(_restrictions),
+    struct_tuple(int64, _restrictions),
+)
+
+restriction = struct_(
+    ("member_index", varint32),
+    ("restriction_type", varint32),
+    ("argument", restriction_argument),
+    ("extensions", extensions),
+)
+
+_fee = ("fee", uint64)
+_price_per_kbyte = ("price_per_kbyte", uint32)
+
+#: Fee parameters of the operations that differ from a flat ``fee``
+fee_parameter_schemas = {
+    "transfer": [_fee, _price_per_kbyte],
+    "fill_order": [],
+    "account_create": [
+        ("basic_fee", uint64),
+        ("premium_fee", uint64),
+        _price_per_kbyte,
+    ],
+    "account_update": [_fee, _price_per_kbyte],
+    "account_upgrade": [
+        ("membership_annual_fee", uint64),
+        ("membership_lifetime_fee", uint64),
+    ],
+    "asset_create": [
+        ("symbol3", uint64),
+        ("symbol4", uint64),
+        ("long_symbol", uint64),
+        _price_per_kbyte,
+    ],
+    "asset_update": [_fee, _price_per_kbyte],
+    "asset_issue": [_fee, _price_per_kbyte],
+    "proposal_create": [_fee, _price_per_kbyte],
+    "proposal_update": [_fee, _price_per_kbyte],
+    "withdraw_permission_claim": [_fee, _price_per_kbyte],
+    "custom": [_fee, _price_per_kbyte],
+    "balance_claim": [],
+    "override_transfer": [_fee, _price_per_kbyte],
+    "transfer_to_blind": [_fee, ("price_per_output", uint32)],
+    "blind_transfer": [_fee, ("price_per_output", uint32)],
+    "asset_settle_cancel": [],
+    "fba_distribute": [],
+    "execute_bid": [],
+    "htlc_create": [_fee, ("fee_per_day", uint64)],
+    "htlc_redeem": [_fee, ("fee_per_kb", uint64)],
+    "htlc_redeemed": [],
+    "htlc_extend": [_fee, ("fee_per_day", uint64)],
+    "htlc_refund": [],
+    "custom_authority_create_operation": [
+        ("basic_fee", uint64),
+        ("price_per_byte", uint32),
+    ],
+    "custom_authority_update_operation": [
+        ("basic_fee", uint64),
+        ("price_per_byte", uint32),
+    ],
+}
+
+fee_schedule = struct_(
+    (
+        "parameters",
+        flat_set(
+            static_variant(
+                *[struct_(*fee_parameter_schemas.get(name, [_fee])) for name in ops]
+            ),
+            key=lambda parameters: parameters[0],
+        ),
+    ),
+    ("scale", uint32),
+)
+
+chain_parameters = struct_(
+    ("current_fees", fee_schedule),
+    ("block_interval", uint8),
+    ("maintenance_interval", uint32),
+    ("maintenance_skip_slots", uint8),
+    ("committee_proposal_review_period", uint32),
+    ("maximum_transaction_size", uint32),
+    ("maximum_block_size", uint32),
+    ("maximum_time_until_expiration", uint32),
+    ("maximum_proposal_lifetime", uint32),
+    ("maximum_asset_whitelist_authorities", uint8),
+    ("maximum_asset_feed_publishers", uint8),
+    ("maximum_witness_count", uint16),
+    ("maximum_committee_count", uint16),
+    ("maximum_authority_membership", uint16),
+    ("reserve_percent_of_fee", uint16),
+    ("network_percent_of_fee", uint16),
+    ("lifetime_referrer_percent_of_fee", uint16),
+    ("cashback_vesting_period_seconds", uint32),
+    ("cashback_vesting_threshold", int64),
+    ("count_non_member_votes", boolean),
+    ("allow_non_member_whitelists", boolean),
+    ("witness_pay_per_block", int64),
+    ("witness_pay_vesting_seconds", uint32),
+    ("worker_budget_per_day", int64),
+    ("max_predicate_opcode", uint16),
+    ("fee_liquidation_threshold", int64),
+    ("accounts_per_fee_scale", uint16),
+    ("account_fee_scale_bitshifts", uint8),
+    ("max_authority_depth", uint8),
+    (
+        "extensions",
+        extension_set(
+            (
+                "updatable_htlc_options",
+                struct_(("max_timeout_secs", uint32), ("max_preimage_size", uint32)),
+            ),
+            (
+                "custom_authority_options",
+                struct_(
+                    ("max_custom_authority_lifetime_seconds", uint32),
+                    ("max_custom_authorities_per_account", uint32),
+                    ("max_custom_authorities_per_account_op", uint32),
+                    ("max_custom_authority_restrictions", uint32),
+                ),
+            ),
+            ("market_fee_network_percent", uint16),
+            ("maker_fee_discount_percent", uint16),
+        ),
+    ),
+)
+
+
+# -----------------------------------------------------------------------------
+# Operations
+# -----------------------------------------------------------------------------
+#: Field schemas of the operations, in wire order
+schemas = {
+    "transfer": [
+        ("fee", asset),
+        ("from", account),
+        ("to", account),
+        ("amount", asset),
+        ("memo", optional(memo)),
+        ("extensions", extensions),
+    ],
+    "limit_order_create": [
+        ("fee", asset),
+        ("seller", account),
+        ("amount_to_sell", asset),
+        ("min_to_receive", asset),
+        ("expiration", point_in_time),
+        ("fill_or_kill", boolean),
+        ("extensions", extensions),
+    ],
+    "limit_order_cancel": [
+        ("fee", asset),
+        ("fee_paying_account", account),
+        ("order", object_id("limit_order")),
+        ("extensions", extensions),
+    ],
+    "call_order_update": [
+        ("fee", asset),
+        ("funding_account", account),
+        ("delta_collateral", asset),
+        ("delta_debt", asset),
+        ("extensions", call_order_extensions),
+    ],
+    "fill_order": [
+        ("fee", asset),
+        ("order_id", full_object_id),
+        ("account_id", account),
+        ("pays", asset),
+        ("receives", asset),
+        ("fill_price", price),
+        ("is_maker", boolean),
+    ],
+    "account_create": [
+        ("fee", asset),
+        ("registrar", account),
+        ("referrer", account),
+        ("referrer_percent", uint16),
+        ("name", string),
+        ("owner", permission),
+        ("active", permission),
+        ("options", account_options),
+        ("extensions", account_create_extensions),
+    ],
+    "account_update": [
+        ("fee", asset),
+        ("account", account),
+        ("owner", optional(permission)),
+        ("active", optional(permission)),
+        ("new_options", optional(account_options)),
+        ("extensions", account_update_extensions),
+    ],
+    "account_whitelist": [
+        ("fee", asset),
+        ("authorizing_account", account),
+        ("account_to_list", account),
+        ("new_listing", uint8),
+        ("extensions", extensions),
+    ],
+    "account_upgrade": [
+        ("fee", asset),
+        ("account_to_upgrade", account),
+        ("upgrade_to_lifetime_member", boolean),
+        ("extensions", extensions),
+    ],
+    "account_transfer": [
+        ("fee", asset),
+        ("account_id", account),
+        ("new_owner", account),
+        ("extensions", extensions),
+    ],
+    "asset_create": [
+        ("fee", asset),
+        ("issuer", account),
+        ("symbol", string),
+        ("precision", uint8),
+        ("common_options", asset_options),
+        ("bitasset_opts", optional(bitasset_options)),
+        ("is_prediction_market", boolean),
+        ("extensions", extensions),
+    ],
+    "asset_update_bitasset": [
+        ("fee", asset),
+        ("issuer", account),
+        ("asset_to_update", asset_id),
+        ("new_options", bitasset_options),
+        ("extensions", extensions),
+    ],
+    "asset_update_feed_producers": [
+        ("fee", asset),
+        ("issuer", account),
+        ("asset_to_update", asset_id),
+        (
+            "new_feed_producers",
+            array(account, key=lambda x: float(x.split(".")[2])),
+        ),
+        ("extensions", extensions),
+    ],
+    "asset_issue": [
+        ("fee", asset),
+        ("issuer", account),
+        ("asset_to_issue", asset),
+        ("issue_to_account", account),
+        ("memo", optional(memo)),
+        ("extensions", extensions),
+    ],
+    "asset_reserve": [
+        ("fee", asset),
+        ("payer", account),
+        ("amount_to_reserve", asset),
+        ("extensions", extensions),
+    ],
+    "asset_fund_fee_pool": [
+        ("fee", asset),
+        ("from_account", account),
+        ("asset_id", asset_id),
+        ("amount", int64),
+        ("extensions", extensions),
+    ],
+    "asset_settle": [
+        ("fee", asset),
+        ("account", account),
+        ("amount", asset),
+        ("extensions", extensions),
+    ],
+    "asset_global_settle": [
+        ("fee", asset),
+        ("issuer", account),
+        ("asset_to_settle", asset_id),
+        ("settle_price", price),
+        ("extensions", extensions),
+    ],
+    "asset_publish_feed": [
+        ("fee", asset),
+        ("publisher", account),
+        ("asset_id", asset_id),
+        ("feed", price_feed),
+        ("extensions", extension_set(("initial_collateral_ratio", uint16))),
+    ],
+    "witness_create": [
+        ("fee", asset),
+        ("witness_account", account),
+        ("url", string),
+        ("block_signing_key", public_key),
+    ],
+    "witness_update": [
+        ("fee", asset),
+        ("witness", object_id("witness")),
+        ("witness_account", account),
+        ("new_url", optional(string)),
+        ("new_signing_key", optional(public_key)),
+    ],
+    "proposal_create": [
+        ("fee", asset),
+        ("fee_paying_account", account),
+        ("expiration_time", point_in_time),
+        ("proposed_ops", array(proposed_operation)),
+        ("review_period_seconds", optional(uint32)),
+        ("extensions", extensions),
+    ],
+    "proposal_update": [
+        ("fee", asset),
+        ("fee_paying_account", account),
+        ("proposal", object_id("proposal")),
+        ("active_approvals_to_add", default_empty(array(account))),
+        ("active_approvals_to_remove", default_empty(array(account))),
+        ("owner_approvals_to_add", default_empty(array(account))),
+        ("owner_approvals_to_remove", default_empty(array(account))),
+        ("key_approvals_to_add", default_empty(array(public_key))),
+        ("key_approvals_to_remove", default_empty(array(public_key))),
+        ("extensions", extensions),
+    ],
+    "proposal_delete": [
+        ("fee", asset),
+        ("fee_paying_account", account),
+        ("using_owner_authority", boolean),
+        ("proposal", object_id("proposal")),
+        ("extensions", extensions),
+    ],
+    "withdraw_permission_create": [
+        ("fee", asset),
+        ("withdraw_from_account", account),
+        ("authorized_account", account),
+        ("withdrawal_limit", asset),
+        ("withdrawal_period_sec", uint32),
+        ("periods_until_expiration", uint32),
+        ("period_start_time", point_in_time),
+    ],
+    "withdraw_permission_update": [
+        ("fee", asset),
+        ("withdraw_from_account", account),
+        ("authorized_account", account),
+        ("permission_to_update", object_id("withdraw_permission")),
+        ("withdrawal_limit", asset),
+        ("withdrawal_period_sec", uint32),
+        ("period_start_time", point_in_time),
+        ("periods_until_expiration", uint32),
+    ],
+    "withdraw_permission_claim": [
+        ("fee", asset),
+        ("withdraw_permission", object_id("withdraw_permission")),
+        ("withdraw_from_account", account),
+        ("withdraw_to_account", account),
+        ("amount_to_withdraw", asset),
+        ("memo", optional(memo)),
+    ],
+    "withdraw_permission_delete": [
+        ("fee", asset),
+        ("withdraw_from_account", account),
+        ("authorized_account", account),
+        ("withdrawal_permission", object_id("withdraw_permission")),
+    ],
+    "committee_member_create": [
+        ("fee", asset),
+        ("committee_member_account", account),
+        ("url", string),
+    ],
+    "committee_member_update": [
+        ("fee", asset),
+        ("committee_member", object_id("committee_member")),
+        ("committee_member_account", account),
+        ("new_url", optional(string)),
+    ],
+    "committee_member_update_global_parameters": [
+        ("fee", asset),
+        ("new_parameters", chain_parameters),
+    ],
+    "vesting_balance_create": [
+        ("fee", asset),
+        ("creator", account),
+        ("owner", account),
+        ("amount", asset),
+        (
+            "policy",
+            static_variant(
+                struct_(
+                    ("begin_timestamp", point_in_time),
+                    ("vesting_cliff_seconds", uint32),
+                    ("vesting_duration_seconds", uint32),
+                ),
+                struct_(("start_claim", point_in_time), ("vesting_seconds", uint32)),
+                struct_(),
+            ),
+        ),
+    ],
+    "vesting_balance_withdraw": [
+        ("fee", asset),
+        ("vesting_balance", object_id("vesting_balance")),
+        ("owner", account),
+        ("amount", asset),
+    ],
+    "worker_create": [
+        ("fee", asset),
+        ("owner", account),
+        ("work_begin_date", point_in_time),
+        ("work_end_date", point_in_time),
+        ("daily_pay", uint64),
+        ("name", string),
+        ("url", string),
+        (
+            "initializer",
+            static_variant(
+                struct_(),
+                struct_(("pay_vesting_period_days", uint16)),
+                struct_(),
+            ),
+        ),
+    ],
+    "custom": [
+        ("fee", asset),
+        ("payer", account),
+        ("required_auths", array(account)),
+        ("id", uint16),
+        ("data", hexbytes),
+    ],
+    "assert": [
+        ("fee", asset),
+        ("fee_paying_account", account),
+        (
+            "predicates",
+            array(
+                static_variant(
+                    struct_(("account_id", account), ("name", string)),
+                    struct_(("asset_id", asset_id), ("symbol", string)),
+                    struct_(("id", ripemd160)),
+                )
+            ),
+        ),
+        ("required_auths", array(account)),
+        ("extensions", extensions),
+    ],
+    "balance_claim": [
+        ("fee", asset),
+        ("deposit_to_account", account),
+        ("balance_to_claim", object_id("balance")),
+        ("balance_owner_key", public_key),
+        ("total_claimed", asset),
+    ],
+    "override_transfer": [
+        ("fee", asset),
+        ("issuer", account),
+        ("from", account),
+        ("to", account),
+        ("amount", asset),
+        ("memo", optional(memo)),
+        ("extensions", extensions),
+    ],
+    "transfer_to_blind": [
+        ("fee", asset),
+        ("amount", asset),
+        ("from", account),
+        ("blinding_factor", sha256),
+        ("outputs", array(blind_output)),
+    ],
+    "blind_transfer": [
+        ("fee", asset),
+        ("inputs", array(blind_input)),
+        ("outputs", array(blind_output)),
+    ],
+    "transfer_from_blind": [
+        ("fee", asset),
+        ("amount", asset),
+        ("to", account),
+        ("blinding_factor", sha256),
+        ("inputs", array(blind_input)),
+    ],
+    "asset_settle_cancel": [
+        ("fee", asset),
+        ("settlement", object_id("force_settlement")),
+        ("account", account),
+        ("amount", asset),
+        ("extensions", extensions),
+    ],
+    "asset_claim_fees": [
+        ("fee", asset),
+        ("issuer", account),
+        ("amount_to_claim", asset),
+        ("extensions", extension_set(("claim_from_asset_id", asset_id))),
+    ],
+    "fba_distribute": [
+        ("fee", asset),
+        ("account_id", account),
+        ("fba_id", object_id(16, space=2)),
+        ("amount", int64),
+    ],
+    "bid_collateral": [
+        ("fee", asset),
+        ("bidder", account),
+        ("additional_collateral", asset),
+        ("debt_covered", asset),
+        ("extensions", extensions),
+    ],
+    "execute_bid": [
+        ("fee", asset),
+        ("bidder", account),
+        ("debt", asset),
+        ("collateral", asset),
+    ],
+    "asset_claim_pool": [
+        ("fee", asset),
+        ("issuer", account),
+        ("asset_id", asset_id),
+        ("amount_to_claim", asset),
+        ("extensions", extensions),
+    ],
+    "asset_update_issuer": [
+        ("fee", asset),
+        ("issuer", account),
+        ("asset_to_update", asset_id),
+        ("new_issuer", account),
+        ("extensions", extensions),
+    ],
+    "htlc_create": [
+        ("fee", asset),
+        ("from", account),
+        ("to", account),
+        ("amount", asset),
+        ("preimage_hash", htlc_hash),
+        ("preimage_size", uint16),
+        ("claim_period_seconds", uint32),
+        ("extensions", extension_set(("memo", memo))),
+    ],
+    "htlc_redeem": [
+        ("fee", asset),
+        ("htlc_id", object_id("htlc")),
+        ("redeemer", account),
+        ("preimage", hexbytes),
+        ("extensions", extensions),
+    ],
+    "htlc_redeemed": [
+        ("fee", asset),
+        ("htlc_id", object_id("htlc")),
+        ("from", account),
+        ("to", account),
+        ("redeemer", account),
+        ("amount", asset),
+        ("htlc_preimage_hash", htlc_hash),
+        ("htlc_preimage_size", uint16),
+    ],
+    "htlc_extend": [
+        ("fee", asset),
+        ("htlc_id", object_id("htlc")),
+        ("update_issuer", account),
+        ("seconds_to_add", uint32),
+        ("extensions", extensions),
+    ],
+    "htlc_refund": [
+        ("fee", asset),
+        ("htlc_id", object_id("htlc")),
+        ("to", account),
+        ("original_htlc_recipient", account),
+        ("htlc_preimage_hash", htlc_hash),
+        ("htlc_preimage_size", uint16),
+    ],
+    "custom_authority_create_operation": [
+        ("fee", asset),
+        ("account", account),
+        ("enabled", boolean),
+        ("valid_from", point_in_time),
+        ("valid_to", point_in_time),
+        ("operation_type", varint32),
+        ("auth", permission),
+        ("restrictions", _restrictions),
+        ("extensions", extensions),
+    ],
+    "custom_authority_update_operation": [
+        ("fee", asset),
+        ("account", account),
+        ("authority_to_update", object_id("custom_authority")),
+        ("new_enabled", optional(boolean)),
+        ("new_valid_from", optional(point_in_time)),
+        ("new_valid_to", optional(point_in_time)),
+        ("new_auth", optional(permission)),
+        ("restrictions_to_remove", flat_set(uint16)),
+        ("restrictions_to_add", _restrictions),
+        ("extensions", extensions),
+    ],
+    "custom_authority_delete_operation": [
+        ("fee", asset),
+        ("account", account),
+        ("authority_to_delete", object_id("custom_authority")),
+        ("extensions", extensions),
+    ],
+    "ticket_create_operation": [
+        ("fee", asset),
+        ("account", account),
+        ("target_type", ticket_type),
+        ("amount", asset),
+        ("extensions", extensions),
+    ],
+    "ticket_update_operation": [
+        ("fee", asset),
+        ("ticket", object_id("ticket")),
+        ("account", account),
+        ("target_type", ticket_type),
+        ("amount_for_new_target", optional(asset)),
+        ("extensions", extensions),
+    ],
+    "liquidity_pool_create": [
+        ("fee", asset),
+        ("account", account),
+        ("asset_a", asset_id),
+        ("asset_b", asset_id),
+        ("share_asset", asset_id),
+        ("taker_fee_percent", uint16),
+        ("withdrawal_fee_percent", uint16),
+        ("extensions", extensions),
+    ],
+    "liquidity_pool_delete": [
+        ("fee", asset),
+        ("account", account),
+        ("pool", object_id("liquidity_pool")),
+        ("extensions", extensions),
+    ],
+    "liquidity_pool_deposit": [
+        ("fee", asset),
+        ("account", account),
+        ("pool", object_id("liquidity_pool")),
+        ("amount_a", asset),
+        ("amount_b", asset),
+        ("extensions", extensions),
+    ],
+    "liquidity_pool_withdraw": [
+        ("fee", asset),
+        ("account", account),
+        ("pool", object_id("liquidity_pool")),
+        ("share_amount", asset),
+        ("extensions", extensions),
+    ],
+    "liquidity_pool_exchange": [
+        ("fee", asset),
+        ("account", account),
+        ("pool", object_id("liquidity_pool")),
+        ("amount_to_sell", asset),
+        ("min_to_receive", asset),
+        ("extensions", extensions),
+    ],
+}
+
+#: Compiled encoders by operation id
+compiled = {operations[name]: struct_(*fields) for name, fields in schemas.items()}
+compiled[operations["asset_update"]] = asset_update
+
+
+def serialize_operation(op, prefix=default_prefix):
+    """Serialize an operation into its wire format.
+
+    :param op: ``[id or name, data]`` with the data as plain dict (e.g. as
+        returned by the API) or a :class:`tuscbase.objects.Operation`
+    :param str prefix: Prefix of the public keys (unless the data has a
+        ``prefix``)
+    :returns: The same bytes as ``bytes(Operation(op))``
+
+    Operations without a schema, or data that is not covered by it, are
+    serialized by the operation classes.
+    """
+    if isinstance(op, Operation):
+        return bytes(op)
+    op_id, data = op
+    if isinstance(op_id, str):
+        op_id = operations[op_id]
+    encoder = compiled.get(op_id)
+    if encoder and isinstance(data, dict) and not isinstance(data, GrapheneObject):
+        try:
+            return varint(op_id) + encoder(data, data.get("prefix", prefix))
+        except NotCompiled:
+            pass
+    if isinstance(data, dict) and "prefix" not in data:
+        data = dict(data, prefix=prefix)
+    return bytes(Operation([op_id, data]))
+
+
+def serialize_transaction(tx, prefix=default_prefix, signatures=True):
+    """Serialize a transaction into its wire format.
+
+    :param dict tx: Transaction as plain dict (e.g. ``tx.json()``)
+    :param str prefix: Prefix of the public keys
+    :param bool signatures: Include the signatures. Without, the bytes
+        that are signed (following the chain id) are returned.
+    """
+    data = [
+        uint16(tx["ref_block_num"], prefix),
+        uint32(tx["ref_block_prefix"], prefix),
+        point_in_time(tx["expiration"], prefix),
+        varint(len(tx["operations"])),
+    ]
+    data.extend([serialize_operation(op, prefix) for op in tx["operations"]])
+    data.append(b"\x00")
+    if signatures:
+        sigs = tx.get("signatures", [])
+        data.append(varint(len(sigs)))
+        data.extend([unhexlify(sig) for sig in sigs])
+    return b"".join(data)
+
+
+# -----------------------------------------------------------------------------
+# Deserialization
+# -----------------------------------------------------------------------------
+#: Decoders by operation id
+decoders = {op_id: encoder.decode for op_id, encoder in compiled.items()}
+
+
+def read_operation(data, pos=0, prefix=default_prefix):
+    """Decode the operation at ``pos``, returns ``[id, data]`` and the
+    offset following it."""
+    op_id, pos = read_varint(data, pos)
+    decode = decoders.get(op_id)
+    if decode is None:
+        raise ValueError("Unknown operation %d" % op_id)
+    value, pos = decode(data, pos, prefix)
+    return [op_id, value], pos
+
+
+_signatures = array(fixed_bytes(65)).decode
+
+
+def read_transaction(data, pos=0, prefix=default_prefix, signatures=True):
+    """Decode the transaction at ``pos``, returns the transaction and the
+    offset following it.
+
+    :param data: Buffer (``bytes``, ``memoryview`` or ``mmap``)
+    :param int pos: Offset of the transaction in the buffer
+    :param str prefix: Prefix of the public keys
+    :param bool signatures: Whether the transaction is followed by its
+        signatures (as opposed to the bytes that are signed)
+    """
+    tx = {}
+    tx["ref_block_num"], pos = uint16.decode(data, pos, prefix)
+    tx["ref_block_prefix"], pos = uint32.decode(data, pos, prefix)
+    tx["expiration"], pos = point_in_time.decode(data, pos, prefix)
+    count, pos = read_varint(data, pos)
+    ops = tx["operations"] = []
+    for _ in range(count):
+        op, pos = read_operation(data, pos, prefix)
+        ops.append(op)
+    tx["extensions"], pos = extensions.decode(data, pos, prefix)
+    if signatures:
+        tx["signatures"], pos = _signatures(data, pos, prefix)
+    return tx, pos
+
+
+def deserialize_operation(data, prefix=default_prefix):
+    """Decode an operation from its wire format.
+
+    :param bytes data: Serialized operation (including its id)
+    :param str prefix: Prefix of the public keys
+    :returns: ``[id, data]`` as given to :func:`serialize_operation`
+    """
+    op, pos = read_operation(data, 0, prefix)
+    if pos != len(data):
+        raise ValueError("%d trailing bytes" % (len(data) - pos))
+    return op
+
+
+def deserialize_transaction(data, prefix=default_prefix, signatures=True):
+    """Decode a signed transaction from its wire format.
+
+    :param bytes data: Serialized transaction
+    :param str prefix: Prefix of the public keys
+    :param bool signatures: Whether the signatures are included
+    :returns: The transaction as returned by ``Signed_Transaction.json()``
+    """
+    tx, pos = read_transaction(data, 0, prefix, signatures)
+    if pos != len(data):
+        raise ValueError("%d trailing bytes" % (len(data) - pos))
+    return tx
+
+
+def iter_transactions(data, prefix=default_prefix, offset=0, end=None):
+    """Decode the signed transactions that follow each other in a buffer.
+
+    :param data: Buffer (``bytes``, ``memoryview`` or ``mmap``)
+    :param str prefix: Prefix of the public keys
+    :param int offset: Offset of the first transaction
+    :param int end: Offset following the last transaction (defaults to
+        the end of the buffer)
+
+    The buffer is not copied, so files of any size can be streamed by
+    mapping them into memory:
+
+    .. code-block:: python
+
+        import mmap
+
+        with open("transactions.bin", "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for tx in iter_transactions(data):
+                    ...
+    """
+    if end is None:
+        end = len(data)
+    while offset < end:
+        tx, offset = read_transaction(data, offset, prefix)
+        yield tx
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
+from binascii import hexlify
+
+from graphenebase.account import PublicKey
 from graphenebase.signedtransactions import (
+    MissingSignatureForKey,
     Signed_Transaction as GrapheneSigned_Transaction,
 )
+from graphenebase.types import Array, Signature
 
 from .chains import known_chains
+from .ecdsa import sign_message, verify_message
 from .operations import Operation
 
 
@@ -15,8 +21,51 @@ class Signed_Transaction(GrapheneSigned_Transaction):
     :param num refPrefix: parameter ref_block_prefix (see ``getBlockParams``)
     :param str expiration: expiration date
     :param Array operations:  array of operations
+
+    Signatures are created and verified by the active backend of
+    :mod:`tuscbase.ecdsa`.
     """
 
     known_chains = known_chains
     default_prefix = "TUSC"
     operation_klass = Operation
+
+    def verify(self, pubkeys=[], chain=None):
+        if not chain:
+            chain = self.get_default_prefix()
+
+        chain_params = self.getChainParams(chain)
+        self.deriveDigest(chain)
+        pubKeysFound = [
+            hexlify(verify_message(self.message, bytes(signature))).decode("ascii")
+            for signature in self.data["signatures"].data
+        ]
+
+        for pubkey in pubkeys:
+            if not isinstance(pubkey, PublicKey):
+                raise ValueError("Pubkeys must be array of 'PublicKey'")
+            if repr(pubkey) not in pubKeysFound:
+                f = format(pubkey, chain_params["prefix"])
+                raise MissingSignatureForKey("Signature for %s missing!" % f)
+        return pubKeysFound
+
+    def sign(self, wifkeys, chain=None):
+        """Sign the transaction with the provided private keys.
+
+        :param array wifkeys: Array of wif keys
+        :param str chain: identifier for the chain
+        """
+        if not chain:
+            chain = self.get_default_prefix()
+        self.deriveDigest(chain)
+
+        # Get Unique private keys
+        self.privkeys = []
+        for item in wifkeys:
+            if item not in self.privkeys:
+                self.privkeys.append(item)
+
+        self.data["signatures"] = Array(
+            [Signature(sign_message(self.message, wif)) for wif in self.privkeys]
+        )
+        return self